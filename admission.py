@@ -0,0 +1,222 @@
+"""
+Contrôle d'admission des analyses et des appels au LLM, commun à tout le processus.
+
+Toutes les sessions Streamlit partagent le même processus et les mêmes clés
+d'API. Sans limite, un atelier de quarante enseignants lance quarante analyses
+à la fois : les clés répondent 429 et presque toutes les analyses échouent. Le
+contrôle d'admission borne donc :
+
+- les analyses simultanées (ControleurAdmission) : les suivantes attendent
+  dans une file par utilisateur, servies à tour de rôle (chaque utilisateur
+  avance d'une analyse par tour, dans l'ordre de soumission) ; la position
+  dans la file et l'attente estimée d'après la durée moyenne des analyses
+  récentes sont affichées par app.py ;
+- les appels simultanés sur chaque clé d'API (appel_llm), y compris ceux
+  faits hors du gestionnaire d'analyses (récapitulatif de secours, analyses en
+  lot).
+"""
+
+import asyncio
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Appels simultanés par clé d'API (une clé par étape du pipeline, voir PedagogicalAgent.models)
+APPELS_PAR_CLE = int(os.getenv("APPELS_LLM_PAR_CLE", 2))
+
+# Durée supposée d'une analyse tant qu'aucune n'est terminée (secondes)
+DUREE_ANALYSE_INITIALE = 60.0
+
+# Poids de la dernière analyse dans la durée moyenne
+POIDS_DUREE = 0.2
+
+
+class ControleurAdmission:
+    """
+    File d'attente équitable des analyses.
+
+    Chaque utilisateur a sa propre file FIFO ; les utilisateurs sont servis à
+    tour de rôle, dans l'ordre où ils ont rejoint la file. Le contrôleur ne
+    lance rien lui-même : l'exécutant qui se libère demande la suivante.
+    """
+
+    def __init__(self, max_analyses: int, duree_initiale: float = DUREE_ANALYSE_INITIALE):
+        self.max_analyses = max_analyses
+        self._files: "OrderedDict[str, Deque[str]]" = OrderedDict()
+        self._en_cours = 0
+        self._admises = 0
+        self._duree_moyenne = duree_initiale
+        self._verrou = threading.Lock()
+
+    def ajouter(self, utilisateur: str, identifiant: str):
+        """
+        Place une analyse en fin de la file de son utilisateur.
+
+        Args:
+            utilisateur (str): Identifiant de l'utilisateur (session Streamlit)
+            identifiant (str): Identifiant de l'analyse
+        """
+        with self._verrou:
+            self._files.setdefault(utilisateur, deque()).append(identifiant)
+
+    def suivante(self) -> Optional[str]:
+        """
+        Admet l'analyse suivante : la plus ancienne du prochain utilisateur servi.
+
+        Returns:
+            str | None: Identifiant de l'analyse, None si la file est vide
+        """
+        with self._verrou:
+            if not self._files:
+                return None
+            utilisateur, file = next(iter(self._files.items()))
+            identifiant = file.popleft()
+            # L'utilisateur repasse en fin de tour, ou quitte la file s'il n'a plus rien en attente
+            if file:
+                self._files.move_to_end(utilisateur)
+            else:
+                del self._files[utilisateur]
+            self._en_cours += 1
+            self._admises += 1
+            return identifiant
+
+    def terminer(self, duree: Optional[float] = None):
+        """
+        Libère la place d'une analyse admise.
+
+        Args:
+            duree (float): Durée de l'analyse réussie (secondes) ; None pour un échec, sans effet sur la moyenne
+        """
+        with self._verrou:
+            self._en_cours -= 1
+            if duree is not None:
+                self._duree_moyenne += POIDS_DUREE * (duree - self._duree_moyenne)
+
+    def position(self, identifiant: str) -> Optional[int]:
+        """
+        Rang d'une analyse dans l'ordre d'admission.
+
+        Args:
+            identifiant (str): Identifiant de l'analyse
+
+        Returns:
+            int | None: 1 pour la prochaine analyse admise, None si l'analyse n'est plus en attente
+        """
+        with self._verrou:
+            files = list(self._files.values())
+            rang = 0
+            for tour in range(max((len(file) for file in files), default=0)):
+                for file in files:
+                    if tour < len(file):
+                        rang += 1
+                        if file[tour] == identifiant:
+                            return rang
+        return None
+
+    def attente_estimee(self, position: int) -> float:
+        """
+        Attente estimée avant l'admission d'une analyse.
+
+        Args:
+            position (int): Rang renvoyé par position
+
+        Returns:
+            float: Attente en secondes, d'après la durée moyenne des dernières analyses
+        """
+        with self._verrou:
+            return math.ceil(position / self.max_analyses) * self._duree_moyenne
+
+    def etat(self, identifiant: str) -> Optional[Tuple[int, float]]:
+        """
+        Position et attente estimée d'une analyse en attente.
+
+        Args:
+            identifiant (str): Identifiant de l'analyse
+
+        Returns:
+            tuple | None: (position, attente estimée en secondes), None si l'analyse n'est plus en attente
+        """
+        position = self.position(identifiant)
+        if position is None:
+            return None
+        return position, self.attente_estimee(position)
+
+    def metriques(self) -> Dict:
+        """
+        Returns:
+            dict: Analyses en cours et en attente, utilisateurs en attente, analyses admises, durée moyenne (secondes)
+        """
+        with self._verrou:
+            return {
+                "en_cours": self._en_cours,
+                "en_attente": sum(len(file) for file in self._files.values()),
+                "utilisateurs": len(self._files),
+                "admises": self._admises,
+                "duree_moyenne": self._duree_moyenne,
+            }
+
+
+_places_appels: Dict[str, threading.BoundedSemaphore] = {}
+_verrou_appels = threading.Lock()
+
+
+def _places(cle: str) -> threading.BoundedSemaphore:
+    with _verrou_appels:
+        return _places_appels.setdefault(cle, threading.BoundedSemaphore(APPELS_PAR_CLE))
+
+
+@contextmanager
+def appel_llm(cle: str):
+    """
+    Réserve une place d'appel sur une clé d'API, en bloquant le thread jusqu'à ce qu'une place se libère.
+
+    Args:
+        cle (str): Clé d'API, désignée par l'étape à laquelle elle est attribuée ('classification', 'synthese', …)
+    """
+    places = _places(cle)
+    debut = time.perf_counter()
+    places.acquire()
+    _journaliser_attente(cle, time.perf_counter() - debut)
+    try:
+        yield
+    finally:
+        places.release()
+
+
+@asynccontextmanager
+async def appel_llm_async(cle: str):
+    """
+    Variante de appel_llm pour une boucle d'événements : l'attente ne bloque pas la boucle.
+
+    Args:
+        cle (str): Clé d'API (voir appel_llm)
+    """
+    places = _places(cle)
+    debut = time.perf_counter()
+    # Attente par scrutation plutôt que dans un thread : une tâche annulée ne garde pas de place
+    while not places.acquire(blocking=False):
+        await asyncio.sleep(0.05)
+    _journaliser_attente(cle, time.perf_counter() - debut)
+    try:
+        yield
+    finally:
+        places.release()
+
+
+def _journaliser_attente(cle: str, attente: float):
+    if attente >= 1:
+        logger.info(f"Appel au LLM sur la clé '{cle}' retardé de {attente:.1f} s (limite de {APPELS_PAR_CLE} appels)")
+
+
+def formater_attente(secondes: float) -> str:
+    """Attente estimée en clair : « moins d'une minute », « environ 3 min »."""
+    minutes = round(secondes / 60)
+    return "moins d'une minute" if minutes < 1 else f"environ {minutes} min"
+
@@ -9,12 +9,20 @@ st.set_page_config(
 )
 
 
-from features3 import assistant_pedagogique, recapitulatif
-from pretraitement_obj_spe import nettoyer_objectifs_specifiques
-from generation_pdf import generer_pdf, llm_output_to_dict
+from dotenv import load_dotenv
+
+# Variables d'environnement chargées avant les modules qui lisent leur configuration à l'import
+load_dotenv()
+
+# Modules légers seulement avant le formulaire : pipeline et génération des documents
+# sont importés en arrière-plan par le préchauffage (voir prechauffage.py)
+from taches_analyse import EN_ATTENTE, ECHEC, TERMINEE, file_attente, obtenir_tache, soumettre_analyse
+from admission import formater_attente
+from prechauffage import lancer_prechauffage
 from style_loader import load_css
 from log_config import setup_logging
 import logging
+import uuid
 
 # Configurer le logging dès le début de l'application
 setup_logging()
@@ -74,45 +82,66 @@ with st.form("formulaire_objectifs"):
     
     soumis = st.form_submit_button("Analyser", use_container_width=True)
 
+# Formulaire affiché : imports lourds, polices et pool de rendu préparés pendant la saisie
+lancer_prechauffage()
+
 if soumis:
     st.success("✅ Formulaire envoyé avec succès !")
     
-    # Nettoyage et transformation des objectifs spécifiques en liste
-    objectifs_specifiques = nettoyer_objectifs_specifiques(objectif_general, objectifs_specifiques_brut)
+    # Analyse confiée au gestionnaire de tâches : seul son identifiant est gardé dans la session,
+    # les réexécutions suivantes du script ne relancent pas le pipeline
+    # La session tient lieu d'utilisateur pour la file d'attente équitable (voir admission.py)
+    utilisateur = st.session_state.setdefault("id_utilisateur", uuid.uuid4().hex)
+    st.session_state["tache_analyse"] = soumettre_analyse(dict(
+        nom_cours=nom_cours, niveau=niveau, public=public, objectif_general=objectif_general,
+        objectifs_specifiques_brut=objectifs_specifiques_brut
+    ), utilisateur)
+    st.session_state.pop("resultat_analyse", None)
     st.info("✅ Données valides, lancement de l'analyse...")
-    
 
-    try:
-        # Appel du pipeline principal
-        rapport = assistant_pedagogique(nom_cours, niveau, public, objectif_general, objectifs_specifiques)
-    
-        if rapport is None:
-            st.warning("L’analyse a été interrompue avant son terme. Veuillez réessayer.")
-            st.stop()
-        
-        st.success("Analyse terminée avec succès !")
-    except Exception as e:
-        st.error(f"Une erreur est survenue pendant l'analyse. Veuillez réessayer.")
-        logger.warning(f"Une erreur est survenue pendant l'analyse. : {str(e)}")
-        st.stop()
-
-
-    # Récapitulatif
-    recap_dict = {}
-    try:
-        recap = recapitulatif(rapport['details'])
-        logger.info("Récapitulatif fait !")
-    except Exception as e:
-        st.error(f"Un problème est survenu pendant le récapitulatif de l'analyse. Veuillez réessayer.")
-        logger.warning(f"Le récapitulatif a échoué : {str(e)}")
-
-    try:
-        recap_dict = llm_output_to_dict(recap)
-        logger.info("Conversion du récapitulatif faite.")
-    except Exception as e:
-        st.error(f"Une erreur est survenue pendant le récapitulatif de l'analyse. Veuillez réessayer.")
-        logger.warning(f"La conversion du récapitulatif a échouée : {str(e)}")
 
+@st.fragment(run_every=1)
+def suivre_analyse(id_tache):
+    """Étapes terminées de l'analyse en cours, rafraîchies chaque seconde ; page relancée à la fin de l'analyse."""
+    tache = obtenir_tache(id_tache)
+    if tache is not None and not tache.terminee:
+        attente = file_attente(id_tache) if tache.statut == EN_ATTENTE else None
+        if attente is not None:
+            position, secondes = attente
+            st.info(f"⏳ Analyse en file d'attente : position {position}, démarrage estimé dans {formater_attente(secondes)}.")
+        elif tache.statut == EN_ATTENTE:
+            st.info("⏳ Analyse en attente de démarrage...")
+        for etape in list(tache.etapes):
+            st.info(f" {etape}...")
+        return
+    st.rerun()
+
+
+id_tache = st.session_state.get("tache_analyse")
+if id_tache is not None and "resultat_analyse" not in st.session_state:
+    tache = obtenir_tache(id_tache)
+    if tache is None:
+        st.warning("L’analyse n'est plus disponible. Veuillez la relancer.")
+        del st.session_state["tache_analyse"]
+    elif tache.statut == TERMINEE:
+        # Résultat conservé dans la session : il reste affiché quoi que fasse ensuite l'utilisateur
+        st.session_state["resultat_analyse"] = tache.resultat
+    elif tache.statut == ECHEC:
+        st.error("Une erreur est survenue pendant l'analyse. Veuillez réessayer.")
+        del st.session_state["tache_analyse"]
+    else:
+        suivre_analyse(id_tache)
+
+resultat = st.session_state.get("resultat_analyse")
+if resultat is not None:
+    st.success("Analyse terminée avec succès !")
+    nom_cours, niveau, public = resultat.saisie["nom_cours"], resultat.saisie["niveau"], resultat.saisie["public"]
+    rapport, recap_dict = resultat.rapport, resultat.recap_dict
+    
+    # Déjà importés par le préchauffage dans le cas général
+    from generation_pdf import DonneesRapport
+    from export_rapport import rapport_html, rapport_json
+    from rendu_pdf import lancer_rendu, obtenir_pdf
 
     st.markdown("---")
     
@@ -260,14 +289,34 @@ if soumis:
     
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
-        # Génération de PDF temporaire
-        chemin_pdf = generer_pdf(nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut, rapport, recap_dict)
-        with open(chemin_pdf, "rb") as f:
+        # PDF rendu en arrière-plan dès maintenant, remis au bouton seulement au clic
+        donnees_pdf = resultat.donnees_rapport()
+        lancer_rendu(donnees_pdf)
+        nom_fichier = f"rapport_analyse_objectifs_{nom_cours.replace(' ', '_').lower()}"
+        st.download_button(
+            "📄 Télécharger le rapport PDF", 
+            lambda: obtenir_pdf(donnees_pdf), 
+            file_name=f"{nom_fichier}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+
+        # Exports légers (quelques millisecondes), pour coller les résultats dans un LMS
+        col_html, col_json = st.columns(2)
+        with col_html:
+            st.download_button(
+                "🌐 HTML",
+                lambda: rapport_html(DonneesRapport(**donnees_pdf)),
+                file_name=f"{nom_fichier}.html",
+                mime="text/html",
+                use_container_width=True
+            )
+        with col_json:
             st.download_button(
-                "📄 Télécharger le rapport PDF", 
-                f, 
-                file_name=f"rapport_analyse_objectifs_{nom_cours.replace(' ', '_').lower()}.pdf",
-                mime="application/pdf",
+                "🧾 JSON",
+                lambda: rapport_json(DonneesRapport(**donnees_pdf)),
+                file_name=f"{nom_fichier}.json",
+                mime="application/json",
                 use_container_width=True
             )
     
@@ -0,0 +1,308 @@
+"""
+Archive locale des analyses, pour rendre de nouveau un rapport sans nouvel appel au LLM.
+
+Chaque analyse terminée est enregistrée dans un fichier JSON compressé (gzip) :
+saisie du formulaire, objectifs nettoyés, sorties de chaque étape du pipeline,
+rapport, récapitulatif, mesures des appels au LLM (version de prompt, tokens,
+durée) et durée totale. Le format porte un numéro de version ; un fichier d'une
+version plus récente que celle du code est refusé.
+
+Les fichiers sont rangés par date et nommés d'après l'horodatage et
+l'empreinte de la saisie :
+
+    <dossier>/<AAAA>/<MM>/<AAAA-MM-JJ>T<HHMMSS>_<empreinte>.json.gz
+
+Les recherches par date ou par empreinte se font donc sur les chemins, sans
+ouvrir les fichiers. Le dossier est fixé par la variable d'environnement
+ARCHIVE_ANALYSES.
+
+Rendu en masse d'une archive (un fichier par analyse, pool de processus) :
+
+    python archive_analyses.py <dossier_sortie> [--format pdf|html|json] [--depuis AAAA-MM-JJ]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from export_rapport import rapport_html, rapport_json
+from generation_pdf import DonneesRapport, rendre_rapport
+from polices_pdf import precharger_polices
+from pretraitement_obj_spe import Objectif
+
+logger = logging.getLogger(__name__)
+
+# Version du format des fichiers d'archive
+VERSION_ARCHIVE = 1
+
+DOSSIER_ARCHIVE = os.getenv("ARCHIVE_ANALYSES", "archives_analyses")
+
+EXTENSION = ".json.gz"
+
+# Caractères de l'empreinte gardés dans le nom de fichier
+LONGUEUR_EMPREINTE = 16
+
+# Champs du formulaire qui identifient une analyse
+CHAMPS_SAISIE = ("nom_cours", "niveau", "public", "objectif_general", "objectifs_specifiques_brut")
+
+
+@dataclass
+class AnalyseArchivee:
+    """Contenu d'un fichier d'archive."""
+    date: str  # horodatage ISO de l'analyse
+    saisie: Dict[str, str]  # champs de CHAMPS_SAISIE
+    rapport: Dict[str, str]  # sortie du pipeline, sans sa trace
+    recap_dict: Dict
+    objectifs: List[Dict] = field(default_factory=list)  # objectif général puis spécifiques (asdict d'Objectif)
+    etapes: Dict = field(default_factory=dict)  # sorties des étapes (features3.SORTIES_ETAPES)
+    mesures_prompts: List[Dict] = field(default_factory=list)
+    erreurs: List[str] = field(default_factory=list)
+    duree: Optional[float] = None  # durée totale de l'analyse (secondes)
+    version: int = VERSION_ARCHIVE
+
+    @property
+    def empreinte(self) -> str:
+        return empreinte_saisie(self.saisie)
+
+    def tokens(self) -> Tuple[int, int]:
+        """Tokens estimés envoyés et reçus sur l'ensemble des appels au LLM."""
+        return (sum(mesure.get("tokens_prompt", 0) for mesure in self.mesures_prompts),
+                sum(mesure.get("tokens_reponse", 0) for mesure in self.mesures_prompts))
+
+    def liste_objectifs(self) -> List[Objectif]:
+        """Objectifs nettoyés sous forme structurée, doublons compris."""
+        return [_objectif_depuis_dict(objectif) for objectif in self.objectifs]
+
+    def en_donnees_rapport(self) -> DonneesRapport:
+        """Données du rapport PDF, HTML ou JSON, sans nouvel appel au LLM ; la date imprimée reste celle de l'analyse."""
+        return DonneesRapport(**self.saisie, rapport=self.rapport, recap_dict=self.recap_dict, date=self.date)
+
+
+def _objectif_depuis_dict(valeurs: Dict) -> Objectif:
+    return Objectif(**{**valeurs, "doublons": [_objectif_depuis_dict(doublon) for doublon in valeurs.get("doublons", ())]})
+
+
+def empreinte_saisie(saisie: Dict[str, str]) -> str:
+    """
+    Empreinte SHA-256 de la saisie du formulaire.
+
+    Args:
+        saisie (dict): Champs de CHAMPS_SAISIE
+
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    contenu = json.dumps([saisie.get(champ, "") for champ in CHAMPS_SAISIE], ensure_ascii=False)
+    return hashlib.sha256(contenu.encode("utf-8")).hexdigest()
+
+
+def archiver_analyse(saisie: Dict[str, str], rapport: Dict, recap_dict: Dict, trace: Optional[Dict] = None,
+                     dossier: Optional[str] = None) -> Path:
+    """
+    Enregistre une analyse terminée dans l'archive.
+
+    Args:
+        saisie (dict): Champs de CHAMPS_SAISIE
+        rapport (dict): Sortie du pipeline ('aperçu', 'details', …) ; une éventuelle trace y est ignorée
+        recap_dict (dict): Récapitulatif complété
+        trace (dict): Trace de PedagogicalAgent.run_analysis (objectifs, etapes, mesures_prompts, erreurs, duree)
+        dossier (str): Dossier de l'archive ; par défaut, DOSSIER_ARCHIVE
+
+    Returns:
+        Path: Fichier écrit
+    """
+    trace = trace or {}
+    maintenant = datetime.now()
+    analyse = AnalyseArchivee(
+        date=maintenant.isoformat(timespec="seconds"),
+        saisie={champ: saisie.get(champ, "") for champ in CHAMPS_SAISIE},
+        rapport={cle: valeur for cle, valeur in rapport.items() if cle != "trace"},
+        recap_dict=recap_dict,
+        objectifs=trace.get("objectifs", []),
+        etapes=trace.get("etapes", {}),
+        mesures_prompts=trace.get("mesures_prompts", []),
+        erreurs=trace.get("erreurs", []),
+        duree=trace.get("duree"),
+    )
+    nom = f"{maintenant:%Y-%m-%dT%H%M%S}_{analyse.empreinte[:LONGUEUR_EMPREINTE]}{EXTENSION}"
+    chemin = Path(dossier or DOSSIER_ARCHIVE) / f"{maintenant:%Y}" / f"{maintenant:%m}" / nom
+    chemin.parent.mkdir(parents=True, exist_ok=True)
+
+    contenu = json.dumps(asdict(analyse), ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    # Écriture dans un fichier temporaire puis renommage : pas de fichier tronqué dans l'archive
+    provisoire = chemin.with_name(chemin.name + ".tmp")
+    provisoire.write_bytes(gzip.compress(contenu, compresslevel=6))
+    os.replace(provisoire, chemin)
+    logger.info(f"Analyse archivée : {chemin} ({chemin.stat().st_size // 1000} ko)")
+    return chemin
+
+
+def charger_analyse(chemin) -> AnalyseArchivee:
+    """
+    Lit un fichier d'archive.
+
+    Args:
+        chemin (str | Path): Fichier .json.gz
+
+    Returns:
+        AnalyseArchivee: Analyse enregistrée
+
+    Raises:
+        ValueError: Si le fichier a été écrit par une version plus récente du format
+    """
+    valeurs = json.loads(gzip.decompress(Path(chemin).read_bytes()))
+    version = valeurs.get("version", 0)
+    if version > VERSION_ARCHIVE:
+        raise ValueError(f"{chemin} : format d'archive {version} non pris en charge (version {VERSION_ARCHIVE} au plus)")
+    return AnalyseArchivee(**valeurs)
+
+
+def lister_analyses(dossier: Optional[str] = None, depuis: Optional[str] = None,
+                    empreinte: Optional[str] = None) -> Iterator[Path]:
+    """
+    Fichiers de l'archive par ordre chronologique, filtrés sur leur nom.
+
+    Args:
+        dossier (str): Dossier de l'archive ; par défaut, DOSSIER_ARCHIVE
+        depuis (str): Date ISO (AAAA-MM-JJ) de la plus ancienne analyse retenue
+        empreinte (str): Empreinte de la saisie, ou son début (voir empreinte_saisie)
+
+    Yields:
+        Path: Fichiers d'archive
+    """
+    racine = Path(dossier or DOSSIER_ARCHIVE)
+    if not racine.is_dir():
+        return
+    for annee in sorted(racine.iterdir()):
+        if not annee.is_dir() or (depuis and annee.name < depuis[:4]):
+            continue
+        for mois in sorted(annee.iterdir()):
+            if not mois.is_dir() or (depuis and f"{annee.name}-{mois.name}" < depuis[:7]):
+                continue
+            for chemin in sorted(mois.glob(f"*{EXTENSION}")):
+                horodatage, _, suite = chemin.name.partition("_")
+                if depuis and horodatage[:10] < depuis[:10]:
+                    continue
+                if empreinte and not suite.startswith(empreinte[:LONGUEUR_EMPREINTE]):
+                    continue
+                yield chemin
+
+
+def derniere_analyse(saisie: Dict[str, str], dossier: Optional[str] = None) -> Optional[AnalyseArchivee]:
+    """
+    Analyse la plus récente d'une même saisie, s'il y en a une dans l'archive.
+
+    Args:
+        saisie (dict): Champs de CHAMPS_SAISIE
+        dossier (str): Dossier de l'archive ; par défaut, DOSSIER_ARCHIVE
+
+    Returns:
+        AnalyseArchivee | None: Dernière analyse dont la saisie est identique
+    """
+    empreinte = empreinte_saisie(saisie)
+    for chemin in reversed(list(lister_analyses(dossier, empreinte=empreinte))):
+        analyse = charger_analyse(chemin)
+        # Le nom ne porte que le début de l'empreinte
+        if analyse.empreinte == empreinte:
+            return analyse
+    return None
+
+
+def rendre_analyse(analyse: AnalyseArchivee, format_rendu: str = "pdf"):
+    """
+    Rend le rapport d'une analyse archivée.
+
+    Args:
+        analyse (AnalyseArchivee): Analyse chargée par charger_analyse
+        format_rendu (str): 'pdf', 'html' ou 'json'
+
+    Returns:
+        bytes | str: Contenu PDF, ou document HTML ou JSON
+    """
+    donnees = analyse.en_donnees_rapport()
+    if format_rendu == "pdf":
+        return rendre_rapport(donnees)
+    if format_rendu == "html":
+        return rapport_html(donnees)
+    if format_rendu == "json":
+        return rapport_json(donnees)
+    raise ValueError(f"Format de rendu inconnu : {format_rendu}")
+
+
+def _initialiser_processus():
+    logging.getLogger("fontTools").setLevel(logging.WARNING)
+    precharger_polices()
+
+
+def _rendre_fichier(travail: Tuple[str, str, str]) -> Tuple[str, Optional[str]]:
+    # Exécuté dans un processus du pool : chaque processus lit lui-même son fichier d'archive
+    chemin, sortie, format_rendu = travail
+    try:
+        contenu = rendre_analyse(charger_analyse(chemin), format_rendu)
+        cible = Path(sortie) / Path(chemin).name.replace(EXTENSION, f".{format_rendu}")
+        if isinstance(contenu, str):
+            cible.write_text(contenu, encoding="utf-8")
+        else:
+            cible.write_bytes(contenu)
+        return chemin, None
+    except Exception as e:
+        return chemin, str(e)
+
+
+def rendre_archive(sortie: str, format_rendu: str = "pdf", dossier: Optional[str] = None, depuis: Optional[str] = None,
+                   nb_processus: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Rend de nouveau tous les rapports d'une archive, sans appel au LLM.
+
+    Args:
+        sortie (str): Dossier des rapports rendus (un fichier par analyse, nommé comme son archive)
+        format_rendu (str): 'pdf', 'html' ou 'json'
+        dossier (str): Dossier de l'archive ; par défaut, DOSSIER_ARCHIVE
+        depuis (str): Date ISO de la plus ancienne analyse rendue
+        nb_processus (int): Processus de rendu ; par défaut, un par cœur
+
+    Returns:
+        tuple: (rapports rendus, échecs)
+    """
+    Path(sortie).mkdir(parents=True, exist_ok=True)
+    travaux = [(str(chemin), sortie, format_rendu) for chemin in lister_analyses(dossier, depuis)]
+    rendus = echecs = 0
+    debut = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=nb_processus or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialiser_processus,
+    ) as pool:
+        # Lots de travaux par processus : peu d'allers-retours pour des milliers de petits rendus
+        for chemin, erreur in pool.map(_rendre_fichier, travaux, chunksize=16):
+            if erreur is None:
+                rendus += 1
+            else:
+                echecs += 1
+                logger.warning(f"Rendu de {chemin} impossible : {erreur}")
+    logger.info(f"{rendus} rapport(s) {format_rendu} rendu(s), {echecs} échec(s), en {time.perf_counter() - debut:.1f} s")
+    return rendus, echecs
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description="Rendu en masse des rapports d'une archive d'analyses.")
+    parser.add_argument("sortie", help="dossier des rapports rendus")
+    parser.add_argument("--format", choices=("pdf", "html", "json"), default="pdf")
+    parser.add_argument("--archive", default=DOSSIER_ARCHIVE, help="dossier de l'archive")
+    parser.add_argument("--depuis", help="date ISO (AAAA-MM-JJ) de la plus ancienne analyse rendue")
+    parser.add_argument("--processus", type=int, help="nombre de processus de rendu")
+    arguments = parser.parse_args()
+    _, nb_echecs = rendre_archive(arguments.sortie, arguments.format, arguments.archive, arguments.depuis, arguments.processus)
+    sys.exit(1 if nb_echecs else 0)
@@ -0,0 +1,94 @@
+"""
+Benchmark du contrôle d'admission sous une rafale de soumissions.
+
+Simule un atelier : N utilisateurs soumettent une analyse au même instant.
+Une analyse enchaîne cinq appels au LLM répartis sur les clés du pipeline ;
+le fournisseur simulé accepte un nombre borné d'appels simultanés par clé et
+répond 429 au-delà (échec de l'analyse, sans nouvelle tentative). Compare le
+gestionnaire sans limite (une analyse lancée par soumission, appels non
+bornés) au gestionnaire avec contrôle d'admission (taches_analyse.py,
+admission.py) : analyses réussies, durée de la rafale, débit.
+
+Usage : python benchmarks/bench_admission.py [nb_utilisateurs] [capacite_par_cle]
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import admission  # noqa: E402
+from taches_analyse import ECHEC, TERMINEE, GestionnaireAnalyses, ResultatAnalyse  # noqa: E402
+
+# Clé utilisée par chaque appel d'une analyse, dans l'ordre du pipeline
+APPELS = ("classification", "evaluation", "evaluation", "suggestion", "synthese")
+DUREE_APPEL = 0.2
+
+
+class Fournisseur429(Exception):
+    pass
+
+
+class FournisseurSimule:
+    """Accepte capacite appels simultanés par clé ; au-delà, répond 429."""
+
+    def __init__(self, capacite: int):
+        self.capacite = capacite
+        self._en_cours = {cle: 0 for cle in APPELS}
+        self._verrou = threading.Lock()
+
+    def appeler(self, cle: str):
+        with self._verrou:
+            if self._en_cours[cle] >= self.capacite:
+                raise Fournisseur429(f"429 sur la clé {cle}")
+            self._en_cours[cle] += 1
+        try:
+            time.sleep(DUREE_APPEL)
+        finally:
+            with self._verrou:
+                self._en_cours[cle] -= 1
+
+
+def analyse_simulee(fournisseur: FournisseurSimule, borne: bool):
+    def analyser(saisie, progression=None):
+        for cle in APPELS:
+            if borne:
+                with admission.appel_llm(cle):
+                    fournisseur.appeler(cle)
+            else:
+                fournisseur.appeler(cle)
+        return ResultatAnalyse(saisie, {}, {})
+    return analyser
+
+
+def rafale(nb_utilisateurs: int, capacite: int, borne: bool):
+    fournisseur = FournisseurSimule(capacite)
+    # Sans contrôle : autant d'analyses simultanées que de soumissions
+    nb_analyses = 2 * capacite if borne else nb_utilisateurs
+    gestionnaire = GestionnaireAnalyses(nb_analyses=nb_analyses, analyse=analyse_simulee(fournisseur, borne))
+    debut = time.perf_counter()
+    identifiants = [gestionnaire.soumettre({"nom_cours": f"Cours {i}"}, utilisateur=f"u{i}") for i in range(nb_utilisateurs)]
+    while not all(gestionnaire.obtenir(identifiant).terminee for identifiant in identifiants):
+        time.sleep(0.01)
+    duree = time.perf_counter() - debut
+    statuts = [gestionnaire.obtenir(identifiant).statut for identifiant in identifiants]
+    return statuts.count(TERMINEE), statuts.count(ECHEC), duree
+
+
+def main():
+    logging.disable(logging.WARNING)
+    nb_utilisateurs = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    capacite = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    admission.APPELS_PAR_CLE = capacite
+    print(f"{nb_utilisateurs} soumissions simultanées, {capacite} appels simultanés par clé, {DUREE_APPEL}s par appel")
+    print(f"{'':<22}{'réussies':>10}{'échecs':>10}{'durée (s)':>12}{'débit (/s)':>12}")
+    for nom, borne in (("sans contrôle", False), ("contrôle d'admission", True)):
+        reussies, echecs, duree = rafale(nb_utilisateurs, capacite, borne)
+        print(f"{nom:<22}{reussies:>10}{echecs:>10}{duree:>12.2f}{reussies / duree:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
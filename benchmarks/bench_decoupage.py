@@ -0,0 +1,88 @@
+"""
+Benchmark du découpage des objectifs spécifiques sur de gros documents collés.
+
+Compare le découpage en un seul repérage (iterer_objectifs) à l'ancienne
+implémentation qui essayait successivement chaque séparateur avec re.split,
+et vérifie que les deux produisent le même résultat.
+
+Usage : python benchmarks/bench_decoupage.py [taille_en_ko]
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pretraitement_obj_spe import decouper_objectifs  # noqa: E402
+
+OBJECTIF = "Analyser les causes d'une panne réseau à partir de journaux système"
+
+FORMATS = {
+    "numerote": lambda i: f"{i}. {OBJECTIF}\n",
+    "puce": lambda i: f"- {OBJECTIF}\n",
+    "romain": lambda i: f"{'ivx'[i % 3] * (1 + i % 3)}) {OBJECTIF}\n",
+    "point_virgule": lambda i: f"{OBJECTIF};\n",
+    "virgule": lambda i: f"{OBJECTIF},\n",
+    "ligne_vide": lambda i: f"{OBJECTIF}\n\n",
+}
+
+
+def decouper_objectifs_reference(texte):
+    """Implémentation d'origine : un re.split complet par séparateur essayé."""
+    split_patterns = [
+        r"(?:^|\n)\s*(?:\d+[.)])\s+",
+        r"(?:^|\n)\s*[-•]\s+",
+        r"(?:^|\n)\s*(?:[ivxlcdmIVXLCDM]+[.)])\s+",
+        r"(?:^|\n)\s*[a-zA-Z][.)]\s+",
+        r";\s*(?=\n|$)",
+        r",\s*(?=\n|$)",
+        r"\n{2,}",
+    ]
+    for pattern in split_patterns:
+        parts = re.split(pattern, texte)
+        parts = [p.strip(" \n\t\r:.-") for p in parts if p.strip()]
+        if len(parts) > 1:
+            return parts
+    return [texte.strip()]
+
+
+def generer(format_ligne, taille_octets):
+    lignes = []
+    taille = 0
+    while taille < taille_octets:
+        ligne = format_ligne(len(lignes) + 1)
+        lignes.append(ligne)
+        taille += len(ligne)
+    return "".join(lignes)
+
+
+def chronometrer(fonction, texte, repetitions=5):
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        resultat = fonction(texte)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur, resultat
+
+
+def main():
+    logging.disable(logging.WARNING)
+    taille_ko = float(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{'format':<15}{'objectifs':>10}{'avant (Mo/s)':>15}{'après (Mo/s)':>15}{'gain':>8}")
+    for nom, format_ligne in FORMATS.items():
+        texte = generer(format_ligne, int(taille_ko * 1000))
+        duree_avant, attendu = chronometrer(decouper_objectifs_reference, texte)
+        duree_apres, obtenu = chronometrer(decouper_objectifs, texte)
+        assert obtenu == attendu, f"Résultats différents pour le format {nom}"
+        mo = len(texte) / 1_000_000
+        print(
+            f"{nom:<15}{len(obtenu):>10}{mo / duree_avant:>15.1f}{mo / duree_apres:>15.1f}"
+            f"{duree_avant / duree_apres:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark de la détection des verbes d'action (automate d'Aho–Corasick).
+
+Usage : python benchmarks/bench_detection_verbes.py [taille_en_Mo]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detection_verbes import detecter_verbes  # noqa: E402
+
+OBJECTIFS = [
+    "À la fin du cours, l'étudiant sera capable d'analyser les causes d'une panne réseau à partir de journaux système.",
+    "Au terme du TP, l'apprenant·e sera capable de mettre en pratique les méthodes agiles en équipe de quatre.",
+    "À l’issue de l’unité, les étudiants seront capables de dire dans ses mots le principe de la récursivité.",
+    "Concevoir une base de données relationnelle normalisée à partir d'un cahier des charges fourni.",
+    "Identifier, comparer et évaluer les algorithmes de tri selon leur complexité temporelle.",
+]
+
+
+def generer_catalogue(taille_octets: int) -> str:
+    blocs = []
+    taille = 0
+    num = 0
+    while taille < taille_octets:
+        num += 1
+        bloc = f"## Cours {num}\nObjectifs spécifiques :\n" + "\n".join(f"- {obj}" for obj in OBJECTIFS) + "\n\n"
+        blocs.append(bloc)
+        taille += len(bloc)
+    return "".join(blocs)
+
+
+def main():
+    taille_mo = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    catalogue = generer_catalogue(int(taille_mo * 1_000_000))
+
+    detecter_verbes(catalogue[:10_000])  # échauffement
+    debut = time.perf_counter()
+    detections = detecter_verbes(catalogue)
+    duree = time.perf_counter() - debut
+
+    print(f"Texte analysé      : {len(catalogue):,} caractères")
+    print(f"Verbes détectés    : {len(detections):,}")
+    print(f"Durée              : {duree:.3f} s")
+    print(f"Débit              : {len(catalogue) / duree / 1e6:.2f} M caractères/s")
+
+
+if __name__ == "__main__":
+    main()
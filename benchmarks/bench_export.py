@@ -0,0 +1,51 @@
+"""
+Benchmark des exports du rapport : PDF (fpdf2) contre HTML et JSON.
+
+Mesure, sur des rapports synthétiques de 5, 50 et 200 objectifs, la durée de
+generer_pdf et celle des exports légers de export_rapport.py (meilleure de
+plusieurs répétitions), ainsi que la taille de chaque sortie.
+
+Usage : python benchmarks/bench_export.py [nb_objectifs ...]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export_rapport import rapport_html, rapport_json  # noqa: E402
+from generation_pdf import DonneesRapport, rendre_rapport  # noqa: E402
+from polices_pdf import precharger_polices  # noqa: E402
+from rapport_synthetique import generer_rapport  # noqa: E402
+
+
+def mesurer(fonction, donnees, repetitions):
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        sortie = fonction(donnees)
+        durees.append(time.perf_counter() - debut)
+    return min(durees), len(sortie.encode("utf-8") if isinstance(sortie, str) else sortie)
+
+
+def main():
+    logging.disable(logging.WARNING)
+    tailles = [int(n) for n in sys.argv[1:]] or [5, 50, 200]
+    precharger_polices()
+    print(f"{'objectifs':>10}{'PDF (ms)':>10}{'HTML (ms)':>11}{'JSON (ms)':>11}{'gain HTML':>11}{'PDF (ko)':>10}{'HTML (ko)':>11}{'JSON (ko)':>11}")
+    for nb_objectifs in tailles:
+        donnees = DonneesRapport(**generer_rapport(nb_objectifs))
+        repetitions = 3 if nb_objectifs > 50 else 10
+        duree_pdf, taille_pdf = mesurer(rendre_rapport, donnees, repetitions)
+        duree_html, taille_html = mesurer(rapport_html, donnees, repetitions * 10)
+        duree_json, taille_json = mesurer(rapport_json, donnees, repetitions * 10)
+        print(
+            f"{nb_objectifs:>10}{duree_pdf * 1000:>10.1f}{duree_html * 1000:>11.2f}{duree_json * 1000:>11.2f}{duree_pdf / duree_html:>10.0f}x"
+            f"{taille_pdf / 1000:>10.1f}{taille_html / 1000:>11.1f}{taille_json / 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark du temps d'import avant l'affichage du formulaire (python -X importtime).
+
+Importe dans un processus neuf les modules qu'app.py importe au niveau du
+module (lus dans son source), puis, pour comparaison, ceux du préchauffage
+(prechauffage.MODULES), importés en arrière-plan une fois le formulaire
+affiché. Affiche le temps cumulé de chaque ensemble et les paquets les plus
+coûteux. Chaque mesure est répétée ; la meilleure est retenue.
+
+Usage : python benchmarks/bench_import.py [nb_paquets] [repetitions]
+"""
+
+import ast
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RACINE)
+
+from prechauffage import MODULES  # noqa: E402
+
+
+def modules_app():
+    # Imports au niveau du module d'app.py : ceux qui précèdent l'affichage du formulaire
+    with open(os.path.join(RACINE, "app.py"), encoding="utf-8") as fichier:
+        arbre = ast.parse(fichier.read())
+    modules = []
+    for noeud in arbre.body:
+        if isinstance(noeud, ast.Import):
+            modules += [alias.name for alias in noeud.names]
+        elif isinstance(noeud, ast.ImportFrom) and noeud.module:
+            modules.append(noeud.module)
+    return modules
+
+
+def importtime(modules):
+    """Durée cumulée (s) et durée propre par paquet de premier niveau (s) de l'import des modules."""
+    sortie = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "; ".join(f"import {module}" for module in modules)],
+        cwd=RACINE, capture_output=True, text=True, check=True,
+    ).stderr
+    total = 0
+    par_paquet = defaultdict(int)
+    for ligne in sortie.splitlines():
+        if not ligne.startswith("import time:") or "self [us]" in ligne:
+            continue
+        propre, cumule, nom = ligne[len("import time:"):].split("|")
+        par_paquet[nom.strip().split(".")[0]] += int(propre)
+        if not nom.startswith("  "):
+            # Import de premier niveau : son temps cumulé couvre tous ses sous-imports
+            total += int(cumule)
+    return total / 1e6, {paquet: duree / 1e6 for paquet, duree in par_paquet.items()}
+
+
+def meilleure(modules, repetitions):
+    return min((importtime(modules) for _ in range(repetitions)), key=lambda mesure: mesure[0])
+
+
+def main():
+    nb_paquets = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    ensembles = [
+        ("avant le formulaire", modules_app()),
+        ("préchauffage", [module for module in MODULES if module not in modules_app()]),
+    ]
+    for nom, modules in ensembles:
+        total, par_paquet = meilleure(modules, repetitions)
+        print(f"{nom} : {total:.2f} s ({', '.join(modules)})")
+        for paquet, duree in sorted(par_paquet.items(), key=lambda item: -item[1])[:nb_paquets]:
+            print(f"    {paquet:<30}{duree * 1000:>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
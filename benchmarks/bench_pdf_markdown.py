@@ -0,0 +1,110 @@
+"""
+Benchmark de la mise en page Markdown des rapports PDF.
+
+Compare, sur des rapports synthétiques de 5, 50 et 200 objectifs, l'ancien
+write_markdown (multi_cell et write ligne par ligne, re.split par ligne) au
+découpage en blocs de markdown_pdf.py, pour le chapitre d'analyse détaillée
+seul puis pour le rapport complet, et vérifie que le nombre de pages est le
+même.
+
+Usage : python benchmarks/bench_pdf_markdown.py [nb_objectifs ...]
+"""
+
+import logging
+import os
+import re
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generation_pdf import DonneesRapport, RapportPDF  # noqa: E402
+from rapport_synthetique import generer_rapport  # noqa: E402
+
+
+class RapportPDFReference(RapportPDF):
+    """Implémentation d'origine de write_markdown."""
+
+    def write_rich_line(self, text):
+        parts = re.split(r'(\*\*.*?\*\*)', text)
+        for part in parts:
+            if part.startswith('**') and part.endswith('**'):
+                self.set_font("DejaVu", "B", 10)
+                self.write(8, part[2:-2])
+            else:
+                self.set_font("DejaVu", "", 10)
+                self.write(8, part)
+        self.ln()
+
+    def write_markdown(self, md_text):
+        for line in md_text.split('\n'):
+            self.set_text_color(0, 0, 0)
+            line = line.strip()
+            handled = False
+            if line.startswith('**') and line.endswith('**'):
+                self.set_text_color(25, 25, 112)
+            if (line.startswith('- ') or line.startswith('* ')) and '**' in line:
+                self.set_font("DejaVu", "", 10)
+                self.cell(3)
+                self.write_rich_line(u'• ' + line[2:].strip())
+                handled = True
+            elif line.startswith('- ') or line.startswith('* '):
+                self.set_font("DejaVu", "", 10)
+                self.cell(3)
+                self.multi_cell(0, 7, u'• ' + line[2:], ln=True, align='J')
+                handled = True
+            elif line.startswith('#'):
+                niveau = len(line) - len(line.lstrip('#'))
+                if 1 <= niveau <= 4 and line[niveau:niveau + 1] == ' ':
+                    self.set_font("DejaVu", "B", 16 - niveau)
+                    self.set_text_color(25, 25, 112)
+                    self.multi_cell(0, 7, line[niveau + 1:], ln=True, align='J')
+                    handled = True
+            elif '**' in line:
+                self.write_rich_line(line)
+                handled = True
+            if not handled:
+                self.set_font("DejaVu", "", 10)
+                self.multi_cell(0, 7, line, align='J')
+                self.ln(0)
+
+
+def chapitre(classe, details):
+    pdf = classe()
+    pdf.set_left_margin(15)
+    pdf.set_right_margin(15)
+    debut = time.perf_counter()
+    pdf.print_chapter(4, "Analyse détaillée", details)
+    return time.perf_counter() - debut, pdf.page_no()
+
+
+def rapport(classe, donnees):
+    debut = time.perf_counter()
+    pdf = classe()
+    pdf.composer(donnees)
+    pdf.output()
+    return time.perf_counter() - debut
+
+
+def main():
+    logging.disable(logging.WARNING)
+    # L'implémentation d'origine utilise le paramètre ln, déprécié
+    warnings.simplefilter("ignore", DeprecationWarning)
+    tailles = [int(n) for n in sys.argv[1:]] or [5, 50, 200]
+    print(f"{'objectifs':>10}{'pages':>7}{'chapitre avant':>16}{'après':>9}{'gain':>8}{'rapport avant':>15}{'après':>9}{'gain':>8}")
+    for nb_objectifs in tailles:
+        donnees = DonneesRapport(**generer_rapport(nb_objectifs))
+        chapitre_avant, pages_avant = chapitre(RapportPDFReference, donnees.rapport["details"])
+        chapitre_apres, pages_apres = chapitre(RapportPDF, donnees.rapport["details"])
+        assert pages_avant == pages_apres, f"Nombre de pages différent ({pages_avant} / {pages_apres})"
+        rapport_avant = rapport(RapportPDFReference, donnees)
+        rapport_apres = rapport(RapportPDF, donnees)
+        print(
+            f"{nb_objectifs:>10}{pages_apres:>7}{chapitre_avant:>15.2f}s{chapitre_apres:>8.2f}s{chapitre_avant / chapitre_apres:>7.1f}x"
+            f"{rapport_avant:>14.2f}s{rapport_apres:>8.2f}s{rapport_avant / rapport_apres:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark de la génération PDF avec les polices DejaVu mises en cache.
+
+Compare, par rapport généré, l'analyse des quatre polices à chaque document
+(cache vidé avant chaque appel, comme les add_font d'origine) au partage des
+polices analysées une fois par processus (polices_pdf.py).
+
+Usage : python benchmarks/bench_pdf_polices.py [nb_objectifs] [repetitions]
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import polices_pdf  # noqa: E402
+from generation_pdf import generer_pdf  # noqa: E402
+from rapport_synthetique import generer_rapport  # noqa: E402
+
+
+def rendre(donnees, vider_cache):
+    if vider_cache:
+        polices_pdf._POLICES.clear()
+    debut = time.perf_counter()
+    octets = generer_pdf(**donnees)
+    return time.perf_counter() - debut, len(octets)
+
+
+def main():
+    logging.disable(logging.WARNING)
+    nb_objectifs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    donnees = generer_rapport(nb_objectifs)
+    polices_pdf.precharger_polices()
+
+    print(f"{'mode':<28}{'ms / rapport':>14}{'taille (ko)':>13}")
+    resultats = {}
+    for nom, vider_cache in (("polices relues (avant)", True), ("polices en cache (après)", False)):
+        durees, taille = [], 0
+        for _ in range(repetitions):
+            duree, taille = rendre(donnees, vider_cache)
+            durees.append(duree)
+        resultats[nom] = min(durees)
+        print(f"{nom:<28}{resultats[nom] * 1000:>14.1f}{taille / 1000:>13.1f}")
+    avant, apres = resultats.values()
+    print(f"gain : {avant / apres:.2f}x ({(avant - apres) * 1000:.1f} ms par rapport)")
+
+
+if __name__ == "__main__":
+    main()
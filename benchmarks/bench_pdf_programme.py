@@ -0,0 +1,73 @@
+"""
+Benchmark du rapport PDF consolidé d'un programme.
+
+Compare, pour 10, 50 et 150 cours synthétiques, un document fpdf2 unique
+contenant tous les cours (toutes les pages en mémoire jusqu'à output()) à
+l'écriture cours par cours de programme_pdf.py : pic de mémoire Python
+(tracemalloc), durée et taille du fichier.
+
+Usage : python benchmarks/bench_pdf_programme.py [nb_cours ...]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generation_pdf import DonneesRapport  # noqa: E402
+from programme_pdf import RapportProgrammePDF, generer_pdf_programme  # noqa: E402
+from rapport_synthetique import generer_rapport  # noqa: E402
+
+
+def cours_synthetiques(nb_cours):
+    for i in range(nb_cours):
+        donnees = generer_rapport(3 + i % 6)
+        donnees["nom_cours"] = f"Cours {i + 1}"
+        yield DonneesRapport(**donnees)
+
+
+def document_unique(nb_cours, chemin):
+    pdf = RapportProgrammePDF()
+    for donnees in cours_synthetiques(nb_cours):
+        pdf.add_page_de_garde_cours(donnees.nom_cours)
+        pdf.composer_chapitres(donnees)
+    pdf.add_methode_analyse()
+    pdf.output(chemin)
+
+
+def mesurer(fonction, *args):
+    # Durée sans tracemalloc, qui ralentit fortement fpdf2, puis pic mémoire sur un second rendu
+    debut = time.perf_counter()
+    fonction(*args)
+    duree = time.perf_counter() - debut
+    tracemalloc.start()
+    fonction(*args)
+    pic = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duree, pic / 1e6
+
+
+def main():
+    logging.disable(logging.WARNING)
+    tailles = [int(n) for n in sys.argv[1:]] or [10, 50, 150]
+    print(f"{'':>6}{'pic mémoire (Mo)':>22}{'durée (s)':>22}{'taille (Mo)':>22}")
+    print(f"{'cours':>6}" + f"{'unique':>11}{'par cours':>11}" * 3)
+    with tempfile.TemporaryDirectory() as dossier:
+        for nb_cours in tailles:
+            chemin_unique = os.path.join(dossier, "unique.pdf")
+            chemin_programme = os.path.join(dossier, "programme.pdf")
+            duree_unique, pic_unique = mesurer(document_unique, nb_cours, chemin_unique)
+            duree_programme, pic_programme = mesurer(
+                lambda: generer_pdf_programme("Synthétique", cours_synthetiques(nb_cours), chemin_programme))
+            print(
+                f"{nb_cours:>6}{pic_unique:>11.1f}{pic_programme:>11.1f}{duree_unique:>11.1f}{duree_programme:>11.1f}"
+                f"{os.path.getsize(chemin_unique) / 1e6:>11.2f}{os.path.getsize(chemin_programme) / 1e6:>11.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
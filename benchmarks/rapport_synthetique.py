@@ -0,0 +1,80 @@
+"""
+Rapports synthétiques pour les benchmarks de génération de documents.
+
+Produit les arguments de generer_pdf (informations du cours, rapport et
+récapitulatif) pour un nombre quelconque d'objectifs spécifiques, dans le
+format de sortie du pipeline (rapport_structure.rendre_suggestions).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rapport_structure import CRITERES  # noqa: E402
+
+VERBES = ["Identifier", "Expliquer", "Appliquer", "Analyser", "Évaluer", "Concevoir"]
+NIVEAUX = ["Connaître", "Comprendre", "Appliquer", "Analyser", "Évaluer", "Créer"]
+
+
+def _objectif(i: int) -> str:
+    return f"{VERBES[i % 6]} les mécanismes de routage d'un réseau d'entreprise à partir d'un cas d'étude n°{i}"
+
+
+def _analyse(i: int, notes: list) -> list:
+    lignes = [f"- Niveau : {NIVEAUX[i % 6]}"]
+    for (_, libelle), note in zip(CRITERES, notes):
+        lignes.append(f"- {libelle} : Le verbe « {VERBES[i % 6].lower()} » est observable mais le contexte reste implicite. Note : **{note}/5**")
+    return lignes
+
+
+def generer_rapport(nb_objectifs: int) -> dict:
+    """
+    Args:
+        nb_objectifs (int): Nombre d'objectifs spécifiques
+
+    Returns:
+        dict: Arguments nommés de generer_pdf
+    """
+    notes = [[5, 5, 5, 5, 5] if i % 3 == 0 else [4, 3, 5, 4, 2] for i in range(nb_objectifs + 1)]
+    lignes = ["#### Objectif général :", *_analyse(0, notes[0]), "", "#### Objectifs spécifiques", ""]
+    for i in range(1, nb_objectifs + 1):
+        lignes += [f"**Objectif {i} : {_objectif(i)}**", *_analyse(i, notes[i])]
+        if notes[i] != [5] * 5:
+            lignes += ["", "Recommandation(s) :",
+                       "- **Mesurable, Temporellement défini** : Préciser la production attendue et l'échéance (fin de la séance 3).",
+                       f"- Reformulation proposée : {_objectif(i)}, en rédigeant un rapport de deux pages d'ici la fin de la semaine 4."]
+        lignes.append("")
+    lignes += ["#### Complétude", "Les objectifs couvrent l'essentiel du cours. Note : **4/5**", "",
+               "#### Résumé", "Objectifs globalement clairs, la dimension temporelle est souvent absente.", ""]
+    lignes += [f"- Objectif {i} : " + ", ".join(f"{libelle} ({n}/5)" for (_, libelle), n in zip(CRITERES, notes[i])) + "."
+               for i in range(1, nb_objectifs + 1)]
+
+    a_ameliorer = [
+        {"num": i, "objectif": _objectif(i), "probleme_resume": "Critère(s) à renforcer : Mesurable (3/5), Temporellement défini (2/5)",
+         "suggestion": f"{_objectif(i)}, en rédigeant un rapport de deux pages d'ici la fin de la semaine 4."}
+        for i in range(1, nb_objectifs + 1) if notes[i] != [5] * 5
+    ]
+    conformes = [{"num": i, "objectif": _objectif(i), "niveau_bloom": NIVEAUX[i % 6]}
+                 for i in range(1, nb_objectifs + 1) if notes[i] == [5] * 5]
+    recap = {
+        "points_forts": ["Verbes d'action observables", "Bonne couverture des niveaux de Bloom"],
+        "axes_amelioration": ["Échéances rarement précisées", "Productions attendues implicites"],
+        "objectifs_total": nb_objectifs + 1,
+        "objectifs_conformes": {"nbre_total": len(conformes), "liste": conformes},
+        "objectifs_a_ameliorer": {"nbre_total": len(a_ameliorer), "liste": a_ameliorer},
+        "recommandations": ["Préciser une échéance pour chaque objectif", "Nommer la production attendue"],
+        "niveaux_bloom_utilises": NIVEAUX,
+    }
+    return {
+        "nom_cours": "Réseaux d'entreprise",
+        "niveau": "Licence 3",
+        "public": "Étudiants en informatique",
+        "objectif_general": "Concevoir et administrer l'infrastructure réseau d'une entreprise de taille moyenne.",
+        "objectifs_specifiques_brut": "\n".join(f"{i}. {_objectif(i)}" for i in range(1, nb_objectifs + 1)),
+        "rapport": {
+            "aperçu": "L'analyse porte sur des objectifs globalement bien formulés. La dimension temporelle et les productions attendues restent à préciser.",
+            "details": "\n".join(lignes),
+        },
+        "recap_dict": recap,
+    }
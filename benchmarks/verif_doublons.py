@@ -0,0 +1,45 @@
+"""
+Vérification rapide du regroupement des objectifs en doublon (doublons.py).
+
+Chaque cas associe des objectifs saisis aux groupes attendus ; le script
+affiche les regroupements inattendus et se termine en erreur s'il y en a.
+
+Usage : python benchmarks/verif_doublons.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from doublons import regrouper_doublons  # noqa: E402
+from pretraitement_obj_spe import creer_objectif  # noqa: E402
+
+CAS = [
+    # Années différentes : deux objectifs distincts malgré une similarité de 0,97
+    (("Analyser les résultats financiers de l'entreprise pour l'exercice 2023",
+      "Analyser les résultats financiers de l'entreprise pour l'exercice 2024"), [["OS1"], ["OS2"]]),
+    (("Expliquer le modèle M.V.C.", "expliquer le modele MVC"), [["OS1", "OS2"]]),
+    (("Décrire les étapes du cycle de vie d'un logiciel.",
+      "Décrire, les étapes du cycle de vie d'un logiciel !"), [["OS1", "OS2"]]),
+]
+
+
+def groupes(textes):
+    objectifs = [creer_objectif(f"OS{num}", texte) for num, texte in enumerate(textes, 1)]
+    return [[objectif.id for objectif in groupe] for groupe in regrouper_doublons(objectifs)]
+
+
+def main():
+    echecs = 0
+    for textes, attendu in CAS:
+        obtenu = groupes(textes)
+        if obtenu != attendu:
+            echecs += 1
+            print(f"Regroupement inattendu : {obtenu} au lieu de {attendu}")
+    print(f"{len(CAS) - echecs}/{len(CAS)} vérification(s) réussie(s)")
+    sys.exit(1 if echecs else 0)
+
+
+if __name__ == "__main__":
+    main()
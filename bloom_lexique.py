@@ -0,0 +1,123 @@
+"""
+Lexique des verbes d'action de la taxonomie de Bloom.
+
+Le texte de BASE_CONNAISSANCES_BLOOM est analysé une seule fois à l'import
+pour construire un index verbe -> niveaux, complété par les formes fléchies
+courantes de chaque verbe afin de retrouver l'infinitif d'un verbe conjugué.
+"""
+
+import re
+import logging
+import unicodedata
+from typing import Dict, List, Tuple
+
+from prompts import BASE_CONNAISSANCES_BLOOM
+
+logger = logging.getLogger(__name__)
+
+_RE_NIVEAU = re.compile(
+    r"^\s*(?P<niveau>[^\s:][^:\n]*?)\s*:\s*\n"
+    r"\s*Explication\s*:\s*(?P<explication>[^\n]+)\n"
+    r"\s*Verbes\s*:\s*(?P<verbes>[^\n]+)$",
+    flags=re.MULTILINE
+)
+_RE_PARENTHESES = re.compile(r"\s*\([^)]*\)")
+RE_MOT = re.compile(r"[^\W\d_]+")
+
+# Terminaisons utilisées pour retrouver l'infinitif à partir d'une forme fléchie
+_FLEXIONS_ER = ("e", "es", "ent", "é", "ée", "és", "ées", "ant", "ons", "ez", "era", "eront")
+_FLEXIONS_IR = ("is", "it", "issent", "issant", "issons", "issez", "i", "ie", "ira", "iront")
+_FLEXIONS_RE = ("s", "t", "ra", "ront")
+
+
+def normaliser(texte: str) -> str:
+    """Normalise un texte pour la recherche de verbes (NFC, minuscules, apostrophes droites)."""
+    return unicodedata.normalize("NFC", texte).replace("’", "'").lower()
+
+
+def sans_accents(texte: str) -> str:
+    """Retire les diacritiques d'un texte déjà normalisé."""
+    decompose = unicodedata.normalize("NFD", texte)
+    return "".join(c for c in decompose if not unicodedata.combining(c))
+
+
+def parser_base_bloom(base: str = BASE_CONNAISSANCES_BLOOM) -> Dict[str, Dict]:
+    """
+    Extrait les niveaux, explications et verbes d'action de la base de connaissances.
+
+    Args:
+        base (str): Texte de la base de connaissances Bloom
+
+    Returns:
+        dict: {niveau: {"explication": str, "verbes": [str, ...]}} dans l'ordre
+        des niveaux, du plus bas au plus haut.
+    """
+    niveaux = {}
+    for match in _RE_NIVEAU.finditer(base):
+        verbes = []
+        for verbe in match.group("verbes").split(","):
+            verbe = normaliser(_RE_PARENTHESES.sub("", verbe)).strip(" .")
+            if verbe and verbe != "etc" and verbe not in verbes:
+                verbes.append(verbe)
+        niveaux[match.group("niveau").strip()] = {
+            "explication": match.group("explication").strip(),
+            "verbes": verbes,
+        }
+    logger.debug(f"Base Bloom analysée : {len(niveaux)} niveaux")
+    return niveaux
+
+
+def flexions(infinitif: str) -> List[str]:
+    """
+    Génère les formes fléchies courantes d'un verbe (ou de la tête d'une locution).
+
+    Seules les flexions régulières sont produites ; elles servent à retrouver
+    l'infinitif d'un verbe conjugué (« décrit », « identifie », « analysant »).
+    """
+    tete, _, reste = infinitif.partition(" ")
+    suite = f" {reste}" if reste else ""
+    formes = []
+    if tete.endswith("er"):
+        formes = [tete[:-2] + terminaison for terminaison in _FLEXIONS_ER]
+    elif tete.endswith("ir"):
+        formes = [tete[:-2] + terminaison for terminaison in _FLEXIONS_IR]
+    elif tete.endswith("ttre"):
+        formes = [tete[:-3], tete[:-3] + "s", tete[:-2] + "ent"]
+    elif tete.endswith("re"):
+        formes = [tete[:-2] + terminaison for terminaison in _FLEXIONS_RE]
+    return [forme + suite for forme in formes if forme != tete]
+
+
+def _construire_index(niveaux: Dict[str, Dict]) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+    index = {}
+    for niveau, donnees in niveaux.items():
+        for verbe in donnees["verbes"]:
+            index.setdefault(verbe, [])
+            if niveau not in index[verbe]:
+                index[verbe].append(niveau)
+    index = {verbe: tuple(niveaux_verbe) for verbe, niveaux_verbe in index.items()}
+
+    formes = {}
+    for verbe in index:
+        for forme in [verbe, *flexions(verbe)]:
+            for variante in {forme, sans_accents(forme)}:
+                formes.setdefault(variante, [])
+                if verbe not in formes[variante]:
+                    formes[variante].append(verbe)
+    return index, {forme: tuple(verbes) for forme, verbes in formes.items()}
+
+
+NIVEAUX_BLOOM = parser_base_bloom()
+INDEX_VERBES, FORMES_VERBALES = _construire_index(NIVEAUX_BLOOM)
+ORDRE_NIVEAUX = {niveau: rang for rang, niveau in enumerate(NIVEAUX_BLOOM, 1)}
+
+
+def niveaux_du_verbe(verbe: str) -> Tuple[str, ...]:
+    """Renvoie les niveaux de Bloom associés à un verbe, quelle que soit sa forme."""
+    forme = normaliser(verbe).strip()
+    niveaux = []
+    for infinitif in FORMES_VERBALES.get(forme) or FORMES_VERBALES.get(sans_accents(forme), ()):
+        for niveau in INDEX_VERBES[infinitif]:
+            if niveau not in niveaux:
+                niveaux.append(niveau)
+    return tuple(sorted(niveaux, key=ORDRE_NIVEAUX.get))
@@ -0,0 +1,182 @@
+"""
+Classification locale des objectifs selon la taxonomie de Bloom.
+
+Les objectifs dont le verbe principal n'appartient qu'à un seul niveau du
+lexique sont classés sans appel au LLM ; les autres (verbe ambigu, plusieurs
+verbes, verbe inconnu) restent confiés à l'étape classify_bloom.
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from bloom_lexique import INDEX_VERBES, NIVEAUX_BLOOM, RE_MOT, normaliser
+from detection_verbes import detecter_verbes
+from pretraitement_obj_spe import Objectif, localiser_preambules
+
+logger = logging.getLogger(__name__)
+
+# Repli lorsque le sujet n'est pas reconnu par les motifs de capacité (« les étudiants seront capables de »)
+_RE_CAPACITE_SOUPLE = re.compile(r"\b(?:capables?|capable\(s\)|en mesure|pourra|pourront)\s+(?:de\s+|d')?")
+
+# Mots pouvant s'intercaler entre le préambule et le verbe principal
+_MOTS_LIAISON = {"de", "d", "à", "a", "savoir", "pouvoir", "être", "en", "mesure", "capable", "capables"}
+_COORDINATIONS = {"et", "ou", "puis", "ainsi", "voire"}
+_MOTS_AVANT_INFINITIF = {"de", "d", "à", "le", "la", "l", "les", "en", "y", "se", "s"}
+_FENETRE_VERBE_PRINCIPAL = 3
+
+
+@dataclass
+class ClassificationLocale:
+    objectif: Objectif
+    verbe: str
+    niveau: str
+    justification: str
+
+
+@dataclass
+class RepartitionBloom:
+    """Résultat du tri entre objectifs classés localement et objectifs confiés au LLM."""
+    general: Optional[ClassificationLocale] = None
+    specifiques_locaux: List[ClassificationLocale] = field(default_factory=list)
+    specifiques_llm: List[Objectif] = field(default_factory=list)
+
+    @property
+    def appel_llm_necessaire(self) -> bool:
+        return self.general is None or bool(self.specifiques_llm)
+
+
+def analyser_verbes(objectif: str) -> Tuple[Optional[str], List[str]]:
+    """
+    Identifie le verbe principal d'un objectif et les autres verbes d'action.
+
+    Le verbe principal est cherché juste après le préambule de capacité
+    (« sera capable de … »), ou à défaut au début de l'objectif.
+
+    Returns:
+        tuple: (verbe principal ou None, liste des autres verbes détectés)
+    """
+    texte = normaliser(objectif)
+    span_temps, span_capacite = localiser_preambules(texte)
+    if span_capacite is None:
+        match = _RE_CAPACITE_SOUPLE.search(texte)
+        span_capacite = match.span() if match else None
+    debut = span_capacite[1] if span_capacite else span_temps[1] if span_temps else 0
+    corps = texte[debut:]
+
+    detections = detecter_verbes(corps)
+    if not detections:
+        return None, []
+
+    tete = detections[0]
+    mots_avant = [mot for mot in RE_MOT.findall(corps[:tete.debut]) if mot not in _MOTS_LIAISON]
+    if len(mots_avant) >= _FENETRE_VERBE_PRINCIPAL:
+        return None, []
+
+    # Hors de la tête de l'objectif, seules les formes infinitives comptent
+    autres = [detection.verbe for detection in detections[1:] if detection.infinitif]
+    spans = [(detection.debut, detection.fin) for detection in detections]
+
+    matches = [match for match in RE_MOT.finditer(corps) if match.start() >= tete.fin]
+    for position, match in enumerate(matches):
+        mot = match.group()
+        if len(mot) <= 4 or not mot.endswith(("er", "ir", "re")) or position == 0:
+            continue
+        if any(debut_verbe <= match.start() < fin_verbe for debut_verbe, fin_verbe in spans):
+            continue
+        # Infinitif coordonné absent du lexique (« décrire et maîtriser … »)
+        precedent = position - 1
+        while precedent > 0 and matches[precedent].group() in _MOTS_AVANT_INFINITIF:
+            precedent -= 1
+        separateur = corps[matches[precedent].end():match.start()]
+        if matches[precedent].group() in _COORDINATIONS or "," in separateur:
+            autres.append(mot)
+
+    return tete.verbe, autres
+
+
+def justification_locale(verbe: str, niveau: str) -> str:
+    explication = NIVEAUX_BLOOM[niveau]["explication"].split(".")[0]
+    return (
+        f"Le verbe d'action « {verbe} » n'est associé qu'au niveau « {niveau} » "
+        f"dans la taxonomie de Bloom révisée ({explication.lower()}). "
+        "L'objectif ne contient pas d'autre verbe d'action susceptible de modifier ce niveau."
+    )
+
+
+def classifier_localement(objectif: Objectif) -> Optional[ClassificationLocale]:
+    """
+    Classe un objectif sans appel au LLM lorsque son verbe principal est univoque.
+
+    Args:
+        objectif (Objectif): Objectif à classer
+
+    Returns:
+        ClassificationLocale | None: None si l'objectif est ambigu (verbe multi-niveaux,
+        plusieurs verbes d'action ou verbe absent du lexique).
+    """
+    verbe, autres = analyser_verbes(objectif.texte)
+    if verbe is None:
+        logger.debug(f"Aucun verbe du lexique reconnu : {objectif}")
+        return None
+    if autres:
+        logger.debug(f"Plusieurs verbes d'action ({verbe}, {', '.join(autres)}) : {objectif}")
+        return None
+    niveaux = INDEX_VERBES[verbe]
+    if len(niveaux) != 1:
+        logger.debug(f"Verbe « {verbe} » ambigu ({', '.join(niveaux)}) : {objectif}")
+        return None
+    return ClassificationLocale(
+        objectif=objectif,
+        verbe=verbe,
+        niveau=niveaux[0],
+        justification=justification_locale(verbe, niveaux[0]),
+    )
+
+
+def repartir_classification(objectif_general: Objectif, objectifs_specifiques: List[Objectif]) -> RepartitionBloom:
+    """
+    Répartit les objectifs entre classification locale et classification par le LLM.
+
+    L'objectif général n'est classé localement que si aucun appel au LLM n'est
+    nécessaire : sinon il est transmis au modèle, dont la consigne impose de le
+    classer à la lumière des objectifs spécifiques.
+    """
+    repartition = RepartitionBloom(general=classifier_localement(objectif_general) if objectif_general.texte else None)
+    for objectif in objectifs_specifiques:
+        classification = classifier_localement(objectif)
+        if classification:
+            repartition.specifiques_locaux.append(classification)
+        else:
+            repartition.specifiques_llm.append(objectif)
+
+    if repartition.specifiques_llm:
+        repartition.general = None
+
+    logger.info(
+        f"Classification locale : {len(repartition.specifiques_locaux)} objectif(s) spécifique(s), "
+        f"{len(repartition.specifiques_llm)} confié(s) au LLM"
+    )
+    return repartition
+
+
+def formater_classification(classification: ClassificationLocale) -> str:
+    """Met en forme une classification locale au format attendu par PROMPT_CLASSIFICATION_BLOOM."""
+    return (
+        f"Objectif {classification.objectif.id} :\n"
+        f"Niveau de Bloom : {classification.niveau}\n"
+        f"Justification : {classification.justification}"
+    )
+
+
+def fusionner_classification(resultat_llm: str, repartition: RepartitionBloom) -> str:
+    """Assemble la sortie du LLM et les classifications locales en un seul texte."""
+    blocs = []
+    if repartition.general:
+        blocs.append(formater_classification(repartition.general))
+    if resultat_llm and resultat_llm.strip():
+        blocs.append(resultat_llm.strip())
+    for classification in sorted(repartition.specifiques_locaux, key=lambda classification: classification.objectif.num):
+        blocs.append(formater_classification(classification))
+    return "\n\n".join(blocs)
@@ -0,0 +1,185 @@
+"""
+Détection des verbes d'action de la taxonomie de Bloom par automate d'Aho–Corasick.
+
+L'automate est construit une seule fois à partir de toutes les formes du
+lexique (verbes, formes fléchies et locutions comme « mettre en pratique » ou
+« dire dans ses mots »). Il travaille mot à mot : la tokenisation est confiée
+au moteur d'expressions régulières, et chaque mot fait avancer l'automate d'une
+transition, ce qui donne un parcours linéaire du texte quelle que soit la taille
+du lexique.
+"""
+
+import logging
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from bloom_lexique import FORMES_VERBALES, INDEX_VERBES, ORDRE_NIVEAUX, RE_MOT, sans_accents
+
+logger = logging.getLogger(__name__)
+
+
+class DetectionVerbe(NamedTuple):
+    debut: int
+    fin: int
+    forme: str
+    verbe: str
+    niveaux: Tuple[str, ...]
+
+    @property
+    def infinitif(self) -> bool:
+        """Vrai si le verbe apparaît à l'infinitif (avec ou sans accents)."""
+        return self.forme in (self.verbe, sans_accents(self.verbe))
+
+
+class AutomateAhoCorasick:
+    """
+    Automate d'Aho–Corasick dont l'alphabet est constitué de mots.
+
+    Args:
+        motifs (dict): {forme (un ou plusieurs mots): valeur associée}
+    """
+
+    def __init__(self, motifs: Dict[str, str]):
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.echecs: List[int] = [0]
+        # Pour chaque état : [(nombre de mots du motif, forme, valeur), ...], du plus long au plus court
+        self.sorties: List[List[Tuple[int, str, str]]] = [[]]
+        self.longueur_max = 1
+
+        for forme, valeur in motifs.items():
+            self._ajouter(forme, valeur)
+        self._construire_echecs()
+        logger.debug(f"Automate construit : {len(motifs)} motifs, {len(self.transitions)} états")
+
+    def _ajouter(self, forme: str, valeur: str):
+        mots = forme.split()
+        etat = 0
+        for mot in mots:
+            suivant = self.transitions[etat].get(mot)
+            if suivant is None:
+                suivant = len(self.transitions)
+                self.transitions[etat][mot] = suivant
+                self.transitions.append({})
+                self.echecs.append(0)
+                self.sorties.append([])
+            etat = suivant
+        self.sorties[etat].append((len(mots), forme, valeur))
+        self.longueur_max = max(self.longueur_max, len(mots))
+
+    def _construire_echecs(self):
+        file = list(self.transitions[0].values())
+        for etat in file:
+            for mot, suivant in self.transitions[etat].items():
+                file.append(suivant)
+                repli = self.echecs[etat]
+                while repli and mot not in self.transitions[repli]:
+                    repli = self.echecs[repli]
+                cible = self.transitions[repli].get(mot, 0)
+                self.echecs[suivant] = cible if cible != suivant else 0
+                self.sorties[suivant].extend(self.sorties[self.echecs[suivant]])
+        for sorties in self.sorties:
+            sorties.sort(key=lambda sortie: sortie[0], reverse=True)
+
+    def parcourir(self, texte: str) -> Iterator[Tuple[int, int, str, str]]:
+        """
+        Parcourt un texte déjà normalisé et produit toutes les occurrences, y compris chevauchantes.
+
+        Yields:
+            tuple: (début, fin, forme, valeur), dans l'ordre de fin d'occurrence
+        """
+        transitions, echecs, sorties = self.transitions, self.echecs, self.sorties
+        racine = transitions[0]
+        taille = self.longueur_max
+        debuts = [0] * taille
+        etat = 0
+        rang = 0
+        for match in RE_MOT.finditer(texte):
+            mot = match.group()
+            debuts[rang % taille] = match.start()
+            if etat:
+                while etat and mot not in transitions[etat]:
+                    etat = echecs[etat]
+                etat = transitions[etat].get(mot, 0)
+            else:
+                etat = racine.get(mot, 0)
+            if etat:
+                fin = match.end()
+                for nb_mots, forme, valeur in sorties[etat]:
+                    yield debuts[(rang - nb_mots + 1) % taille], fin, forme, valeur
+            rang += 1
+
+
+def _niveaux(verbes: Iterable[str]) -> Tuple[str, ...]:
+    niveaux = {niveau for verbe in verbes for niveau in INDEX_VERBES[verbe]}
+    return tuple(sorted(niveaux, key=ORDRE_NIVEAUX.get))
+
+
+AUTOMATE_VERBES = AutomateAhoCorasick({forme: forme for forme in FORMES_VERBALES})
+
+# Une forme partagée par plusieurs infinitifs cumule leurs niveaux candidats
+_INFOS_FORMES = {forme: (verbes[0], _niveaux(verbes)) for forme, verbes in FORMES_VERBALES.items()}
+
+
+def _normaliser_sans_decalage(texte: str) -> str:
+    # Les spans doivent rester valables sur le texte d'origine : on évite les
+    # transformations qui changent la longueur lorsque le texte est déjà en NFC.
+    if not unicodedata.is_normalized("NFC", texte):
+        texte = unicodedata.normalize("NFC", texte)
+    return texte.replace("’", "'").lower()
+
+
+def detecter_verbes(texte: str, chevauchements: bool = False) -> List[DetectionVerbe]:
+    """
+    Renvoie toutes les occurrences de verbes d'action du lexique de Bloom dans un texte.
+
+    Args:
+        texte (str): Texte brut (objectif, catalogue complet, etc.)
+        chevauchements (bool): Si False, ne garde que l'occurrence la plus longue
+            lorsque plusieurs se recouvrent (« faire corréler » plutôt que « corréler »).
+
+    Returns:
+        list[DetectionVerbe]: Occurrences triées par position, avec leur span
+        (sur le texte fourni, s'il est en NFC) et leurs niveaux candidats.
+    """
+    occurrences = sorted(
+        AUTOMATE_VERBES.parcourir(_normaliser_sans_decalage(texte)),
+        key=lambda occurrence: (occurrence[0], -occurrence[1])
+    )
+    detections = []
+    fin_precedente = -1
+    for debut, fin, forme, _ in occurrences:
+        if not chevauchements and debut < fin_precedente:
+            continue
+        verbe, niveaux = _INFOS_FORMES[forme]
+        detections.append(DetectionVerbe(debut, fin, forme, verbe, niveaux))
+        fin_precedente = max(fin_precedente, fin)
+    return detections
+
+
+def compter_verbes(texte: str, infinitifs_seulement: bool = True) -> int:
+    """Compte les verbes d'action d'un texte (règle « un seul verbe d'action » du critère Mesurable)."""
+    return sum(
+        1 for detection in detecter_verbes(texte)
+        if detection.infinitif or not infinitifs_seulement
+    )
+
+
+def statistiques_verbes(textes: Iterable[str]) -> Dict[str, Dict[str, int]]:
+    """
+    Agrège les verbes détectés sur un ensemble de textes (statistiques de lots, catalogues).
+
+    Returns:
+        dict: {"verbes": {verbe: occurrences}, "niveaux": {niveau: occurrences}}
+    """
+    verbes: Dict[str, int] = {}
+    niveaux: Dict[str, int] = {}
+    for texte in textes:
+        for detection in detecter_verbes(texte):
+            verbes[detection.verbe] = verbes.get(detection.verbe, 0) + 1
+            for niveau in detection.niveaux:
+                niveaux[niveau] = niveaux.get(niveau, 0) + 1
+    return {
+        "verbes": dict(sorted(verbes.items(), key=lambda item: item[1], reverse=True)),
+        "niveaux": dict(sorted(niveaux.items(), key=lambda item: ORDRE_NIVEAUX[item[0]])),
+    }
+
@@ -0,0 +1,151 @@
+"""
+Regroupement des objectifs quasi identiques avant l'envoi au LLM.
+
+Les listes collées contiennent souvent le même objectif plusieurs fois, avec une
+ponctuation, des accents ou une casse différents, ou avec et sans le préambule
+réajouté par nettoyer_objectifs_specifiques. Chaque objectif est réduit à une clé
+normalisée, comparée aux autres par similarité de Jaccard sur des n-grammes de
+caractères. Deux objectifs proches ne sont toutefois rapprochés que s'ils ont
+exactement les mêmes mots (nombres compris) une fois accents et ponctuation
+retirés : « … pour l'exercice 2023 » et « … pour l'exercice 2024 » restent
+distincts. Seul le premier objectif de chaque groupe est transmis au modèle ;
+les autres lui sont rattachés et réapparaissent dans le rapport.
+"""
+
+import re
+import logging
+from dataclasses import replace
+from typing import Dict, FrozenSet, List
+
+from bloom_lexique import normaliser, sans_accents
+from pretraitement_obj_spe import Objectif
+
+logger = logging.getLogger(__name__)
+
+TAILLE_SHINGLE = 4
+# Volontairement élevé : fusionner deux objectifs distincts ferait perdre une évaluation
+SEUIL_SIMILARITE = 0.9
+
+_RE_SEPARATEURS = re.compile(r"[\W_]+")
+
+
+def _texte_normalise(objectif: Objectif) -> str:
+    # Texte sans préambules, en minuscules et sans accents
+    texte = objectif.texte
+    morceaux = []
+    debut = 0
+    for debut_span, fin_span in sorted(span for span in (objectif.span_temps, objectif.span_capacite) if span):
+        morceaux.append(texte[debut:max(debut, debut_span)])
+        debut = max(debut, fin_span)
+    morceaux.append(texte[debut:])
+    return sans_accents(normaliser(" ".join(morceaux)))
+
+
+def cle_normalisee(objectif: Objectif) -> str:
+    """Texte de l'objectif sans préambules, accents, ponctuation, espaces ni majuscules."""
+    # Sans séparateurs, « M.V.C. », « M V C » et « MVC » donnent la même clé
+    return _RE_SEPARATEURS.sub("", _texte_normalise(objectif))
+
+
+def mots_normalises(objectif: Objectif) -> FrozenSet[str]:
+    """Mots de l'objectif (nombres compris), sans préambules, accents, ponctuation ni majuscules."""
+    return frozenset(mot for mot in _RE_SEPARATEURS.split(_texte_normalise(objectif)) if mot)
+
+
+def shingles(cle: str, taille: int = TAILLE_SHINGLE) -> FrozenSet[str]:
+    """N-grammes de caractères d'une clé normalisée."""
+    if len(cle) <= taille:
+        return frozenset((cle,))
+    return frozenset(cle[i:i + taille] for i in range(len(cle) - taille + 1))
+
+
+def similarite(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Indice de Jaccard entre deux ensembles de n-grammes."""
+    if not a or not b:
+        return 0.0
+    commun = len(a & b)
+    return commun / (len(a) + len(b) - commun)
+
+
+def regrouper_doublons(objectifs: List[Objectif], seuil: float = SEUIL_SIMILARITE) -> List[List[Objectif]]:
+    """
+    Regroupe les objectifs quasi identiques.
+
+    Deux objectifs sont rapprochés si leurs clés normalisées sont égales, ou si
+    leurs n-grammes ont une similarité d'au moins `seuil` et qu'ils ont les mêmes
+    verbes d'action et les mêmes mots normalisés : une année, un numéro ou un
+    mot différent suffit à les garder distincts. Les groupes sont fermés par transitivité (union-find).
+
+    Args:
+        objectifs (list[Objectif]): Objectifs dans l'ordre de saisie
+        seuil (float): Similarité de Jaccard minimale
+
+    Returns:
+        list[list[Objectif]]: Groupes dans l'ordre de leur premier membre,
+        chaque groupe gardant l'ordre de saisie
+    """
+    parents = list(range(len(objectifs)))
+
+    def racine(i: int) -> int:
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    def unir(i: int, j: int):
+        ri, rj = racine(i), racine(j)
+        if ri != rj:
+            parents[max(ri, rj)] = min(ri, rj)
+
+    # Clés identiques : regroupement direct, sans comparaison
+    premiers: Dict[str, int] = {}
+    uniques = []
+    mots: Dict[int, FrozenSet[str]] = {}
+    for i, objectif in enumerate(objectifs):
+        cle = cle_normalisee(objectif)
+        if cle in premiers:
+            unir(premiers[cle], i)
+        else:
+            premiers[cle] = i
+            uniques.append((i, shingles(cle)))
+            mots[i] = mots_normalises(objectif)
+
+    # Clés proches : seules les paires partageant au moins un n-gramme sont comparées
+    index: Dict[str, List[int]] = {}
+    ensembles = dict(uniques)
+    for i, ensemble in uniques:
+        candidats = {j for shingle in ensemble for j in index.get(shingle, ())}
+        for j in candidats:
+            if (objectifs[i].verbes == objectifs[j].verbes and mots[i] == mots[j]
+                    and similarite(ensemble, ensembles[j]) >= seuil):
+                unir(j, i)
+        for shingle in ensemble:
+            index.setdefault(shingle, []).append(i)
+
+    groupes: Dict[int, List[Objectif]] = {}
+    for i, objectif in enumerate(objectifs):
+        groupes.setdefault(racine(i), []).append(objectif)
+    return list(groupes.values())
+
+
+def fusionner_doublons(objectifs: List[Objectif], seuil: float = SEUIL_SIMILARITE) -> List[Objectif]:
+    """
+    Ne garde qu'un représentant par groupe de doublons.
+
+    Returns:
+        list[Objectif]: Représentants, les autres membres du groupe étant rangés dans leur champ doublons
+    """
+    representants = [
+        replace(groupe[0], doublons=tuple(groupe[1:])) if len(groupe) > 1 else groupe[0]
+        for groupe in regrouper_doublons(objectifs, seuil)
+    ]
+    if len(representants) < len(objectifs):
+        logger.info(f"{len(objectifs) - len(representants)} doublon(s) regroupé(s), {len(representants)} objectif(s) transmis au LLM")
+    return representants
+
+
+def developper_doublons(representants: List[Objectif]) -> List[Objectif]:
+    """Retrouve la liste complète des objectifs, dans l'ordre de saisie."""
+    objectifs = [membre for representant in representants for membre in (representant, *representant.doublons)]
+    return sorted(objectifs, key=lambda objectif: (objectif.num is not None, objectif.num or 0))
+
@@ -0,0 +1,187 @@
+"""
+Export léger du rapport d'analyse : page HTML autonome ou document JSON.
+
+Même contenu que le PDF (informations du cours, aperçu, tableaux de synthèse
+de build_tables, analyse détaillée, avertissement), sans fpdf2 ni polices :
+quelques millisecondes au lieu d'une mise en page complète, pour les
+utilisateurs qui collent les résultats dans leur LMS. Le Markdown du pipeline
+est découpé par markdown_pdf.decouper_blocs, comme pour le PDF.
+"""
+
+import json
+import logging
+from html import escape
+from typing import Dict, List, Sequence, Tuple
+
+from babel.dates import format_date
+
+from generation_pdf import DonneesRapport, build_tables
+from markdown_pdf import PARAGRAPHE, PUCE, TITRE, decouper_blocs
+
+logger = logging.getLogger(__name__)
+
+# Version du format JSON exporté
+VERSION_EXPORT = 1
+
+AVERTISSEMENT = (
+    "Ces recommandations sont générées automatiquement par un système d'intelligence artificielle. "
+    "Elles visent à guider, non à remplacer l'expertise pédagogique humaine, et doivent être examinées "
+    "avec discernement avant toute utilisation."
+)
+
+_STYLE = """
+body { font-family: "DejaVu Sans", Verdana, sans-serif; font-size: 14px; line-height: 1.5; color: #000; max-width: 50em; margin: 2em auto; padding: 0 1em; }
+h1, h2, h3, h4, h5, h6, .accent { color: #191970; }
+h1 { font-size: 1.6em; text-align: center; }
+h2 { border-left: 4px solid #4682b4; border-bottom: 1px solid #4682b4; background: #fafafa; padding: .3em .6em; margin-top: 2em; }
+.date { text-align: center; color: #646464; font-style: italic; }
+.avertissement { border: 1px solid #191970; background: #f0f0ff; padding: .6em 1em; }
+p { text-align: justify; }
+table { border-collapse: collapse; width: 100%; margin: .5em 0 1.5em; font-size: .9em; }
+caption { text-align: left; font-weight: bold; font-style: italic; color: #505050; padding-bottom: .4em; }
+th, td { border: 1px solid #bbb; padding: .3em .5em; vertical-align: top; }
+th { background: #e6e6e6; }
+"""
+
+# (titre, lignes avec l'en-tête en premier) des tableaux de build_tables
+Tableau = Tuple[str, List[Tuple[str, ...]]]
+
+
+def _tableaux(recap_dict: Dict) -> List[Tableau]:
+    # Ordre du chapitre de synthèse du PDF
+    table_chif, table_axes, table_recom, table_ameliorer, table_conformes = build_tables(recap_dict)
+    return [
+        ("Objectifs à améliorer", table_ameliorer),
+        ("Objectifs satisfaisants", table_conformes),
+        ("Les chiffres clés", table_chif),
+        ("Points forts et axes d'amélioration identifiés", table_axes),
+        ("Recommandations globales", table_recom),
+    ]
+
+
+def _texte(valeur) -> str:
+    # Nœud texte : les guillemets et apostrophes restent lisibles
+    return escape(str(valeur), quote=False)
+
+
+def _segments_html(segments) -> str:
+    return "".join(f"<strong>{_texte(texte)}</strong>" if gras else _texte(texte) for gras, texte in segments)
+
+
+def markdown_html(texte: str) -> str:
+    """
+    Convertit le Markdown du pipeline en HTML, bloc par bloc.
+
+    Args:
+        texte (str): Markdown (titres #, puces - ou *, passages **gras**)
+
+    Returns:
+        str: Fragment HTML
+    """
+    morceaux: List[str] = []
+    dans_liste = False
+    for bloc in decouper_blocs(texte):
+        if dans_liste and bloc.nature != PUCE:
+            morceaux.append("</ul>")
+            dans_liste = False
+        if bloc.nature == TITRE:
+            # Les titres du pipeline sont sous les titres de chapitre (h2)
+            niveau = min(bloc.niveau + 2, 6)
+            morceaux.append(f"<h{niveau}>{_segments_html(bloc.segments)}</h{niveau}>")
+        elif bloc.nature == PUCE:
+            if not dans_liste:
+                morceaux.append("<ul>")
+                dans_liste = True
+            morceaux.append(f"<li>{_segments_html(bloc.segments)}</li>")
+        elif bloc.nature == PARAGRAPHE:
+            classe = ' class="accent"' if bloc.accent else ""
+            morceaux.append(f"<p{classe}>{_segments_html(bloc.segments)}</p>")
+    if dans_liste:
+        morceaux.append("</ul>")
+    return "\n".join(morceaux)
+
+
+def _table_html(numero: int, titre: str, lignes: Sequence[Sequence[str]]) -> str:
+    entete, *corps = lignes
+    return "\n".join([
+        "<table>",
+        f"<caption>Tableau {numero} : {_texte(titre)}</caption>",
+        "<tr>" + "".join(f"<th>{_texte(cellule)}</th>" for cellule in entete) + "</tr>",
+        *("<tr>" + "".join(f"<td>{_texte(cellule)}</td>" for cellule in ligne) + "</tr>" for ligne in corps),
+        "</table>",
+    ])
+
+
+def rapport_html(donnees: DonneesRapport) -> str:
+    """
+    Rend le rapport en une page HTML autonome (styles intégrés, sans ressource externe).
+
+    Args:
+        donnees (DonneesRapport): Informations du cours, rapport et récapitulatif
+
+    Returns:
+        str: Document HTML
+    """
+    titre = f"Rapport d’analyse des objectifs pédagogiques du cours de {donnees.nom_cours}"
+    infos = [("Cours", donnees.nom_cours), ("Niveau", donnees.niveau), ("Public cible", donnees.public)]
+    parties = [
+        "<!DOCTYPE html>",
+        '<html lang="fr">',
+        "<head>",
+        '<meta charset="utf-8">',
+        f"<title>{_texte(titre)}</title>",
+        f"<style>{_STYLE}</style>",
+        "</head>",
+        "<body>",
+        f"<h1>{_texte(titre)}</h1>",
+        f'<p class="date">Date : {format_date(donnees.date_analyse(), format="d MMMM y", locale="fr")}</p>',
+        f'<div class="avertissement"><p class="accent"><strong>AVERTISSEMENT - Contenu généré par IA</strong></p><p>{_texte(AVERTISSEMENT)}</p></div>',
+        "<h2>Chapitre 1 : Rappel des informations de cours</h2>",
+        *(f"<p><strong>{nom} :</strong> {_texte(valeur)}</p>" for nom, valeur in infos),
+        '<p class="accent"><strong>Objectif général :</strong></p>',
+        f"<p>{_texte(donnees.objectif_general)}</p>",
+        '<p class="accent"><strong>Objectifs spécifiques :</strong></p>',
+        "<p>" + _texte(donnees.objectifs_specifiques_brut).replace("\n", "<br>\n") + "</p>",
+        "<h2>Chapitre 2 : Aperçu global de l'analyse</h2>",
+        markdown_html(donnees.rapport["aperçu"]),
+        "<h2>Chapitre 3 : Synthèse des résultats</h2>",
+        *(_table_html(numero, titre_table, lignes) for numero, (titre_table, lignes) in enumerate(_tableaux(donnees.recap_dict), 1)),
+        "<h2>Chapitre 4 : Analyse détaillée</h2>",
+        markdown_html(donnees.rapport["details"]),
+        "</body>",
+        "</html>",
+    ]
+    return "\n".join(parties)
+
+
+def rapport_json(donnees: DonneesRapport) -> str:
+    """
+    Rend le rapport en document JSON : informations du cours, Markdown du pipeline,
+    tableaux de synthèse (lignes indexées par les en-têtes) et récapitulatif brut.
+
+    Args:
+        donnees (DonneesRapport): Informations du cours, rapport et récapitulatif
+
+    Returns:
+        str: Document JSON (UTF-8, indenté)
+    """
+    export = {
+        "version": VERSION_EXPORT,
+        "date": donnees.date_analyse().date().isoformat(),
+        "avertissement": AVERTISSEMENT,
+        "cours": {
+            "nom_cours": donnees.nom_cours,
+            "niveau": donnees.niveau,
+            "public": donnees.public,
+            "objectif_general": donnees.objectif_general,
+            "objectifs_specifiques": donnees.objectifs_specifiques_brut,
+        },
+        "apercu": donnees.rapport["aperçu"],
+        "details": donnees.rapport["details"],
+        "tableaux": [
+            {"titre": titre, "lignes": [dict(zip((colonne.strip() for colonne in lignes[0]), ligne)) for ligne in lignes[1:]]}
+            for titre, lignes in _tableaux(donnees.recap_dict)
+        ],
+        "recapitulatif": donnees.recap_dict,
+    }
+    return json.dumps(export, ensure_ascii=False, indent=2, default=str)
@@ -1,7 +1,10 @@
 import os
+import json
 import asyncio
-from typing import Dict, List, Optional, TypedDict, Annotated
-from dataclasses import dataclass, asdict
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Annotated, Union
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 import logging
 from datetime import datetime
 
@@ -9,48 +12,59 @@ from datetime import datetime
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from langgraph.prebuilt import ToolNode
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 # LangChain imports
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
 from langchain_core.runnables import RunnablePassthrough
 
-# Monitoring
-from langfuse import Langfuse
+# Monitoring : client Langfuse créé au premier usage (voir obtenir_langfuse)
 #from langfuse.langchain import CallbackHandler
 
 # Streamlit (si vous gardez l'interface)
 import streamlit as st
 from dotenv import load_dotenv
 
-# Vos prompts existants
-from prompts import (
-    BASE_CONNAISSANCES_BLOOM,
-    BASE_CONNAISSANCES_PEDAGOGIQUES,
-    PROMPT_CLASSIFICATION_BLOOM,
-    PROMPT_EVALUATION_OBJECTIFS,
-    PROMPT_AUTO_EVAL_EVALUATION,
-    PROMPT_AMELIORER_OBJECTIFS,
-    PROMPT_AUTO_EVAL_SUGGESTIONS,
-    PROMPT_SYNTHESE,
-    PROMPT_RECAPITULATIF
-)
+# Appels simultanés au LLM bornés par clé d'API pour tout le processus
+from admission import appel_llm, appel_llm_async
+
+# Prompts versionnés (voir prompts.py et registre_prompts.py)
+from registre_prompts import VERSION_PAR_DEFAUT, VersionPrompt, obtenir_prompt, estimer_tokens
+from classification_locale import repartir_classification, fusionner_classification
+from score_smart_local import calculer_signaux, formater_faits, verifier_notes, signaux_en_dict, signaux_depuis_dict
+from pretraitement_obj_spe import ID_OBJECTIF_GENERAL, Objectif, creer_objectif
+from references_objectifs import lister_pour_prompt, reattacher_textes
+from doublons import fusionner_doublons, developper_doublons
+from rapport_structure import rendre_evaluation, rendre_suggestions
+from recapitulatif_local import CHAMPS_LIBRES, recapitulatif_depuis_json, recapitulatif_depuis_texte, lister_recommandations
+from schema_recapitulatif import valider_recapitulatif, completer_recapitulatif, schema_partiel
 
 load_dotenv()
 
+# Sorties des étapes conservées dans la trace du rapport final (voir archive_analyses.py)
+SORTIES_ETAPES = (
+    "bloom_classification", "evaluation_objectifs", "evaluation_revisee", "suggestions", "suggestions_revisees",
+    "synthese_finale", "evaluation_structuree", "suggestions_structurees", "signaux_smart", "incoherences_smart"
+)
+
 # Configuration du logging
 #logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Configuration Langfuse
-langfuse = Langfuse(
-    public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
-    secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
-    host=os.getenv("LANGFUSE_HOST")
-)
+@lru_cache(maxsize=None)
+def obtenir_langfuse():
+    """Client Langfuse du processus, créé au premier appel plutôt qu'à l'import du module."""
+    from langfuse import Langfuse
+    return Langfuse(
+        public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
+        secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
+        host=os.getenv("LANGFUSE_HOST")
+    )
 """
 langfuse_handler = CallbackHandler(
     public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
@@ -73,7 +87,7 @@ class AgentState(TypedDict):
     niveau: str
     public: str
     objectif_general: str
-    objectifs_specifiques: List[str]
+    objectifs_specifiques: List[Objectif]
     
     # Résultats intermédiaires
     bloom_classification: Optional[str]
@@ -83,6 +97,17 @@ class AgentState(TypedDict):
     suggestions_revisees: Optional[str]
     synthese_finale: Optional[str]
     
+    # Réponses JSON des versions de prompts structurées (None avec les versions texte)
+    evaluation_structuree: Optional[Dict]
+    suggestions_structurees: Optional[Dict]
+    
+    # Signaux SMART calculés localement et contradictions relevées dans les notes du LLM
+    signaux_smart: Optional[List[Dict]]
+    incoherences_smart: List[str]
+    
+    # Version de prompt, tokens estimés et durée de chaque appel au LLM
+    mesures_prompts: List[Dict]
+    
     # Métadonnées
     messages: Annotated[List, add_messages]
     errors: List[str]
@@ -105,7 +130,10 @@ class PedagogicalAgent:
         # Création du graphe
         self.workflow = self._create_workflow()
         self.app = self.workflow.compile(
-            checkpointer=MemorySaver(),
+            # Les objectifs structurés font partie de l'état sauvegardé par le checkpointer
+            checkpointer=MemorySaver(serde=JsonPlusSerializer(
+                allowed_msgpack_modules=[("pretraitement_obj_spe", "Objectif")]
+            )),
             interrupt_before=[],  # Pas d'interruption par défaut
             debug=False
         )
@@ -120,6 +148,48 @@ class PedagogicalAgent:
             #callbacks=[langfuse_handler]
         )
     
+    @staticmethod
+    def _objectifs(state: AgentState) -> List[Objectif]:
+        """Objectif général puis objectifs spécifiques, sous forme structurée."""
+        return [creer_objectif(ID_OBJECTIF_GENERAL, state["objectif_general"])] + state["objectifs_specifiques"]
+    
+    async def _appeler_llm(self, state: AgentState, etape: str, modele: str, variables: Dict,
+                           version: Optional[VersionPrompt] = None) -> Union[str, Dict]:
+        """
+        Appelle le modèle avec la version de prompt configurée pour l'étape et mesure l'appel.
+        
+        Returns:
+            str | dict: Texte de la réponse, ou objet JSON si la version impose un schéma
+        """
+        version = version or obtenir_prompt(etape)
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", version.systeme),
+            ("human", version.gabarit)
+        ])
+        if version.schema:
+            # Mode JSON du fournisseur : la réponse est contrainte par le schéma
+            modele_json = self.models[modele].bind(response_mime_type="application/json", response_json_schema=version.schema)
+            chain = prompt | modele_json | JsonOutputParser()
+        else:
+            chain = prompt | self.models[modele] | StrOutputParser()
+        
+        async with appel_llm_async(modele):
+            debut = time.perf_counter()
+            result = await chain.ainvoke({**version.valeurs_fixes, **variables})
+        mesure = {
+            "etape": etape,
+            "version": version.version,
+            "tokens_prompt": version.nb_tokens + sum(estimer_tokens(str(valeur)) for valeur in variables.values()),
+            "tokens_reponse": estimer_tokens(result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)),
+            "duree": round(time.perf_counter() - debut, 3)
+        }
+        state["mesures_prompts"].append(mesure)
+        logger.info(
+            f"Prompt {etape} {version.version} : ~{mesure['tokens_prompt']} tokens envoyés, "
+            f"~{mesure['tokens_reponse']} reçus, {mesure['duree']} s"
+        )
+        return result
+    
     def _create_workflow(self) -> StateGraph:
         """Crée le workflow LangGraph"""
         workflow = StateGraph(AgentState)
@@ -217,19 +287,21 @@ class PedagogicalAgent:
         state["current_step"] = "classify_bloom"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en taxonomie de Bloom révisée."),
-                ("human", PROMPT_CLASSIFICATION_BLOOM)
-            ])
-            
-            chain = prompt | self.models["classification"] | StrOutputParser()
-            
-            result = await chain.ainvoke({
-                "base_connaissances": BASE_CONNAISSANCES_BLOOM,
-                "objectif_general": state["objectif_general"],
-                "objectifs_specifiques": "\n".join(f"- {obj}" for obj in state["objectifs_specifiques"])
-            })
-            
+            # Les objectifs au verbe univoque sont classés localement, sans appel au LLM
+            objectif_general, *objectifs_specifiques = self._objectifs(state)
+            repartition = repartir_classification(objectif_general, objectifs_specifiques)
+            
+            result = ""
+            if repartition.appel_llm_necessaire:
+                objectifs_llm = lister_pour_prompt(repartition.specifiques_llm)
+                result = await self._appeler_llm(state, "classification", "classification", {
+                    "objectif_general": state["objectif_general"],
+                    "objectifs_specifiques": objectifs_llm or "Aucun (tous les objectifs spécifiques ont déjà été classés)."
+                })
+            else:
+                logger.info("Tous les objectifs ont été classés localement, appel au LLM évité")
+            
+            result = fusionner_classification(result, repartition)
             state["bloom_classification"] = result
             state["messages"].append(AIMessage(content=f"Classification Bloom terminée: {len(result)} caractères"))
             logger.info("Classification Bloom réussie")
@@ -246,21 +318,24 @@ class PedagogicalAgent:
         state["current_step"] = "evaluate_objectives"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en pédagogie universitaire."),
-                ("human", PROMPT_EVALUATION_OBJECTIFS)
-            ])
-            
-            chain = prompt | self.models["evaluation"] | StrOutputParser()
+            objectifs = self._objectifs(state)
+            signaux = calculer_signaux(objectifs[0], objectifs[1:], state["bloom_classification"])
             
-            result = await chain.ainvoke({
-                "base_connaissances": BASE_CONNAISSANCES_PEDAGOGIQUES,
+            result = await self._appeler_llm(state, "evaluation", "evaluation", {
                 "nom_cours": state["nom_cours"],
                 "niveau": state["niveau"],
                 "public": state["public"],
-                "bloom_classification": state["bloom_classification"]
+                "objectifs": lister_pour_prompt(objectifs),
+                "bloom_classification": state["bloom_classification"],
+                "faits_locaux": formater_faits(signaux)
             })
             
+            if isinstance(result, dict):
+                state["evaluation_structuree"] = result
+                result = rendre_evaluation(result, objectifs)
+            
+            state["signaux_smart"] = signaux_en_dict(signaux)
+            state["incoherences_smart"] = verifier_notes(result, signaux)
             state["evaluation_objectifs"] = result
             state["messages"].append(AIMessage(content="Évaluation des objectifs terminée"))
             logger.info("Évaluation des objectifs réussie")
@@ -277,18 +352,25 @@ class PedagogicalAgent:
         state["current_step"] = "auto_eval_evaluation"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en pédagogie universitaire."),
-                ("human", PROMPT_AUTO_EVAL_EVALUATION)
-            ])
-            
-            chain = prompt | self.models["evaluation"] | StrOutputParser()
-            
-            result = await chain.ainvoke({
-                "base_connaissances": BASE_CONNAISSANCES_PEDAGOGIQUES,
-                "evaluation": state["evaluation_objectifs"]
-            })
-            
+            objectifs = self._objectifs(state)
+            version = obtenir_prompt("auto_eval_evaluation")
+            # Une version JSON révise l'évaluation JSON ; une version texte, sa mise en forme
+            evaluation = state["evaluation_objectifs"]
+            if version.schema and state["evaluation_structuree"]:
+                evaluation = json.dumps(state["evaluation_structuree"], ensure_ascii=False, indent=1)
+            
+            result = await self._appeler_llm(state, "auto_eval_evaluation", "evaluation", {
+                "objectifs": lister_pour_prompt(objectifs),
+                "evaluation": evaluation,
+                "incoherences": "\n".join(f"- {incoherence}" for incoherence in state["incoherences_smart"]) or "Aucun."
+            }, version)
+            
+            state["evaluation_structuree"] = result if isinstance(result, dict) else None
+            if isinstance(result, dict):
+                result = rendre_evaluation(result, objectifs)
+            
+            if state["signaux_smart"]:
+                state["incoherences_smart"] = verifier_notes(result, signaux_depuis_dict(state["signaux_smart"]))
             state["evaluation_revisee"] = result
             state["messages"].append(AIMessage(content="Auto-évaluation terminée"))
             logger.info("Auto-évaluation réussie")
@@ -305,20 +387,28 @@ class PedagogicalAgent:
         state["current_step"] = "generate_suggestions"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en pédagogie universitaire."),
-                ("human", PROMPT_AMELIORER_OBJECTIFS)
-            ])
-            
-            chain = prompt | self.models["suggestion"] | StrOutputParser()
-            
-            result = await chain.ainvoke({
-                "base_connaissances": BASE_CONNAISSANCES_PEDAGOGIQUES,
+            objectifs = self._objectifs(state)
+            version = obtenir_prompt("suggestions")
+            evaluation = state["evaluation_revisee"]
+            if version.schema:
+                if state["evaluation_structuree"]:
+                    evaluation = json.dumps(state["evaluation_structuree"], ensure_ascii=False, indent=1)
+                else:
+                    # Sans évaluation JSON, les notes ne pourraient pas être reprises localement
+                    logger.warning(f"Évaluation non structurée, suggestions demandées avec la version {VERSION_PAR_DEFAUT}")
+                    version = obtenir_prompt("suggestions", VERSION_PAR_DEFAUT)
+            
+            result = await self._appeler_llm(state, "suggestions", "suggestion", {
                 "nom_cours": state["nom_cours"],
                 "niveau": state["niveau"],
                 "public": state["public"],
-                "evaluation_objectifs": state["evaluation_revisee"]
-            })
+                "objectifs": lister_pour_prompt(objectifs),
+                "evaluation_objectifs": evaluation
+            }, version)
+            
+            if isinstance(result, dict):
+                state["suggestions_structurees"] = result
+                result = rendre_suggestions(state["evaluation_structuree"], result, objectifs)
             
             state["suggestions"] = result
             state["messages"].append(AIMessage(content="Suggestions générées"))
@@ -336,15 +426,8 @@ class PedagogicalAgent:
         state["current_step"] = "auto_eval_suggestions"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en pédagogie universitaire."),
-                ("human", PROMPT_AUTO_EVAL_SUGGESTIONS)
-            ])
-            
-            chain = prompt | self.models["suggestion"] | StrOutputParser()
-            
-            result = await chain.ainvoke({
-                "base_connaissances": BASE_CONNAISSANCES_PEDAGOGIQUES,
+            result = await self._appeler_llm(state, "auto_eval_suggestions", "suggestion", {
+                "objectifs": lister_pour_prompt(self._objectifs(state)),
                 "suggestions": state["suggestions"]
             })
             
@@ -364,17 +447,11 @@ class PedagogicalAgent:
         state["current_step"] = "create_synthesis"
         
         try:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "Tu es un expert en pédagogie universitaire."),
-                ("human", PROMPT_SYNTHESE)
-            ])
+            # Utiliser les suggestions finales comme rapport (comme dans le code original),
+            # avec le texte des objectifs réinséré à la place de leurs identifiants
+            rapport = reattacher_textes(state["suggestions"], self._objectifs(state))
             
-            chain = prompt | self.models["synthese"] | StrOutputParser()
-            
-            # Utiliser les suggestions finales comme rapport (comme dans le code original)
-            rapport = state["suggestions"]
-            
-            result = await chain.ainvoke({
+            result = await self._appeler_llm(state, "synthese", "synthese", {
                 "nom_cours": state["nom_cours"],
                 "niveau": state["niveau"],
                 "public": state["public"],
@@ -397,7 +474,7 @@ class PedagogicalAgent:
         try:
             # Format exact du code original
             rapport = f"""
-            {state["suggestions"]}
+            {reattacher_textes(state["suggestions"], self._objectifs(state))}
             """
             
             resultat_final = {
@@ -408,12 +485,23 @@ class PedagogicalAgent:
                 **Objectif général :** 
                     {state["objectif_general"]}
                 **Objectifs specifiques :** 
-                    {state["objectifs_specifiques"]}
+                    {[objectif.texte for objectif in developper_doublons(state["objectifs_specifiques"])]}
                 """,
                 "aperçu": state["synthese_finale"],
                 "details": rapport
             }
             
+            # Récapitulatif construit localement ; seuls ses champs rédigés peuvent demander un appel au LLM
+            resultat_final["recapitulatif"] = await self._construire_recapitulatif(state)
+            
+            # Trace de l'analyse, pour l'archiver et rendre de nouveau le rapport sans appel au LLM
+            resultat_final["trace"] = {
+                "objectifs": [asdict(objectif) for objectif in self._objectifs(state)],
+                "etapes": {cle: state[cle] for cle in SORTIES_ETAPES},
+                "mesures_prompts": state["mesures_prompts"],
+                "erreurs": state["errors"]
+            }
+            
             state["rapport_final"] = resultat_final
             state["messages"].append(AIMessage(content="Rapport final créé avec succès"))
             logger.info("Rapport final créé avec succès")
@@ -424,6 +512,50 @@ class PedagogicalAgent:
             
         return state
     
+    async def _demander_champs_libres(self, state: AgentState, champs: List[str]) -> Dict:
+        """Demande au modèle les seuls champs rédigés indiqués du récapitulatif (dict vide en cas d'échec)."""
+        version = obtenir_prompt("recapitulatif_champs_libres")
+        if len(champs) < len(CHAMPS_LIBRES):
+            version = replace(version, schema=schema_partiel(version.schema, champs))
+        try:
+            return await self._appeler_llm(state, "recapitulatif_champs_libres", "synthese", {
+                "champs": ", ".join(champs),
+                "synthese": state["synthese_finale"],
+                "recommandations": lister_recommandations(state["suggestions"]) or "Aucune."
+            }, version)
+        except Exception as e:
+            # Le récapitulatif reste utilisable sans ses champs rédigés
+            state["errors"].append(f"Erreur champs rédigés du récapitulatif: {str(e)}")
+            logger.warning(f"Champs rédigés du récapitulatif indisponibles: {e}")
+            return {}
+    
+    async def _construire_recapitulatif(self, state: AgentState) -> Dict:
+        """Récapitulatif du rapport : comptes et listes calculés localement, champs rédigés validés un à un."""
+        objectifs = self._objectifs(state)
+        structure = bool(state["evaluation_structuree"] and state["suggestions_structurees"])
+        if structure:
+            bruts = state["suggestions_structurees"]
+        else:
+            bruts = await self._demander_champs_libres(state, list(CHAMPS_LIBRES))
+        
+        champs_libres, manquants = valider_recapitulatif(bruts, CHAMPS_LIBRES)
+        # Relance ciblée : seuls les champs absents ou invalides sont redemandés, et seulement si la
+        # première réponse est arrivée ; un échec complet (déjà signalé) n'est pas relancé
+        if manquants and bruts:
+            logger.info(f"Champs rédigés du récapitulatif redemandés : {', '.join(manquants)}")
+            complements, manquants = valider_recapitulatif(await self._demander_champs_libres(state, manquants), manquants)
+            champs_libres.update(complements)
+        
+        if structure:
+            recap = recapitulatif_depuis_json(
+                state["evaluation_structuree"], state["suggestions_structurees"], objectifs, champs_libres
+            )
+        else:
+            recap = recapitulatif_depuis_texte(
+                state["bloom_classification"], state["evaluation_revisee"], state["suggestions"], objectifs, champs_libres
+            )
+        return completer_recapitulatif(recap)
+    
     async def _handle_error_node(self, state: AgentState) -> AgentState:
         """Nœud de gestion des erreurs"""
         error_msg = f"Erreur dans l'étape {state['current_step']}: {'; '.join(state['errors'])}"
@@ -442,20 +574,35 @@ class PedagogicalAgent:
         
         return state
     
-    async def run_analysis(self, **kwargs) -> Dict:
-        """Lance l'analyse pédagogique"""
+    async def run_analysis(self, progression: Optional[Callable[[str], None]] = None, **kwargs) -> Dict:
+        """
+        Lance l'analyse pédagogique
+        
+        Args:
+            progression: Appelée avec le libellé de chaque étape terminée ; par défaut, affichage st.info
+        """
         initial_state = {
             "nom_cours": kwargs.get("nom_cours", ""),
             "niveau": kwargs.get("niveau", ""),
             "public": kwargs.get("public", ""),
             "objectif_general": kwargs.get("objectif_general", ""),
-            "objectifs_specifiques": kwargs.get("objectifs_specifiques", []),
+            # Les objectifs déjà structurés par nettoyer_objectifs_specifiques sont repris tels quels ;
+            # un seul représentant par groupe de doublons est analysé
+            "objectifs_specifiques": fusionner_doublons([
+                objectif if isinstance(objectif, Objectif) else creer_objectif(f"OS{num}", objectif)
+                for num, objectif in enumerate(kwargs.get("objectifs_specifiques", []), 1)
+            ]),
             "bloom_classification": None,
             "evaluation_objectifs": None,
             "evaluation_revisee": None,
             "suggestions": None,
             "suggestions_revisees": None,
             "synthese_finale": None,
+            "evaluation_structuree": None,
+            "suggestions_structurees": None,
+            "signaux_smart": None,
+            "incoherences_smart": [],
+            "mesures_prompts": [],
             "messages": [HumanMessage(content="Début de l'analyse pédagogique")],
             "errors": [],
             "current_step": "",
@@ -465,6 +612,7 @@ class PedagogicalAgent:
         }
         
         config = {"configurable": {"thread_id": f"analysis_{datetime.now().timestamp()}"}}
+        debut = time.perf_counter()
         
         try:
             # Exécution asynchrone du workflow
@@ -483,15 +631,21 @@ class PedagogicalAgent:
                         # Log the state for the current step
                         logger.debug(f"Step: {step_name}, State: {node_state}")
 
-                        if hasattr(st, 'info'):  # Si Streamlit est disponible
+                        if progression is not None:
+                            # Analyse exécutée hors du script Streamlit (voir taches_analyse.py)
+                            progression(step_name)
+                        elif hasattr(st, 'info'):  # Si Streamlit est disponible
                             st.info(f" {step_name}...")
             
             # Récupération du résultat final
             final_state = await self.app.aget_state(config)
-            return final_state.values.get("rapport_final", {
+            rapport_final = final_state.values.get("rapport_final", {
                 "error": True,
                 "message": "Aucun résultat produit"
             })
+            if rapport_final and "trace" in rapport_final:
+                rapport_final["trace"]["duree"] = round(time.perf_counter() - debut, 3)
+            return rapport_final
             
         except Exception as e:
             logger.error(f"Erreur lors de l'exécution du workflow: {e}")
@@ -502,8 +656,8 @@ class PedagogicalAgent:
             }
 
 # Fonction d'interface pour Streamlit
-def assistant_pedagogique(nom_cours, niveau, public, objectif_general, objectifs_specifiques):
-    """Interface pour Streamlit utilisant LangGraph"""
+def assistant_pedagogique(nom_cours, niveau, public, objectif_general, objectifs_specifiques, progression=None):
+    """Interface pour Streamlit utilisant LangGraph (progression : voir PedagogicalAgent.run_analysis)"""
     agent = PedagogicalAgent()
     
     # Exécution synchrone pour Streamlit
@@ -517,13 +671,36 @@ def assistant_pedagogique(nom_cours, niveau, public, objectif_general, objectifs
                 niveau=niveau,
                 public=public,
                 objectif_general=objectif_general,
-                objectifs_specifiques=objectifs_specifiques
+                objectifs_specifiques=objectifs_specifiques,
+                progression=progression
             )
         )
         return result
     finally:
         loop.close()
 
+def analyser_en_lot(cours: Iterable[Dict]) -> Iterator[Tuple[Dict, Dict]]:
+    """
+    Analyse une suite de cours avec un même agent et une même boucle d'événements.
+
+    Args:
+        cours: Paramètres de chaque cours (voir CoursCatalogue.en_parametres),
+            consommés au fur et à mesure, par exemple depuis importer_catalogue
+
+    Yields:
+        tuple: (paramètres du cours, rapport produit par run_analysis, trace comprise)
+    """
+    agent = PedagogicalAgent()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        for parametres in cours:
+            logger.info(f"Analyse en lot : {parametres.get('nom_cours', '')}")
+            yield parametres, loop.run_until_complete(agent.run_analysis(**parametres))
+    finally:
+        loop.close()
+
 def recapitulatif(rapport: str) -> str:
 
     model = ChatGoogleGenerativeAI(
@@ -534,9 +711,36 @@ def recapitulatif(rapport: str) -> str:
         #callbacks=[langfuse_handler]
     )
 
-    prompt_template = ChatPromptTemplate.from_template(PROMPT_RECAPITULATIF)
+    prompt_template = ChatPromptTemplate.from_template(obtenir_prompt("recapitulatif").gabarit)
 
     chain = prompt_template | model | StrOutputParser()
 
-    return chain.invoke({"rapport": rapport})
+    with appel_llm("synthese"):
+        return chain.invoke({"rapport": rapport})
+
+def recapitulatif_champs(synthese: str, champs: List[str]) -> Dict:
+    """
+    Relance ciblée : demande au modèle les seuls champs rédigés manquants d'un récapitulatif.
+
+    Args:
+        synthese (str): Aperçu global du rapport
+        champs (list[str]): Champs de CHAMPS_LIBRES à produire
+    """
+    version = obtenir_prompt("recapitulatif_champs_libres")
+
+    model = ChatGoogleGenerativeAI(
+        model="gemini-2.0-flash",
+        google_api_key=os.getenv("GEMINI_API_KEY_RECAP_SYNTHESE"),
+        temperature=0.4,
+    ).bind(response_mime_type="application/json", response_json_schema=schema_partiel(version.schema, champs))
+
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", version.systeme),
+        ("human", version.gabarit)
+    ])
+
+    chain = prompt_template | model | JsonOutputParser()
+
+    with appel_llm("synthese"):
+        return chain.invoke({"champs": ", ".join(champs), "synthese": synthese, "recommandations": "Aucune."})
 
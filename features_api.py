@@ -1,6 +1,7 @@
 import os
 import streamlit as st
 from dotenv import load_dotenv
+from registre_prompts import BASES_CONNAISSANCES
 import logging
 from langfuse import Langfuse, observe
 from google.generativeai import GenerativeModel
@@ -100,28 +101,7 @@ def appeler_api(prompt, api_key, system_prompt="Tu es un expert en pédagogie un
 
 #@st.cache_data(show_spinner=False)
 def classifier_objectifs(objectif_general, objectifs_specifiques):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    Voici la taxonomie de Bloom et ses niveaux, du niveau inférieur au niveau supérieur, avec l'explication du niveau et des exemples de verbes d'action pour libeller les objectifs correspondants à chacun de ces niveaux :
-      Connaître :
-        Explication : Restituer avec justesse l’information ou procédure apprise. Collecter de l’information, la mémoriser, l’identifier, la reconnaître, la discriminer.
-        Verbes : Assigner, associer, caractériser, cataloguer, citer, collecter, décrire, définir, délimiter, désigner, déterminer, enregistrer, énumérer, établir, étiqueter, examiner, expérimenter, identifier, indiquer, inventorier, lister, mémoriser, montrer, localiser, nommer, ordonner, rappeler, réciter, répéter, reconnaître, reproduire, sélectionner, situer, etc.
-      Comprendre :
-        Explication : Interpréter ou décrire des informations. Expliquer un concept de manière intelligible. Synthétiser un sujet. Expliciter un raisonnement. Illustrer des arguments.
-        Verbes : Associer, classer, comparer, compléter, conclure, contextualiser, convertir, décrire, démontrer, déterminer, différencier, dire dans ses mots, discuter, distinguer, estimer, établir, expliquer, exprimer, extrapoler, faire une analogie, généraliser, identifier, illustrer (à l’aide d’exemples), inférer, interpréter, localiser, ordonner, paraphraser, préciser, prédire, préparer, rapporter, réarranger, redéfinir, réécrire, reformuler, regrouper, réorganiser, représenter, résumer, sélectionner, schématiser, situer, traduire, etc.
-      Appliquer :
-        Explication : Résoudre des problèmes en suivant une procédure établie. Calculer. Appliquer une méthode. Accomplir une tâche selon des règles. Manifester une attitude adéquate.
-        Verbes : Acter, adapter, administrer, appliquer, assembler, calculer, choisir, classer, classifier, compléter, construire, contrôler, découvrir, démontrer, dessiner, déterminer, développer, employer, établir, exécuter, expérimenter, formuler, fournir, généraliser, gérer, illustrer, implanter, informer, interpréter, jouer, manipuler, mesurer, mettre en pratique, modifier, montrer, opérer, organiser, participer, planifier, pratiquer, préparer, produire, rédiger, relier, résoudre, restructurer, schématiser, simuler, traiter, transférer, trouver, utiliser, etc.
-      Analyser :
-        Explication : Résoudre des problèmes. Repérer les éléments d’une situation et comprendre leurs relations. Examiner des faits en isolant les causes. Interpréter des données. Percevoir des tendances.
-        Verbes : Analyser, arranger, attribuer, catégoriser, choisir, classer, cibler, comparer, contraster, corréler, critiquer, décomposer, découper, déduire, délimiter, détecter, différencier, discriminer, disséquer, distinguer, diviser, examiner, expérimenter, expliquer, faire corréler, faire ressortir, générer, identifier, inférer, interpréter, limiter, mettre en priorité, mettre en relation, modéliser, morceler, nuancer, organiser, opposer, questionner, rechercher, relier, séparer, subdiviser, tester, etc.
-      Évaluer :
-        Explication : Porter un jugement critique personnel fondé sur des critères variés. Valider des théories. Analyser une situation afin de prendre des décisions et de les justifier.
-        Verbes : Apprécier, appuyer, argumenter, attaquer, choisir, classer, comparer, conclure, considérer, contraster, contrôler, convaincre, critiquer, décider, déduire, défendre, déterminer, estimer, évaluer, expliquer, juger, justifier, mesurer, noter, persuader, prédire, produire, recadrer, recommander, résumer, sélectionner, soupeser, soutenir, standardiser, tester, valider, vérifier, etc.
-      Créer :
-        Explication : Mobiliser ses apprentissages pour former un tout cohérent et nouveau. Générer de nouvelles idées. Produire une œuvre personnelle. Créer une production originale. Élaborer un plan d’action personnalisé.
-        Verbes : Adapter, agencer, anticiper, arranger, assembler, classer, collecter, combiner, commenter, composer, concevoir, constituer, construire, créer, déduire, dériver, développer, discuter, écrire, élaborer, exposer, formuler, généraliser, générer, imaginer, incorporer, innover, intégrer, inventer, mettre en place, modifier, organiser, planifier, préparer, produire, projeter, proposer, raconter, relater, rédiger, réorganiser, schématiser, structurer, substituer, synthétiser, transmettre, etc.
-    """
+  base_connaissances = BASES_CONNAISSANCES["bloom"]
 
   prompt = f"""
     {base_connaissances}
@@ -147,44 +127,7 @@ def classifier_objectifs(objectif_general, objectifs_specifiques):
 
 #@st.cache_data(show_spinner=False)
 def evaluer_objectifs(nom_cours, niveau, public, bloom_classification):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    RAPPELS PEDAGOGIQUES :
-      Les objectifs doivent remplir les critères suivants :
-        - Spécifique: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïtë, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es. Les comportements attendus doivent être définis dans des contextes et des conditions spécifiques d'application.
-        - Mesurable: Il doit être possible de mesurer l'avancement vers l'objectif. L'objectif doit permettre une évaluation précise des acquis grâce à l’utilisation de verbes d’action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir). Il doit contenir **un seul** verbe **d'action** afin de cibler précisément ce que l'apprenant devra faire, à l'exception de l'objectif **général**. 
-        - Approprié (Cohérent): L'objectif doit être pertinent et cohérent avec le cours (se référer au nom du cours), le niveau d'étude, le public cible, le programme, son intention pédagogique si présente et son objectif général.  L'objectif, s'il s'agit d'un objectif enregistré comme 'objectif spécifique' à l'entrée  ( il ne s'agit pas là de son niveau de spécificité évalué) doit être d'un niveau (selon la taxonomie de Bloom) inférieur ou égal à celui de l'objectif général.
-        - Réaliste: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-        - Temporellement défini: L'objectif doit avoir un échéancier clair, avec un début et une fin, ou des jalons intermédiaires.
-
-        L'ensemble des objectifs spécifiques doivent remplir le critère de Complétude, c'est-à-dire que l'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif global/général.
-
-
-      Ils doivent suivre les règles de rédaction suivantes :
-        Délai + L’apprenant·e sera capable de + Verbe d’action + Quoi ? (contenu) + Comment ? (contexte)
-        - Précisez le délai : Au terme de l’activité d’apprentissage..., À la fin du TP..., À l’issue de l’unité d’enseignement..., etc.
-        - Centrez votre énoncé sur l’apprenant·e : Décrire le résultat produit par l’apprenant·e : ex: L’apprenant·e sera capable de …, L’étudiant·e est en mesure de …, etc. Et PAS l’intention pédagogique de l’enseignant·e :ex: Le cours permet de …, Le cours a pour objectif de présenter…, À l’issue du TP, les étudiants auront eu l’occasion de…, L’unité d’enseignement porte sur …, etc.
-        - Utilisez un verbe d’action (un seul par objectif) qui décrit ce que l’étudiant·e doit pouvoir démontrer : Évitez les verbes difficilement évaluables. Choisissez un verbe qui décrit un comportement observable et mesurable.
-          À l’issue du cours, l’apprenant·e sera capable de :
-          – plutôt que connaître → restituer, énumérer, lister, nommer …
-          – plutôt que comprendre → expliquer, illustrer, schématiser…
-          – plutôt que maîtriser → appliquer, réaliser, évaluer …
-        - Indiquez le contenu ou la procédure sur lequel porte le verbe d’action :
-          - À l’issue du cours, les étudiant·es seront capables de décrire les structures anatomiques, leur situation et leur fonction
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une attitude bienveillante
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique
-        - Décrivez le niveau d’exigence et le contexte dans lequel l’étudiant·e doit être capable de manifester le comportement : Donner des informations sur le contexte implique de se questionner dès le départ sur l’évaluation et ses modalités. Préciser les éléments contextuels et le niveau d’exigence permet aux apprenant·es de savoir très clairement les tâches qu’ils seront amenés à réaliser lors de l’évaluation.
-          – La situation dans laquelle l’apprenant·e doit manifester le comportement attendu : réelle, simulée, crayon-papier, en laboratoire …
-          – Le matériel ou les ressources à exploiter pour réaliser l’action : texte, vignette clinique, résultats d’analyses biomédicales, paramètres, données statistiques, dossier médical, programme informatique …
-          – Le caractère individuel ou collectif : seul, en binôme, en groupe.
-          – Le temps disponible pour réaliser la tâche
-          – Le niveau de performance attendu : degré de précision, la qualité du résultat …
-          Par exemple :
-          - À l’issue du cours, les étudiant·e·s seront capables de décrire de MANIERE EXHAUSTIVE les structures anatomiques, leur situation et leur fonction AU DEPART DE SPECIMEN EN 3 DIMENSIONS.
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une posture bienveillante EN UTILISANT UN LANGAGE NON STIGMATISANT À L'EGARD DES PERSONNES PRESENTANT DES ASSUETUDES EN CONSULTATION.
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique SUR UN MANNEQUIN HAUTE TECHNICITE EN RESPECTANT CHAQUE ETAPE DE LA PROCEDURE EN VIGUEUR.
-
-    """
+  base_connaissances = BASES_CONNAISSANCES["pedagogique"]
 
   prompt = f"""
     Base de connaissances : {base_connaissances}
@@ -223,44 +166,7 @@ def evaluer_objectifs(nom_cours, niveau, public, bloom_classification):
 
 #@st.cache_data(show_spinner=False)
 def auto_eval_evaluation(evaluation):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    RAPPELS PEDAGOGIQUES :
-      Les objectifs doivent remplir les critères suivants :
-        - Spécifique: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïtë, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es. Il doit contenir **un seul** verbe **d'action** afin de cibler précisément ce que l'apprenant devra faire, à l'exception de l'objectif **général**. Les comportements attendus doivent être définis dans des contextes et des conditions spécifiques d'application.
-        - Mesurable: Il doit être possible de mesurer l'avancement vers l'objectif. L'objectif doit permettre une évaluation précise des acquis grâce à l’utilisation de verbes d’action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir)
-        - Approprié (Cohérent): L'objectif doit être pertinent et cohérent avec le cours (se référer au nom du cours), le niveau d'étude, le public cible, le programme, son intention pédagogique si présente et son objectif général.  L'objectif, s'il s'agit d'un objectif enregistré comme 'objectif spécifique' à l'entrée  ( il ne s'agit pas là de son niveau de spécificité évalué) doit être d'un niveau (selon la taxonomie de Bloom) inférieur ou égal à celui de l'objectif général.
-        - Réaliste: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-        - Temporellement défini: L'objectif doit avoir un échéancier clair, avec un début et une fin, ou des jalons intermédiaires.
-
-        L'ensemble des objectifs spécifiques doivent remplir le critère de Complétude, c'est-à-dire que l'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif global/général.
-
-
-      Ils doivent suivre les règles de rédaction suivantes :
-        Délai + L’apprenant·e sera capable de + Verbe d’action + Quoi ? (contenu) + Comment ? (contexte)
-        - Précisez le délai : Au terme de l’activité d’apprentissage..., À la fin du TP..., À l’issue de l’unité d’enseignement..., etc.
-        - Centrez votre énoncé sur l’apprenant·e : Décrire le résultat produit par l’apprenant·e : ex: L’apprenant·e sera capable de …, L’étudiant·e est en mesure de …, etc. Et PAS l’intention pédagogique de l’enseignant·e :ex: Le cours permet de …, Le cours a pour objectif de présenter…, À l’issue du TP, les étudiants auront eu l’occasion de…, L’unité d’enseignement porte sur …, etc.
-        - Utilisez un verbe d’action (un seul par objectif) qui décrit ce que l’étudiant·e doit pouvoir démontrer : Évitez les verbes difficilement évaluables. Choisissez un verbe qui décrit un comportement observable et mesurable.
-          À l’issue du cours, l’apprenant·e sera capable de :
-          – plutôt que connaître → restituer, énumérer, lister, nommer …
-          – plutôt que comprendre → expliquer, illustrer, schématiser…
-          – plutôt que maîtriser → appliquer, réaliser, évaluer …
-        - Indiquez le contenu ou la procédure sur lequel porte le verbe d’action :
-          - À l’issue du cours, les étudiant·es seront capables de décrire les structures anatomiques, leur situation et leur fonction
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une attitude bienveillante
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique
-        - Décrivez le niveau d’exigence et le contexte dans lequel l’étudiant·e doit être capable de manifester le comportement : Donner des informations sur le contexte implique de se questionner dès le départ sur l’évaluation et ses modalités. Préciser les éléments contextuels et le niveau d’exigence permet aux apprenant·es de savoir très clairement les tâches qu’ils seront amenés à réaliser lors de l’évaluation.
-          – La situation dans laquelle l’apprenant·e doit manifester le comportement attendu : réelle, simulée, crayon-papier, en laboratoire …
-          – Le matériel ou les ressources à exploiter pour réaliser l’action : texte, vignette clinique, résultats d’analyses biomédicales, paramètres, données statistiques, dossier médical, programme informatique …
-          – Le caractère individuel ou collectif : seul, en binôme, en groupe.
-          – Le temps disponible pour réaliser la tâche
-          – Le niveau de performance attendu : degré de précision, la qualité du résultat …
-          Par exemple :
-          - À l’issue du cours, les étudiant·e·s seront capables de décrire de MANIERE EXHAUSTIVE les structures anatomiques, leur situation et leur fonction AU DEPART DE SPECIMEN EN 3 DIMENSIONS.
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une posture bienveillante EN UTILISANT UN LANGAGE NON STIGMATISANT À L'EGARD DES PERSONNES PRESENTANT DES ASSUETUDES EN CONSULTATION.
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique SUR UN MANNEQUIN HAUTE TECHNICITE EN RESPECTANT CHAQUE ETAPE DE LA PROCEDURE EN VIGUEUR.
-
-    """
+  base_connaissances = BASES_CONNAISSANCES["pedagogique-gemini-auto-eval"]
 
   prompt = f"""
     Base de connaissances : {base_connaissances}
@@ -284,44 +190,7 @@ def auto_eval_evaluation(evaluation):
 
 #@st.cache_data(show_spinner=False)
 def ameliorer_objectifs(nom_cours, niveau, public, evaluation_objectifs):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    RAPPELS PEDAGOGIQUES :
-      Les objectifs doivent remplir les critères suivants :
-        - Spécifique: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïtë, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es. Les comportements attendus doivent être définis dans des contextes et des conditions spécifiques d'application.
-        - Mesurable: Il doit être possible de mesurer l'avancement vers l'objectif. L'objectif doit permettre une évaluation précise des acquis grâce à l’utilisation de verbes d’action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir). Il doit contenir **un seul** verbe **d'action** afin de cibler précisément ce que l'apprenant devra faire, à l'exception de l'objectif **général**.
-        - Approprié (Cohérent): L'objectif doit être pertinent et cohérent avec le cours (se référer au nom du cours), le niveau d'étude, le public cible, le programme, son intention pédagogique si présente et son objectif général.  L'objectif, s'il s'agit d'un objectif enregistré comme 'objectif spécifique' à l'entrée  ( il ne s'agit pas là de son niveau de spécificité évalué) doit être d'un niveau (selon la taxonomie de Bloom) inférieur ou égal à celui de l'objectif général.
-        - Réaliste: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-        - Temporellement défini: L'objectif doit avoir un échéancier clair, avec un début et une fin, ou des jalons intermédiaires.
-
-        L'ensemble des objectifs spécifiques doivent remplir le critère de Complétude, c'est-à-dire que l'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif global/général.
-
-
-      Ils doivent suivre les règles de rédaction suivantes :
-        Délai + L’apprenant·e sera capable de + Verbe d’action + Quoi ? (contenu) + Comment ? (contexte)
-        - Précisez le délai : Au terme de l’activité d’apprentissage..., À la fin du TP..., À l’issue de l’unité d’enseignement..., etc.
-        - Centrez votre énoncé sur l’apprenant·e : Décrire le résultat produit par l’apprenant·e : ex: L’apprenant·e sera capable de …, L’étudiant·e est en mesure de …, etc. Et PAS l’intention pédagogique de l’enseignant·e :ex: Le cours permet de …, Le cours a pour objectif de présenter…, À l’issue du TP, les étudiants auront eu l’occasion de…, L’unité d’enseignement porte sur …, etc.
-        - Utilisez un verbe d’action (un seul par objectif) qui décrit ce que l’étudiant·e doit pouvoir démontrer : Évitez les verbes difficilement évaluables. Choisissez un verbe qui décrit un comportement observable et mesurable.
-          À l’issue du cours, l’apprenant·e sera capable de :
-          – plutôt que connaître → restituer, énumérer, lister, nommer …
-          – plutôt que comprendre → expliquer, illustrer, schématiser…
-          – plutôt que maîtriser → appliquer, réaliser, évaluer …
-        - Indiquez le contenu ou la procédure sur lequel porte le verbe d’action :
-          - À l’issue du cours, les étudiant·es seront capables de décrire les structures anatomiques, leur situation et leur fonction
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une attitude bienveillante
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique
-        - Décrivez le niveau d’exigence et le contexte dans lequel l’étudiant·e doit être capable de manifester le comportement : Donner des informations sur le contexte implique de se questionner dès le départ sur l’évaluation et ses modalités. Préciser les éléments contextuels et le niveau d’exigence permet aux apprenant·es de savoir très clairement les tâches qu’ils seront amenés à réaliser lors de l’évaluation.
-          – La situation dans laquelle l’apprenant·e doit manifester le comportement attendu : réelle, simulée, crayon-papier, en laboratoire …
-          – Le matériel ou les ressources à exploiter pour réaliser l’action : texte, vignette clinique, résultats d’analyses biomédicales, paramètres, données statistiques, dossier médical, programme informatique …
-          – Le caractère individuel ou collectif : seul, en binôme, en groupe.
-          – Le temps disponible pour réaliser la tâche
-          – Le niveau de performance attendu : degré de précision, la qualité du résultat …
-          Par exemple :
-          - À l’issue du cours, les étudiant·e·s seront capables de décrire de MANIERE EXHAUSTIVE les structures anatomiques, leur situation et leur fonction AU DEPART DE SPECIMEN EN 3 DIMENSIONS.
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une posture bienveillante EN UTILISANT UN LANGAGE NON STIGMATISANT À L'EGARD DES PERSONNES PRESENTANT DES ASSUETUDES EN CONSULTATION.
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique SUR UN MANNEQUIN HAUTE TECHNICITE EN RESPECTANT CHAQUE ETAPE DE LA PROCEDURE EN VIGUEUR.
-
-    """
+  base_connaissances = BASES_CONNAISSANCES["pedagogique"]
 
   prompt = f"""
       Base de connaissances : {base_connaissances}
@@ -373,44 +242,7 @@ def ameliorer_objectifs(nom_cours, niveau, public, evaluation_objectifs):
 
 #@st.cache_data(show_spinner=False)
 def auto_eval_suggestions(suggestions):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    RAPPELS PEDAGOGIQUES :
-      Les objectifs doivent remplir les critères suivants :
-        - Spécifique: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïtë, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es. Les comportements attendus doivent être définis dans des contextes et des conditions spécifiques d'application.
-        - Mesurable: Il doit être possible de mesurer l'avancement vers l'objectif. L'objectif doit permettre une évaluation précise des acquis grâce à l’utilisation de verbes d’action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir). Il doit contenir **un seul** verbe **d'action** afin de cibler précisément ce que l'apprenant devra faire, à l'exception de l'objectif **général**.
-        - Approprié (Cohérent): L'objectif doit être pertinent et cohérent avec le cours (se référer au nom du cours), le niveau d'étude, le public cible, le programme, son intention pédagogique si présente et son objectif général.  L'objectif, s'il s'agit d'un objectif enregistré comme 'objectif spécifique' à l'entrée  ( il ne s'agit pas là de son niveau de spécificité évalué) doit être d'un niveau (selon la taxonomie de Bloom) inférieur ou égal à celui de l'objectif général.
-        - Réaliste: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-        - Temporellement défini: L'objectif doit avoir un échéancier clair, avec un début et une fin, ou des jalons intermédiaires.
-
-        L'ensemble des objectifs spécifiques doivent remplir le critère de Complétude, c'est-à-dire que l'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif global/général.
-
-
-      Ils doivent suivre les règles de rédaction suivantes :
-        Délai + L’apprenant·e sera capable de + Verbe d’action + Quoi ? (contenu) + Comment ? (contexte)
-        - Précisez le délai : Au terme de l’activité d’apprentissage..., À la fin du TP..., À l’issue de l’unité d’enseignement..., etc.
-        - Centrez votre énoncé sur l’apprenant·e : Décrire le résultat produit par l’apprenant·e : ex: L’apprenant·e sera capable de …, L’étudiant·e est en mesure de …, etc. Et PAS l’intention pédagogique de l’enseignant·e :ex: Le cours permet de …, Le cours a pour objectif de présenter…, À l’issue du TP, les étudiants auront eu l’occasion de…, L’unité d’enseignement porte sur …, etc.
-        - Utilisez un verbe d’action (un seul par objectif) qui décrit ce que l’étudiant·e doit pouvoir démontrer : Évitez les verbes difficilement évaluables. Choisissez un verbe qui décrit un comportement observable et mesurable.
-          À l’issue du cours, l’apprenant·e sera capable de :
-          – plutôt que connaître → restituer, énumérer, lister, nommer …
-          – plutôt que comprendre → expliquer, illustrer, schématiser…
-          – plutôt que maîtriser → appliquer, réaliser, évaluer …
-        - Indiquez le contenu ou la procédure sur lequel porte le verbe d’action :
-          - À l’issue du cours, les étudiant·es seront capables de décrire les structures anatomiques, leur situation et leur fonction
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une attitude bienveillante
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique
-        - Décrivez le niveau d’exigence et le contexte dans lequel l’étudiant·e doit être capable de manifester le comportement : Donner des informations sur le contexte implique de se questionner dès le départ sur l’évaluation et ses modalités. Préciser les éléments contextuels et le niveau d’exigence permet aux apprenant·es de savoir très clairement les tâches qu’ils seront amenés à réaliser lors de l’évaluation.
-          – La situation dans laquelle l’apprenant·e doit manifester le comportement attendu : réelle, simulée, crayon-papier, en laboratoire …
-          – Le matériel ou les ressources à exploiter pour réaliser l’action : texte, vignette clinique, résultats d’analyses biomédicales, paramètres, données statistiques, dossier médical, programme informatique …
-          – Le caractère individuel ou collectif : seul, en binôme, en groupe.
-          – Le temps disponible pour réaliser la tâche
-          – Le niveau de performance attendu : degré de précision, la qualité du résultat …
-          Par exemple :
-          - À l’issue du cours, les étudiant·e·s seront capables de décrire de MANIERE EXHAUSTIVE les structures anatomiques, leur situation et leur fonction AU DEPART DE SPECIMEN EN 3 DIMENSIONS.
-          - À l’issue de la formation, le/la médecin sera capable d’adopter une posture bienveillante EN UTILISANT UN LANGAGE NON STIGMATISANT À L'EGARD DES PERSONNES PRESENTANT DES ASSUETUDES EN CONSULTATION.
-          - À l’issue de la séance, l’apprenant·e sera capable de réaliser une aspiration trachéobronchique SUR UN MANNEQUIN HAUTE TECHNICITE EN RESPECTANT CHAQUE ETAPE DE LA PROCEDURE EN VIGUEUR.
-
-    """
+  base_connaissances = BASES_CONNAISSANCES["pedagogique"]
 
   prompt = f"""
     Base de connaissances : {base_connaissances}
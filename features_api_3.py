@@ -2,6 +2,7 @@ import os
 import streamlit as st
 from mistralai import Mistral
 from dotenv import load_dotenv
+from registre_prompts import BASES_CONNAISSANCES
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -45,28 +46,7 @@ def appeler_api(prompt, system_prompt="Tu es un expert en pédagogie universitai
 
 @st.cache_data(show_spinner=False)
 def classifier_objectifs(objectif_general, objectifs_specifiques):
-  base_connaissances = """
-    Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-    Voici la taxonomie de Bloom et ses niveaux, du niveau inférieur au niveau supérieur, avec l'explication du niveau et des exemples de verbes d'action pour libeller les objectifs correspondants à chacun de ces niveaux :
-      Connaître :
-        Explication : Restituer avec justesse l’information ou procédure apprise. Collecter de l’information, la mémoriser, l’identifier, la reconnaître, la discriminer.
-        Verbes : Assigner, associer, caractériser, cataloguer, citer, collecter, décrire, définir, délimiter, désigner, déterminer, enregistrer, énumérer, établir, étiqueter, examiner, expérimenter, identifier, indiquer, inventorier, lister, mémoriser, montrer, localiser, nommer, ordonner, rappeler, réciter, répéter, reconnaître, reproduire, sélectionner, situer, etc.
-      Comprendre :
-        Explication : Interpréter ou décrire des informations. Expliquer un concept de manière intelligible. Synthétiser un sujet. Expliciter un raisonnement. Illustrer des arguments.
-        Verbes : Associer, classer, comparer, compléter, conclure, contextualiser, convertir, décrire, démontrer, déterminer, différencier, dire dans ses mots, discuter, distinguer, estimer, établir, expliquer, exprimer, extrapoler, faire une analogie, généraliser, identifier, illustrer (à l’aide d’exemples), inférer, interpréter, localiser, ordonner, paraphraser, préciser, prédire, préparer, rapporter, réarranger, redéfinir, réécrire, reformuler, regrouper, réorganiser, représenter, résumer, sélectionner, schématiser, situer, traduire, etc.
-      Appliquer :
-        Explication : Résoudre des problèmes en suivant une procédure établie. Calculer. Appliquer une méthode. Accomplir une tâche selon des règles. Manifester une attitude adéquate.
-        Verbes : Acter, adapter, administrer, appliquer, assembler, calculer, choisir, classer, classifier, compléter, construire, contrôler, découvrir, démontrer, dessiner, déterminer, développer, employer, établir, exécuter, expérimenter, formuler, fournir, généraliser, gérer, illustrer, implanter, informer, interpréter, jouer, manipuler, mesurer, mettre en pratique, modifier, montrer, opérer, organiser, participer, planifier, pratiquer, préparer, produire, rédiger, relier, résoudre, restructurer, schématiser, simuler, traiter, transférer, trouver, utiliser, etc.
-      Analyser :
-        Explication : Résoudre des problèmes. Repérer les éléments d’une situation et comprendre leurs relations. Examiner des faits en isolant les causes. Interpréter des données. Percevoir des tendances.
-        Verbes : Analyser, arranger, attribuer, catégoriser, choisir, classer, cibler, comparer, contraster, corréler, critiquer, décomposer, découper, déduire, délimiter, détecter, différencier, discriminer, disséquer, distinguer, diviser, examiner, expérimenter, expliquer, faire corréler, faire ressortir, générer, identifier, inférer, interpréter, limiter, mettre en priorité, mettre en relation, modéliser, morceler, nuancer, organiser, opposer, questionner, rechercher, relier, séparer, subdiviser, tester, etc.
-      Évaluer :
-        Explication : Porter un jugement critique personnel fondé sur des critères variés. Valider des théories. Analyser une situation afin de prendre des décisions et de les justifier.
-        Verbes : Apprécier, appuyer, argumenter, attaquer, choisir, classer, comparer, conclure, considérer, contraster, contrôler, convaincre, critiquer, décider, déduire, défendre, déterminer, estimer, évaluer, expliquer, juger, justifier, mesurer, noter, persuader, prédire, produire, recadrer, recommander, résumer, sélectionner, soupeser, soutenir, standardiser, tester, valider, vérifier, etc.
-      Créer :
-        Explication : Mobiliser ses apprentissages pour former un tout cohérent et nouveau. Générer de nouvelles idées. Produire une œuvre personnelle. Créer une production originale. Élaborer un plan d’action personnalisé.
-        Verbes : Adapter, agencer, anticiper, arranger, assembler, classer, collecter, combiner, commenter, composer, concevoir, constituer, construire, créer, déduire, dériver, développer, discuter, écrire, élaborer, exposer, formuler, généraliser, générer, imaginer, incorporer, innover, intégrer, inventer, mettre en place, modifier, organiser, planifier, préparer, produire, projeter, proposer, raconter, relater, rédiger, réorganiser, schématiser, structurer, substituer, synthétiser, transmettre, etc.
-    """
+  base_connaissances = BASES_CONNAISSANCES["bloom"]
 
   prompt = f"""
     {base_connaissances}
@@ -92,35 +72,7 @@ def classifier_objectifs(objectif_general, objectifs_specifiques):
 
 @st.cache_data(show_spinner=False)
 def evaluer_objectifs(nom_cours, niveau, public, objectif_general, bloom_classification):
-  base_connaissances = """
-Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-
-## CRITÈRES D'ÉVALUATION (SMART+C) :
-- **Spécifique**: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïté, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es.
-- **Mesurable**: Il doit utiliser des verbes d'action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir).
-- **Approprié (Cohérent)**: L'objectif doit être pertinent et cohérent avec le niveau d'étude, le public cible, le programme et l'objectif général.
-- **Réaliste**: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-- **Temporellement défini**: L'objectif doit avoir un échéancier clair (Au terme de..., À la fin de..., etc.).
-- **Complétude**: L'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif général.
-
-## RÈGLES DE RÉDACTION OBLIGATOIRES :
-**STRUCTURE IMPÉRATIVE** : [Délai] + L'apprenant·e sera capable de + [UN SEUL verbe d'action] + [Contenu] + [Contexte]
-
-**RÈGLES CRITIQUES À VÉRIFIER SYSTÉMATIQUEMENT** :
-1. **UN SEUL VERBE D'ACTION PAR OBJECTIF** - JAMAIS plusieurs verbes
-2. **Centré sur l'apprenant** : "L'apprenant·e sera capable de..." (PAS "Le cours permet de...")
-3. **Délai explicite** : "Au terme de...", "À la fin de...", "À l'issue de..."
-4. **Verbe observable** : Éviter "comprendre", "connaître", "maîtriser"
-5. **Contexte précis** : Conditions, matériel, niveau d'exigence
-
-## TAXONOMIE DE BLOOM (ordre croissant de complexité) :
-1. Se souvenir (mémoriser, reconnaître, identifier...)
-2. Comprendre (expliquer, résumer, interpréter...)
-3. Appliquer (utiliser, exécuter, mettre en œuvre...)
-4. Analyser (différencier, organiser, décomposer...)
-5. Évaluer (critiquer, juger, justifier...)
-6. Créer (concevoir, produire, planifier...)
-"""
+  base_connaissances = BASES_CONNAISSANCES["pedagogique-mistral-v3"]
   
   prompt = f"""
 {base_connaissances}
@@ -172,35 +124,7 @@ Pour chaque objectif :
 
 @st.cache_data(show_spinner=False)
 def auto_eval_evaluation(evaluation):
-  base_connaissances = """
-Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-
-## CRITÈRES D'ÉVALUATION (SMART+C) :
-- **Spécifique**: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïté, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es.
-- **Mesurable**: Il doit utiliser des verbes d'action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir).
-- **Approprié (Cohérent)**: L'objectif doit être pertinent et cohérent avec le niveau d'étude, le public cible, le programme et l'objectif général.
-- **Réaliste**: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-- **Temporellement défini**: L'objectif doit avoir un échéancier clair (Au terme de..., À la fin de..., etc.).
-- **Complétude**: L'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif général.
-
-## RÈGLES DE RÉDACTION OBLIGATOIRES :
-**STRUCTURE IMPÉRATIVE** : [Délai] + L'apprenant·e sera capable de + [UN SEUL verbe d'action] + [Contenu] + [Contexte]
-
-**RÈGLES CRITIQUES À VÉRIFIER SYSTÉMATIQUEMENT** :
-1. **UN SEUL VERBE D'ACTION PAR OBJECTIF** - JAMAIS plusieurs verbes
-2. **Centré sur l'apprenant** : "L'apprenant·e sera capable de..." (PAS "Le cours permet de...")
-3. **Délai explicite** : "Au terme de...", "À la fin de...", "À l'issue de..."
-4. **Verbe observable** : Éviter "comprendre", "connaître", "maîtriser"
-5. **Contexte précis** : Conditions, matériel, niveau d'exigence
-
-## TAXONOMIE DE BLOOM (ordre croissant de complexité) :
-1. Se souvenir (mémoriser, reconnaître, identifier...)
-2. Comprendre (expliquer, résumer, interpréter...)
-3. Appliquer (utiliser, exécuter, mettre en œuvre...)
-4. Analyser (différencier, organiser, décomposer...)
-5. Évaluer (critiquer, juger, justifier...)
-6. Créer (concevoir, produire, planifier...)
-"""
+  base_connaissances = BASES_CONNAISSANCES["pedagogique-mistral-v3"]
 
   prompt = f"""
 {base_connaissances}
@@ -230,35 +154,7 @@ Tu es un expert en pédagogie universitaire. Tu dois vérifier et améliorer cet
 
 @st.cache_data(show_spinner=False)
 def ameliorer_objectifs(nom_cours, niveau, public, objectif_general, evaluation_objectifs):
-  base_connaissances = """
-Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-
-## CRITÈRES D'ÉVALUATION (SMART+C) :
-- **Spécifique**: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïté, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es.
-- **Mesurable**: Il doit utiliser des verbes d'action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir).
-- **Approprié (Cohérent)**: L'objectif doit être pertinent et cohérent avec le niveau d'étude, le public cible, le programme et l'objectif général.
-- **Réaliste**: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-- **Temporellement défini**: L'objectif doit avoir un échéancier clair (Au terme de..., À la fin de..., etc.).
-- **Complétude**: L'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif général.
-
-## RÈGLES DE RÉDACTION OBLIGATOIRES :
-**STRUCTURE IMPÉRATIVE** : [Délai] + L'apprenant·e sera capable de + [UN SEUL verbe d'action] + [Contenu] + [Contexte]
-
-**RÈGLES CRITIQUES À VÉRIFIER SYSTÉMATIQUEMENT** :
-1. **UN SEUL VERBE D'ACTION PAR OBJECTIF** - JAMAIS plusieurs verbes
-2. **Centré sur l'apprenant** : "L'apprenant·e sera capable de..." (PAS "Le cours permet de...")
-3. **Délai explicite** : "Au terme de...", "À la fin de...", "À l'issue de..."
-4. **Verbe observable** : Éviter "comprendre", "connaître", "maîtriser"
-5. **Contexte précis** : Conditions, matériel, niveau d'exigence
-
-## TAXONOMIE DE BLOOM (ordre croissant de complexité) :
-1. Se souvenir (mémoriser, reconnaître, identifier...)
-2. Comprendre (expliquer, résumer, interpréter...)
-3. Appliquer (utiliser, exécuter, mettre en œuvre...)
-4. Analyser (différencier, organiser, décomposer...)
-5. Évaluer (critiquer, juger, justifier...)
-6. Créer (concevoir, produire, planifier...)
-"""
+  base_connaissances = BASES_CONNAISSANCES["pedagogique-mistral-v3"]
 
   prompt = f"""
 {base_connaissances}
@@ -322,35 +218,7 @@ Améliorations sur spécificité, mesurabilité, réalisme, temporalité
 
 @st.cache_data(show_spinner=False)
 def auto_eval_suggestions(suggestions):
-  base_connaissances = """
-Tu es un expert en pédagogie universitaire, chargé d'assister les enseignants dans la constitution d'objectifs pédagogiques optimaux pour leurs cours.
-
-## CRITÈRES D'ÉVALUATION (SMART+C) :
-- **Spécifique**: L'objectif doit être clair et précis, formulé de manière explicite, sans ambiguïté, évitant les généralités et avec un vocabulaire compréhensible par les étudiant.es.
-- **Mesurable**: Il doit utiliser des verbes d'action observables (ex. : analyser, comparer, rédiger), évitant les termes vagues (ex. : comprendre, savoir).
-- **Approprié (Cohérent)**: L'objectif doit être pertinent et cohérent avec le niveau d'étude, le public cible, le programme et l'objectif général.
-- **Réaliste**: L'objectif doit être réalisable dans le temps imparti et avec les ressources disponibles.
-- **Temporellement défini**: L'objectif doit avoir un échéancier clair (Au terme de..., À la fin de..., etc.).
-- **Complétude**: L'ensemble des objectifs spécifiques doit permettre de réaliser l'objectif général.
-
-## RÈGLES DE RÉDACTION OBLIGATOIRES :
-**STRUCTURE IMPÉRATIVE** : [Délai] + L'apprenant·e sera capable de + [UN SEUL verbe d'action] + [Contenu] + [Contexte]
-
-**RÈGLES CRITIQUES À VÉRIFIER SYSTÉMATIQUEMENT** :
-1. **UN SEUL VERBE D'ACTION PAR OBJECTIF** - JAMAIS plusieurs verbes
-2. **Centré sur l'apprenant** : "L'apprenant·e sera capable de..." (PAS "Le cours permet de...")
-3. **Délai explicite** : "Au terme de...", "À la fin de...", "À l'issue de..."
-4. **Verbe observable** : Éviter "comprendre", "connaître", "maîtriser"
-5. **Contexte précis** : Conditions, matériel, niveau d'exigence
-
-## TAXONOMIE DE BLOOM (ordre croissant de complexité) :
-1. Se souvenir (mémoriser, reconnaître, identifier...)
-2. Comprendre (expliquer, résumer, interpréter...)
-3. Appliquer (utiliser, exécuter, mettre en œuvre...)
-4. Analyser (différencier, organiser, décomposer...)
-5. Évaluer (critiquer, juger, justifier...)
-6. Créer (concevoir, produire, planifier...)
-"""
+  base_connaissances = BASES_CONNAISSANCES["pedagogique-mistral-v3"]
 
   prompt = f"""
 {base_connaissances}
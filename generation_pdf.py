@@ -1,9 +1,14 @@
-import ast, json, re, logging
-import streamlit as st
+import ast, json, os, re, logging
 from fpdf import FPDF
 import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Dict, Optional, Union
 from babel.dates import format_date
+from lecture_tolerante import lire_dict_tolerant
+from polices_pdf import ajouter_polices
+from markdown_pdf import ecrire_markdown, ecrire_paragraphe
 #from IPython.display import display, FileLink
 
 logger = logging.getLogger(__name__)
@@ -80,7 +85,16 @@ def llm_output_to_dict(llm_output):
             logger.info("Conversion réussie après correction JSON")
             return result
     except json.JSONDecodeError as e:
-        logger.error(f"Correction JSON a échoué: {e}")
+        logger.warning(f"Correction JSON a échoué: {e}")
+    
+    # Méthode 4: Lecture tolérante (apostrophes, virgules finales, texte autour, sortie tronquée)
+    try:
+        logger.debug("Tentative de lecture tolérante")
+        result = lire_dict_tolerant(cleaned_output)
+        logger.info(f"Conversion réussie avec la lecture tolérante ({len(result)} champs)")
+        return result
+    except ValueError as e:
+        logger.error(f"La lecture tolérante a échoué: {e}")
     
     # Si tout échoue, lever une exception
     logger.error("Toutes les méthodes de conversion ont échoué")
@@ -163,622 +177,641 @@ def build_tables(recap_dict):
     return table_chif, table_axes, table_recom, table_ameliorer, table_conformes
 
 
-def generer_pdf(nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut, rapport, recap_dict):
+@dataclass
+class DonneesRapport:
+    """Contenu d'un rapport PDF : informations du cours, sortie du pipeline et récapitulatif."""
+    nom_cours: str
+    niveau: str
+    public: str
+    objectif_general: str
+    objectifs_specifiques_brut: str
+    rapport: Dict[str, str]  # clés 'aperçu' et 'details'
+    recap_dict: Dict  # format de PROMPT_RECAPITULATIF
+    date: Optional[str] = None  # date ISO de l'analyse (rapport rendu de nouveau) ; par défaut, la date du jour
 
-    class PDF(FPDF):
-        def __init__(self):
-            super().__init__()
-            self.add_font("DejaVu", "", "assets/fonts/DejaVu/DejaVuSans.ttf", uni=True)
-            self.add_font("DejaVu", "B", "assets/fonts/DejaVu/DejaVuSans-Bold.ttf", uni=True)
-            self.add_font("DejaVu", "I", "assets/fonts/DejaVu/DejaVuSans-Oblique.ttf", uni=True)
-            self.add_font("DejaVu", "BI", "assets/fonts/DejaVu/DejaVuSans-BoldOblique.ttf", uni=True)
+    def date_analyse(self) -> datetime:
+        """Date imprimée sur le rapport : celle de l'analyse si elle est connue, sinon celle du jour."""
+        return datetime.fromisoformat(self.date) if self.date else datetime.now()
 
 
-            self.title = ""
-            self.current_chapter_title = ""
-            self.is_chapter_start = False
-            self.is_page_de_garde = False
+class RapportPDF(FPDF):
+    """Document PDF du rapport d'analyse ; composer() y ajoute toutes les sections."""
 
-            self.is_annexe = False 
-            
-            self.table_counter = 1
-            
-            self.set_auto_page_break(auto=True, margin=15)
+    def __init__(self):
+        super().__init__()
+        # Polices analysées une fois par processus (voir polices_pdf.py)
+        ajouter_polices(self)
 
 
-    # Traitement du texte issu du llm
+        self.title = ""
+        self.current_chapter_title = ""
+        self.is_chapter_start = False
+        self.is_page_de_garde = False
 
-        def write_rich_line(self, text):
-            parts = re.split(r'(\*\*.*?\*\*)', text)
-            for part in parts:
-                if part.startswith('**') and part.endswith('**'):
-                    self.set_font("DejaVu", "B", 10)
-                    self.write(8, part[2:-2])
-                else:
-                    self.set_font("DejaVu", "", 10)
-                    self.write(8, part)
-            self.ln()
-            
-        def write_markdown(self, md_text):
-            lines = md_text.split('\n')
-            for line in lines:
-                self.set_text_color(0, 0, 0)
-                line = line.strip()
-                handled = False
-                
-                if line.startswith('**') and line.endswith('**'):
-                    #self.cell(3)
-                    self.set_text_color(25, 25, 112)
+        self.is_annexe = False 
+        
+        self.table_counter = 1
+        
+        self.set_auto_page_break(auto=True, margin=15)
+
+
+# Traitement du texte issu du llm
+
+    def write_markdown(self, md_text):
+        # Découpage en blocs et mise en page ligne par ligne (voir markdown_pdf.py)
+        ecrire_markdown(self, md_text)
+
+
+# Tableaux du chapitre Récapitulatif       
+    
+    def table_title(self, title):
+        self.set_font("DejaVu", "BI", 10)
+        self.set_text_color(80, 80, 80)
+        self.cell(0, 6, f"Tableau {self.table_counter} : {title}", ln=True)
+        self.ln(4)
+        self.table_counter += 1
+
+    def add_table_chiffres_cles(self, data):
+        self.table_title("Les chiffres clés")
+        self.set_font("DejaVu", "", 9)
+        with self.table(width=180, col_widths=(100, 80)) as table:
+            for row_data in data:
+                row = table.row()
+                for i, cell in enumerate(row_data):
+                    row.cell(cell, border="BOTTOM", padding=(2, 1), align="LEFT")
                     
+    def add_table_points_forts(self, data):
+        self.table_title("Points forts et axes d'amélioration identifiés")
+        self.set_font("DejaVu", "", 9)
+        with self.table(width=180, borders_layout="MINIMAL") as table:
+            for row_data in data:
+                row = table.row()
+                for cell in row_data:
+                    row.cell(cell, padding=(1, 5, 1))
+
+    def add_table_recommandations(self, data):
+        self.table_title("Recommandations globales")
+        self.set_font("DejaVu", "", 9)
+        with self.table(width=180, col_widths=(15, 165), text_align=("CENTER", "JUSTIFY")) as table:
+            for row_data in data:
+                row = table.row()
+                for cell in row_data:
+                    row.cell(cell, border="BOTTOM", padding=(1, 1, 1))
                     
-                # Cas combiné : bullet + texte enrichi (**...**)
-                if (line.startswith('- ') or line.startswith('* ')) and '**' in line:
-                    self.set_font("DejaVu", "", 10)
-                    self.cell(3)  # indent
-                    line_content = u'\u2022 ' + line[2:].strip()
-                    self.write_rich_line(line_content)
-                    handled = True
-
-                # Cas simple : bullet sans enrichissement
-                elif line.startswith('- ') or line.startswith('* '):
-                    self.set_font("DejaVu", "", 10)
-                    self.cell(3)
-                    self.multi_cell(0, 7, u'\u2022 ' + line[2:], ln=True, align='J')
-                    handled = True
-
-                # Titres Markdown
-                elif line.startswith('# '):
-                    self.set_font("DejaVu", "B", 15)
-                    self.set_text_color(25, 25, 112)
-                    self.multi_cell(0, 7, line[2:], ln=True, align='J')
-                    handled = True
-                elif line.startswith('## '):
-                    self.set_font("DejaVu", "B", 14)
-                    self.set_text_color(25, 25, 112)
-                    self.multi_cell(0, 7, line[3:], ln=True, align='J')
-                    handled = True
-                elif line.startswith('### '):
-                    self.set_font("DejaVu", "B", 13)
-                    self.set_text_color(25, 25, 112)
-                    self.multi_cell(0, 7, line[4:], ln=True, align='J')
-                    handled = True
-                elif line.startswith('#### '):
-                    self.set_font("DejaVu", "B", 12)
-                    self.set_text_color(25, 25, 112)
-                    self.multi_cell(0, 7, line[5:], ln=True, align='J')
-                    handled = True
-
-                # Cas général avec gras partiel (hors bullets)
-                elif '**' in line:
-                    self.write_rich_line(line)
-                    handled = True
-
-                # Cas par défaut : texte normal
-                if not handled:
-                    self.set_font("DejaVu", "", 10)
-                    #self.cell(3)
-                    self.multi_cell(0, 7, line, align='J')
-                    self.ln(0)
-
-
-    # Tableaux du chapitre Récapitulatif       
-        
-        def table_title(self, title):
-            self.set_font("DejaVu", "BI", 10)
-            self.set_text_color(80, 80, 80)
-            self.cell(0, 6, f"Tableau {self.table_counter} : {title}", ln=True)
-            self.ln(4)
-            self.table_counter += 1
-
-        def add_table_chiffres_cles(self, data):
-            self.table_title("Les chiffres clés")
-            self.set_font("DejaVu", "", 9)
-            with self.table(width=180, col_widths=(100, 80)) as table:
-                for row_data in data:
-                    row = table.row()
-                    for i, cell in enumerate(row_data):
-                        row.cell(cell, border="BOTTOM", padding=(2, 1), align="LEFT")
-                        
-        def add_table_points_forts(self, data):
-            self.table_title("Points forts et axes d'amélioration identifiés")
-            self.set_font("DejaVu", "", 9)
-            with self.table(width=180, borders_layout="MINIMAL") as table:
-                for row_data in data:
-                    row = table.row()
-                    for cell in row_data:
-                        row.cell(cell, padding=(1, 5, 1))
-
-        def add_table_recommandations(self, data):
-            self.table_title("Recommandations globales")
-            self.set_font("DejaVu", "", 9)
-            with self.table(width=180, col_widths=(15, 165), text_align=("CENTER", "JUSTIFY")) as table:
-                for row_data in data:
-                    row = table.row()
-                    for cell in row_data:
-                        row.cell(cell, border="BOTTOM", padding=(1, 1, 1))
-                        
-        def add_table_objectifs_a_ameliorer(self, data):
-            self.table_title("Objectifs à améliorer")
-            self.set_font("DejaVu", "", 9)
-            with self.table(width=180, col_widths=(20, 70, 45, 45), text_align=("CENTER", "JUSTIFY", "JUSTIFY", "JUSTIFY")) as table:
-                for row_data in data:
-                    row = table.row()
-                    for cell in row_data:
-                        # Réduction du padding pour moins d’espace vertical
-                        row.cell(cell, padding=(1.5, 2, 1.5))
-                        
-        def add_table_objectifs_conformes(self, data):
-            self.table_title("Objectifs satisfaisants")
-            self.set_font("DejaVu", "", 9)
-            with self.table(width=180, text_align=("CENTER", "JUSTIFY", "CENTER")) as table:
-                for row_data in data:
-                    row = table.row()
-                    for cell in row_data:
-                        # Réduction du padding pour moins d’espace vertical
-                        row.cell(cell, padding=(1.5, 2, 1.5))
-                        
-                        
-    # Constitution du pdf
-
-        def chapter_title(self, num, label):
-            self.current_chapter_title = label
-            self.set_y(30)
-
-            self.set_fill_color(70, 130, 180)  # Badge vertical
-            self.set_font("DejaVu", "B", 14)
-            self.cell(2, 18, "", fill=True, border=0)
-
-            self.set_fill_color(250, 250, 250)
-            self.set_text_color(25, 25, 112)
-            self.set_draw_color(70, 130, 180)
-            self.set_line_width(0.5)
-            
-            if getattr(self, "is_annexe", True):
-                chapter_label = "Annexe"
-                num = ""
-            else:
-                chapter_label = "Chapitre"
-            
-            self.cell(
-                0,
-                18,
-                f"   {chapter_label} {num} : {label}",
-                border="B",
-                ln=True,
-                align="L",
-                fill=True
-            )
-            self.ln(6)
-
-        def header(self):
-            if self.is_page_de_garde:
-                return
-            
-            self.set_fill_color(245, 248, 255)
-            self.rect(12, 9.5, 185, 9, 'F')
+    def add_table_objectifs_a_ameliorer(self, data):
+        self.table_title("Objectifs à améliorer")
+        self.set_font("DejaVu", "", 9)
+        with self.table(width=180, col_widths=(20, 70, 45, 45), text_align=("CENTER", "JUSTIFY", "JUSTIFY", "JUSTIFY")) as table:
+            for row_data in data:
+                row = table.row()
+                for cell in row_data:
+                    # Réduction du padding pour moins d’espace vertical
+                    row.cell(cell, padding=(1.5, 2, 1.5))
+                    
+    def add_table_objectifs_conformes(self, data):
+        self.table_title("Objectifs satisfaisants")
+        self.set_font("DejaVu", "", 9)
+        with self.table(width=180, text_align=("CENTER", "JUSTIFY", "CENTER")) as table:
+            for row_data in data:
+                row = table.row()
+                for cell in row_data:
+                    # Réduction du padding pour moins d’espace vertical
+                    row.cell(cell, padding=(1.5, 2, 1.5))
+                    
+                    
+# Constitution du pdf
 
-            self.set_font("DejaVu", "B", 10)
-            self.set_draw_color(70, 130, 180)
-            
-            # Position initiale de la marge
-            left_margin = self.l_margin
-            right_margin = self.w - self.r_margin
+    def chapter_title(self, num, label):
+        self.current_chapter_title = label
+        self.set_y(30)
 
-            #self.set_y(self.get_y() + 3)
-            y = self.get_y()
+        self.set_fill_color(70, 130, 180)  # Badge vertical
+        self.set_font("DejaVu", "B", 14)
+        self.cell(2, 18, "", fill=True, border=0)
 
-            # Gauche : titre fixe
-            self.set_xy(left_margin, y)
-            self.set_text_color(90, 90, 90)
-            self.cell(0, 8, "Analyse des objectifs pédagogiques", align='L')
-            
-            if getattr(self, "is_chapter_start", False):
-                return
-            
-            # Droite : nom du chapitre 
-            self.set_xy(right_margin - 70, y)  
-            
-            self.set_text_color(25, 25, 112)
-            
-            if getattr(self, "is_annexe", True):
-                chapter_label = "Annexe"
-            else:
-                chapter_label = "Chapitre"
-                
-            self.cell(
-                70,
-                8,
-                f"{chapter_label} : {self.current_chapter_title}",
-                border="B",
-                ln=True,
-                align="R"
-            )
-        
-            self.ln(12)
-
-        def footer(self):
-            self.set_y(-15)
-            self.set_font("helvetica", style="I", size=8)
-            self.set_text_color(128)
-            self.cell(0, 10, f"Page {self.page_no()}", align="C")
-
-        def add_page_de_garde(self, titre, sous_titre, auteur=None, date=None):
-            self.is_page_de_garde = True
-            self.add_page()
-            self.set_font("DejaVu", 'B', 20)
-
-            # Titre principal centré
-            self.ln(60)  # espace vers le bas
-            self.set_text_color(25, 25, 112)
-            self.multi_cell(0, 15, titre, ln=True, align='C')
-
-            # Sous-titre
-            self.set_font("DejaVu", '', 13)
-            self.set_text_color(0, 0, 0)
-            self.ln(10)
-            self.multi_cell(0, 10, sous_titre, ln=True, align='C')
-
-            # Auteur et date
-            self.set_font("DejaVu", 'I', 12)
-            self.set_text_color(100, 100, 100)
-            if auteur:
-                self.ln(40)
-                self.cell(0, 10, f"Établi par : {auteur}", ln=True, align='C')
-            if date:
-                self.cell(0, 10, f"Date : {date}", ln=True, align='C')
-
-        def add_disclaimer(self):
-            self.is_page_de_garde = True
-            self.add_page()
-            
-            # Encadré stylisé
-            pdf.set_fill_color(240, 240, 255)  # Fond très léger (bleuté)
-            pdf.set_draw_color(25, 25, 112)    # Bordure = couleur d'accent
-            pdf.set_line_width(0.5)
-            pdf.rect(x=10, y=30, w=190, h=70, style='D')  # Dessiner le cadre
-            
-            # Titre du disclaimer
-            pdf.set_xy(10, 35)
-            pdf.set_font("DejaVu", 'B', 14)
-            pdf.set_text_color(25, 25, 112)  # Couleur d'accent
-            pdf.cell(0, 10, "AVERTISSEMENT - Contenu généré par IA", ln=True, align="C")
-
-            # Corps du texte
-            pdf.set_xy(15, 50)
-            pdf.set_font("Helvetica", size=12)
-            pdf.set_text_color(0)  # Noir
-            pdf.multi_cell(180, 8,
+        self.set_fill_color(250, 250, 250)
+        self.set_text_color(25, 25, 112)
+        self.set_draw_color(70, 130, 180)
+        self.set_line_width(0.5)
+        
+        if getattr(self, "is_annexe", True):
+            chapter_label = "Annexe"
+            num = ""
+        else:
+            chapter_label = "Chapitre"
+        
+        self.cell(
+            0,
+            18,
+            f"   {chapter_label} {num} : {label}",
+            border="B",
+            ln=True,
+            align="L",
+            fill=True
+        )
+        self.ln(6)
+
+    def header(self):
+        if self.is_page_de_garde:
+            return
+        
+        self.set_fill_color(245, 248, 255)
+        self.rect(12, 9.5, 185, 9, 'F')
+
+        self.set_font("DejaVu", "B", 10)
+        self.set_draw_color(70, 130, 180)
+        
+        # Position initiale de la marge
+        left_margin = self.l_margin
+        right_margin = self.w - self.r_margin
+
+        #self.set_y(self.get_y() + 3)
+        y = self.get_y()
+
+        # Gauche : titre fixe
+        self.set_xy(left_margin, y)
+        self.set_text_color(90, 90, 90)
+        self.cell(0, 8, "Analyse des objectifs pédagogiques", align='L')
+        
+        if getattr(self, "is_chapter_start", False):
+            return
+        
+        # Droite : nom du chapitre 
+        self.set_xy(right_margin - 70, y)  
+        
+        self.set_text_color(25, 25, 112)
+        
+        if getattr(self, "is_annexe", True):
+            chapter_label = "Annexe"
+        else:
+            chapter_label = "Chapitre"
+            
+        self.cell(
+            70,
+            8,
+            f"{chapter_label} : {self.current_chapter_title}",
+            border="B",
+            ln=True,
+            align="R"
+        )
+    
+        self.ln(12)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font("helvetica", style="I", size=8)
+        self.set_text_color(128)
+        self.cell(0, 10, f"Page {self.page_no()}", align="C")
+
+    def add_page_de_garde(self, titre, sous_titre, auteur=None, date=None):
+        self.is_page_de_garde = True
+        self.add_page()
+        self.set_font("DejaVu", 'B', 20)
+
+        # Titre principal centré
+        self.ln(60)  # espace vers le bas
+        self.set_text_color(25, 25, 112)
+        self.multi_cell(0, 15, titre, ln=True, align='C')
+
+        # Sous-titre
+        self.set_font("DejaVu", '', 13)
+        self.set_text_color(0, 0, 0)
+        self.ln(10)
+        ecrire_paragraphe(self, sous_titre, 13, 10, alignement="C")
+
+        # Auteur et date
+        self.set_font("DejaVu", 'I', 12)
+        self.set_text_color(100, 100, 100)
+        if auteur:
+            self.ln(40)
+            self.cell(0, 10, f"Établi par : {auteur}", ln=True, align='C')
+        if date:
+            self.cell(0, 10, f"Date : {date}", ln=True, align='C')
+
+    def add_disclaimer(self):
+        self.is_page_de_garde = True
+        self.add_page()
+        
+        # Encadré stylisé
+        self.set_fill_color(240, 240, 255)  # Fond très léger (bleuté)
+        self.set_draw_color(25, 25, 112)    # Bordure = couleur d'accent
+        self.set_line_width(0.5)
+        self.rect(x=10, y=30, w=190, h=70, style='D')  # Dessiner le cadre
+        
+        # Titre du disclaimer
+        self.set_xy(10, 35)
+        self.set_font("DejaVu", 'B', 14)
+        self.set_text_color(25, 25, 112)  # Couleur d'accent
+        self.cell(0, 10, "AVERTISSEMENT - Contenu généré par IA", ln=True, align="C")
+
+        # Corps du texte
+        self.set_xy(15, 50)
+        self.set_font("Helvetica", size=12)
+        self.set_text_color(0)  # Noir
+        self.multi_cell(180, 8,
 """
     Ces recommandations sont générées automatiquement par un système d'intelligence artificielle.
     Elles visent à guider, non à remplacer l'expertise pédagogique humaine, et doivent être examinées avec discernement avant toute utilisation.
                     """)
 
-        # Constitution du chapitre récapitulatif
+    # Constitution du chapitre récapitulatif
+    
+    def add_recap_tables(self, table_chif, table_axes, table_recom, table_ameliorer, table_conformes):
+        self.current_chapter_title = "Synthèse des résultats"
+        self.is_page_de_garde = False
+        self.is_chapter_start = True         
+        self.add_page()
+        self.chapter_title(3, "Synthèse des résultats")
+        self.is_chapter_start = False
         
-        def add_recap_tables(self, table_chif, table_axes, table_recom, table_ameliorer, table_conformes):
-            self.current_chapter_title = "Synthèse des résultats"
-            self.is_page_de_garde = False
-            self.is_chapter_start = True         
-            self.add_page()
-            self.chapter_title(3, "Synthèse des résultats")
-            self.is_chapter_start = False
-            
-            self.ln(10)
-            
-            self.add_table_objectifs_a_ameliorer(table_ameliorer)
-            self.ln(14)
+        self.ln(10)
+        
+        self.add_table_objectifs_a_ameliorer(table_ameliorer)
+        self.ln(14)
 
-            self.add_table_objectifs_conformes(table_conformes)
-            self.ln(14)
-            
-            # Ligne de séparation 
-            
-            self.add_table_chiffres_cles(table_chif)
-            self.ln(14)
-            
-            self.add_table_points_forts(table_axes)
-            self.ln(14)
+        self.add_table_objectifs_conformes(table_conformes)
+        self.ln(14)
+        
+        # Ligne de séparation 
+        
+        self.add_table_chiffres_cles(table_chif)
+        self.ln(14)
+        
+        self.add_table_points_forts(table_axes)
+        self.ln(14)
 
-            self.add_table_recommandations(table_recom)
+        self.add_table_recommandations(table_recom)
 
-        # Constitution du chapitre rappel infos cours
-    
-        def rappel_infos_cours(self, nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut):
-            self.current_chapter_title = "Rappel des informations de cours"
-            self.is_page_de_garde = False
-            self.is_chapter_start = True 
-            self.add_page()
-            self.chapter_title(1, "Rappel des informations de cours")
-            self.is_chapter_start = False
-            
-            # Cours
-            self.set_font("DejaVu", "B", 10)
-            self.write(8, "Cours : ")
-            self.set_font("DejaVu", "", 10)
-            self.write(8, nom_cours)
-            self.ln(8)
-            
-            # Niveau
-            self.set_font("DejaVu", "B", 10)
-            self.write(8, "Niveau : ")
-            self.set_font("DejaVu", "", 10)
-            self.write(8, niveau)
-            self.ln(8)
-            
-            # Public cible
-            self.set_font("DejaVu", "B", 10)
-            self.write(8, "Public cible : ")
-            self.set_font("DejaVu", "", 10)
-            self.write(8, public)
-            self.ln(8)
-            
-            # Objectif général 
-            self.set_font("DejaVu", "B", 10)
-            self.set_text_color(25, 25, 112)
-            self.write(8, "Objectif général  :")
-            
-            self.ln()
-            self.set_font("DejaVu", "", 10)
-            self.set_text_color(0, 0, 0)
-            self.cell(3)
-            self.multi_cell(0, 7, objectif_general, align='J')
-            self.ln(8)
-            
-            # Objectifs spécifiques 
-            self.set_font("DejaVu", "B", 10)
-            self.set_text_color(25, 25, 112)
-            self.write(8, "Objectifs spécifiques  :")
-            
-            self.ln()
-            self.set_font("DejaVu", "", 10)
-            self.set_text_color(0, 0, 0)
-            self.cell(3)
-            self.multi_cell(0, 7, objectifs_specifiques_brut, align='J')
+    # Constitution du chapitre rappel infos cours
 
-        # Constitution du résumé  
+    def rappel_infos_cours(self, nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut):
+        self.current_chapter_title = "Rappel des informations de cours"
+        self.is_page_de_garde = False
+        self.is_chapter_start = True 
+        self.add_page()
+        self.chapter_title(1, "Rappel des informations de cours")
+        self.is_chapter_start = False
         
-        def extract_resume_notes(self, resume_text):
-            logger.debug("Début de l'analyse du résumé pour extraire les objectifs et la complétude")
-            
-            objectives_data = {}
-            
-            pattern = r'• (Objectif (?:général|[\d]+)) : Spécifique \((\d+)/5\), Mesurable \((\d+)/5\), Approprié \(Cohérent\) \((\d+)/5\), Réaliste \((\d+)/5\), Temporellement défini \((\d+)/5\)'
-            
-            matches = re.findall(pattern, resume_text)
-            logger.info(f"Extraction des objectifs avec le pattern : {pattern}")
-            logger.info(f" {len(matches)} objectifs trouvés dans le texte")
-
-            for match in matches:
-                obj_name = match[0]
-                scores = {
-                    'specifique': int(match[1]),
-                    'mesurable': int(match[2]),
-                    'approprie': int(match[3]),
-                    'realiste': int(match[4]),
-                    'temporel': int(match[5])
-                }
-                total_score = sum(scores.values())
-                objectives_data[obj_name] = {
-                    'scores': scores,
-                    'total': total_score,
-                    'max_possible': 25
-                }
-            
-            completude_pattern = r'• Complétude : (\d+)/5'
-            completude_match = re.search(completude_pattern, resume_text)
-            completude_score = int(completude_match.group(1)) if completude_match else 0
-            logger.info(f" Score de complétude: {completude_score}/5")
+        # Cours
+        self.set_font("DejaVu", "B", 10)
+        self.write(8, "Cours : ")
+        self.set_font("DejaVu", "", 10)
+        self.write(8, nom_cours)
+        self.ln(8)
+        
+        # Niveau
+        self.set_font("DejaVu", "B", 10)
+        self.write(8, "Niveau : ")
+        self.set_font("DejaVu", "", 10)
+        self.write(8, niveau)
+        self.ln(8)
+        
+        # Public cible
+        self.set_font("DejaVu", "B", 10)
+        self.write(8, "Public cible : ")
+        self.set_font("DejaVu", "", 10)
+        self.write(8, public)
+        self.ln(8)
+        
+        # Objectif général 
+        self.set_font("DejaVu", "B", 10)
+        self.set_text_color(25, 25, 112)
+        self.write(8, "Objectif général  :")
+        
+        self.ln()
+        self.set_font("DejaVu", "", 10)
+        self.set_text_color(0, 0, 0)
+        self.cell(3)
+        self.multi_cell(0, 7, objectif_general, align='J')
+        self.ln(8)
+        
+        # Objectifs spécifiques 
+        self.set_font("DejaVu", "B", 10)
+        self.set_text_color(25, 25, 112)
+        self.write(8, "Objectifs spécifiques  :")
+        
+        self.ln()
+        self.set_font("DejaVu", "", 10)
+        self.set_text_color(0, 0, 0)
+        self.cell(3)
+        self.multi_cell(0, 7, objectifs_specifiques_brut, align='J')
 
-            logger.info("Parsing terminé avec succès")
+    # Constitution du résumé  
+    
+    def extract_resume_notes(self, resume_text):
+        logger.debug("Début de l'analyse du résumé pour extraire les objectifs et la complétude")
+        
+        objectives_data = {}
+        
+        pattern = r'• (Objectif (?:général|[\d]+)) : Spécifique \((\d+)/5\), Mesurable \((\d+)/5\), Approprié \(Cohérent\) \((\d+)/5\), Réaliste \((\d+)/5\), Temporellement défini \((\d+)/5\)'
+        
+        matches = re.findall(pattern, resume_text)
+        logger.info(f"Extraction des objectifs avec le pattern : {pattern}")
+        logger.info(f" {len(matches)} objectifs trouvés dans le texte")
+
+        for match in matches:
+            obj_name = match[0]
+            scores = {
+                'specifique': int(match[1]),
+                'mesurable': int(match[2]),
+                'approprie': int(match[3]),
+                'realiste': int(match[4]),
+                'temporel': int(match[5])
+            }
+            total_score = sum(scores.values())
+            objectives_data[obj_name] = {
+                'scores': scores,
+                'total': total_score,
+                'max_possible': 25
+            }
+        
+        completude_pattern = r'• Complétude : (\d+)/5'
+        completude_match = re.search(completude_pattern, resume_text)
+        completude_score = int(completude_match.group(1)) if completude_match else 0
+        logger.info(f" Score de complétude: {completude_score}/5")
 
-            return objectives_data, completude_score
+        logger.info("Parsing terminé avec succès")
+
+        return objectives_data, completude_score
+    
+    def add_table_resume(self, resume_text):
+        logger.info("Création des données de tableau...")
         
-        def add_table_resume(self, resume_text):
-            logger.info("Création des données de tableau...")
-            
-            objectives_data, completude_score = self.extract_resume_notes(resume_text)
-            
-            # En-têtes du tableau
-            table_smart = [('Objectif', 'Spécifique', 'Mesurable', 'Approprié', 'Réaliste', 'Temporel', 'Total', 'Pourcentage')]
+        objectives_data, completude_score = self.extract_resume_notes(resume_text)
+        
+        # En-têtes du tableau
+        table_smart = [('Objectif', 'Spécifique', 'Mesurable', 'Approprié', 'Réaliste', 'Temporel', 'Total', 'Pourcentage')]
+        
+        if objectives_data:
+            logger.info(f" Traitement de {len(objectives_data)} objectifs pour le tableau")
             
-            if objectives_data:
-                logger.info(f" Traitement de {len(objectives_data)} objectifs pour le tableau")
-                
-                for obj_name, data in objectives_data.items():
-                    scores = data['scores']
-                    total = data['total']
-                    percentage = round((total / data['max_possible']) * 100, 1)
-                    
-                    table_smart.append((
-                        obj_name,
-                        f"{scores['specifique']}/5",
-                        f"{scores['mesurable']}/5",
-                        f"{scores['approprie']}/5",
-                        f"{scores['realiste']}/5",
-                        f"{scores['temporel']}/5",
-                        f"{total}/25",
-                        f"{percentage}%"
-                    ))
-                    logger.info(f" Ligne ajoutée: {obj_name} ({percentage}%)")
+            for obj_name, data in objectives_data.items():
+                scores = data['scores']
+                total = data['total']
+                percentage = round((total / data['max_possible']) * 100, 1)
                 
                 table_smart.append((
-                    'Complétude',
-                    '-',
-                    '-',
-                    '-',
-                    '-',
-                    '-',
-                    f"{completude_score}/5",
-                    f"{(completude_score/5)*100}%"
+                    obj_name,
+                    f"{scores['specifique']}/5",
+                    f"{scores['mesurable']}/5",
+                    f"{scores['approprie']}/5",
+                    f"{scores['realiste']}/5",
+                    f"{scores['temporel']}/5",
+                    f"{total}/25",
+                    f"{percentage}%"
                 ))
-                logger.info(f" Ligne de complétude ajoutée: {(completude_score/5)*100}%")
-                
-                logger.info(f" Tableau créé avec {len(table_smart)} lignes (en-têtes inclus)")
-            else:
-                logger.info("Aucune donnée trouvée - ajout d'une ligne vide")
-                table_smart.append(('', 'Aucune donnée trouvée', '', '', '', '', '', ''))
+                logger.info(f" Ligne ajoutée: {obj_name} ({percentage}%)")
+            
+            table_smart.append((
+                'Complétude',
+                '-',
+                '-',
+                '-',
+                '-',
+                '-',
+                f"{completude_score}/5",
+                f"{(completude_score/5)*100}%"
+            ))
+            logger.info(f" Ligne de complétude ajoutée: {(completude_score/5)*100}%")
             
-            return table_smart
+            logger.info(f" Tableau créé avec {len(table_smart)} lignes (en-têtes inclus)")
+        else:
+            logger.info("Aucune donnée trouvée - ajout d'une ligne vide")
+            table_smart.append(('', 'Aucune donnée trouvée', '', '', '', '', '', ''))
+        
+        return table_smart
+    """
+    def add_resume(self, resume_text):
+        self.ln(20)
+        self.set_font("DejaVu", "B", 16)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 8, "Résumé", ln=True)
+        self.ln(4)
+
+        logger.info("Création du tableau dans le pdf...")
+
+        table_smart = self.add_table_resume(resume_text)
+        
+        self.set_font("DejaVu", "", 9)
+        with self.table(borders_layout="ALL", cell_fill_color=200, cell_fill_mode="ROWS", line_height=self.font_size * 2, text_align="CENTER", width=140) as table:
+            header_row = table.row()
+            for header in table_smart[0]:
+                header_row.cell(header)
+            logger.info(f" En-têtes ajoutés: {len(table_smart[0])} colonnes")
+            
+            data_rows_count = 0
+            for row_data in table_smart[1:]:
+                data_row = table.row()
+                for cell_data in row_data:
+                    data_row.cell(str(cell_data))
+                data_rows_count += 1
+            logger.info(f" {data_rows_count} lignes de données ajoutées")
+            
+            logger.info(f" Tableau résumé créé avec succès")
+    """
+    def add_methode_analyse(self):
+        self.is_annexe = True
+        self.current_chapter_title = "Méthode d'analyse"
+        self.is_page_de_garde = False
+        self.is_chapter_start = True
+        self.add_page()
+        self.chapter_title(5, "Méthode d'analyse utilisée")
+        self.is_chapter_start = False
+
+        self.set_font("DejaVu", "", 11)
+        ecrire_paragraphe(self,
+            "Notre assistant intelligent procède à une analyse en plusieurs étapes pour évaluer et améliorer vos objectifs pédagogiques :",
+            11, 8)
+        self.ln(6)
+
+        # Étape 1
+        self.set_font("DejaVu", "B", 12)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 8, "1. Classification selon la taxonomie de Bloom", ln=True)
+        self.set_font("DejaVu", "", 11)
+        self.set_text_color(0, 0, 0)
+        ecrire_paragraphe(self,
+            "Une fiche explicative et une base de données regroupant des verbes d’action classés selon les six niveaux hiérarchiques de la taxonomie de Bloom permettent de catégoriser chaque objectif pédagogique :",
+            11, 8)
+        self.ln(2)
+        niveaux = ["- Connaître", "- Comprendre", "- Appliquer", "- Analyser", "- Évaluer", "- Créer"]
+        for niveau in niveaux:
+            self.cell(5)
+            self.cell(0, 7, niveau, ln=True)
+        self.ln(2)
+        ecrire_paragraphe(self,
+            "Cela permet de déterminer le niveau cognitif visé et de détecter les incohérences entre les verbes et le niveau annoncé.",
+            11, 8)
+        self.ln(6)
+
+        # Étape 2
+        self.set_font("DejaVu", "B", 12)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 8, "2. Évaluation multicritère", ln=True)
+        self.set_font("DejaVu", "", 11)
+        self.set_text_color(0, 0, 0)
+        ecrire_paragraphe(self,
+            "Chaque objectif est évalué selon plusieurs critères inspirés du modèle SMART, adaptés au contexte pédagogique. Pour être rigoureux, un objectif doit remplir les critères suivants :",
+            11, 8)
+        self.ln(2)
+        criteres = [
+            ("Spécifique", "L’objectif doit être clairement formulé, sans ambiguïté, à l’aide d’un vocabulaire compréhensible. Il précise des comportements observables dans un contexte donné."),
+            ("Mesurable", "Il permet une évaluation fiable grâce à des verbes d’action observables. Un seul verbe est recommandé."),
+            ("Approprié (Cohérent)", "Il est aligné avec le contenu du cours, le niveau d’étude, le public cible, et l’objectif général."),
+            ("Réaliste", "Il est atteignable dans le cadre temporel et matériel prévu."),
+            ("Temporellement défini", "Il précise un délai, une échéance ou des jalons clairs.")
+        ]
+        for titre, texte in criteres:
+            self.set_font("DejaVu", "B", 11)
+            self.cell(0, 7, f"• {titre}", ln=True)
+            self.set_font("DejaVu", "", 11)
+            ecrire_paragraphe(self, texte, 11, 8)
+            self.ln(1)
+        ecrire_paragraphe(self,
+            "Ces critères sont complétés par des règles de rédaction pédagogiques, et chaque objectif reçoit une note sur 5 pour chaque critère.",
+            11, 8)
+        self.ln(6)
+
+        # Étape 3
+        self.set_font("DejaVu", "B", 12)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 8, "3. Amélioration des objectifs", ln=True)
+        self.set_font("DejaVu", "", 11)
+        self.set_text_color(0, 0, 0)
+        ecrire_paragraphe(self,
+            "En cas de non-conformité, des suggestions d’amélioration personnalisées sont générées pour aider à reformuler les objectifs selon les bonnes pratiques.",
+            11, 8)
+        self.ln(6)
+
+        # Étape 4
+        self.set_font("DejaVu", "B", 12)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 8, "4. Synthèse", ln=True)
+        self.set_font("DejaVu", "", 11)
+        self.set_text_color(0, 0, 0)
+        ecrire_paragraphe(self,
+            "Un rapport structuré est généré avec un aperçu global des résultats, une analyse détaillée et plusieurs tableaux récapitulatifs.",
+            11, 8)
+
+        self.is_annexe = False
+
+    def chapter_body(self, text):
+        self.set_font("DejaVu", size=12)
+        self.is_chapter_start = False  
+        self.write_markdown(text)
+        self.ln()
+        self.set_font("DejaVu", "I", 10)
+        #self.cell(0, 5, "(fin du chapitre)", ln=True)
+
+    def print_chapter(self, num, title, text):
+        self.current_chapter_title = title
+        self.is_page_de_garde = False
+        self.is_annexe = False
+        self.is_chapter_start = True  # Active la logique "pas de header"
+        self.add_page()
+        self.chapter_title(num, title)
+        self.chapter_body(text)
+
+    def add_page_de_garde_cours(self, nom_cours, date=None):
+        self.add_page_de_garde(
+            titre=f"Rapport d’analyse des objectifs pédagogiques du cours de {nom_cours}",
+            sous_titre="Évaluation des objectifs pédagogique selon la taxonomie de Bloom et des critères SMART adaptés au contexte pédagogique",
+            #auteur="ObjectifsAI",
+            date=date)
+
+    def composer_chapitres(self, donnees: "DonneesRapport"):
         """
-        def add_resume(self, resume_text):
-            self.ln(20)
-            self.set_font("DejaVu", "B", 16)
-            self.set_text_color(25, 25, 112)
-            self.cell(0, 8, "Résumé", ln=True)
-            self.ln(4)
+        Ajoute les chapitres propres à un cours : informations, aperçu, synthèse et analyse détaillée.
 
-            logger.info("Création du tableau dans le pdf...")
+        Args:
+            donnees (DonneesRapport): Informations du cours, rapport et récapitulatif
+        """
+        self.rappel_infos_cours(donnees.nom_cours, donnees.niveau, donnees.public, donnees.objectif_general, donnees.objectifs_specifiques_brut)
+        self.print_chapter(2, "Aperçu global de l'analyse", donnees.rapport['aperçu'])
 
-            table_smart = self.add_table_resume(resume_text)
-            
-            self.set_font("DejaVu", "", 9)
-            with self.table(borders_layout="ALL", cell_fill_color=200, cell_fill_mode="ROWS", line_height=pdf.font_size * 2, text_align="CENTER", width=140) as table:
-                header_row = table.row()
-                for header in table_smart[0]:
-                    header_row.cell(header)
-                logger.info(f" En-têtes ajoutés: {len(table_smart[0])} colonnes")
-                
-                data_rows_count = 0
-                for row_data in table_smart[1:]:
-                    data_row = table.row()
-                    for cell_data in row_data:
-                        data_row.cell(str(cell_data))
-                    data_rows_count += 1
-                logger.info(f" {data_rows_count} lignes de données ajoutées")
-                
-                logger.info(f" Tableau résumé créé avec succès")
+        table_chif, table_axes, table_recom, table_ameliorer, table_conformes = build_tables(donnees.recap_dict)
+        self.add_recap_tables(table_chif, table_axes, table_recom, table_ameliorer, table_conformes)
+
+        self.print_chapter(4, "Analyse détaillée", donnees.rapport['details'])
+        #self.add_resume(donnees.rapport['details'])
+
+    def composer(self, donnees: "DonneesRapport"):
         """
-        def add_methode_analyse(self):
-            self.is_annexe = True
-            self.current_chapter_title = "Méthode d'analyse"
-            self.is_page_de_garde = False
-            self.is_chapter_start = True
-            self.add_page()
-            self.chapter_title(5, "Méthode d'analyse utilisée")
-            self.is_chapter_start = False
+        Compose toutes les sections du rapport.
 
-            self.set_font("DejaVu", "", 11)
-            self.multi_cell(0, 8, 
-                "Notre assistant intelligent procède à une analyse en plusieurs étapes pour évaluer et améliorer vos objectifs pédagogiques :",
-                align="J")
-            self.ln(6)
-
-            # Étape 1
-            self.set_font("DejaVu", "B", 12)
-            self.set_text_color(25, 25, 112)
-            self.cell(0, 8, "1. Classification selon la taxonomie de Bloom", ln=True)
-            self.set_font("DejaVu", "", 11)
-            self.set_text_color(0, 0, 0)
-            self.multi_cell(0, 8,
-                "Une fiche explicative et une base de données regroupant des verbes d’action classés selon les six niveaux hiérarchiques de la taxonomie de Bloom permettent de catégoriser chaque objectif pédagogique :",
-                align="J")
-            self.ln(2)
-            niveaux = ["- Connaître", "- Comprendre", "- Appliquer", "- Analyser", "- Évaluer", "- Créer"]
-            for niveau in niveaux:
-                self.cell(5)
-                self.cell(0, 7, niveau, ln=True)
-            self.ln(2)
-            self.multi_cell(0, 8,
-                "Cela permet de déterminer le niveau cognitif visé et de détecter les incohérences entre les verbes et le niveau annoncé.",
-                align="J")
-            self.ln(6)
-
-            # Étape 2
-            self.set_font("DejaVu", "B", 12)
-            self.set_text_color(25, 25, 112)
-            self.cell(0, 8, "2. Évaluation multicritère", ln=True)
-            self.set_font("DejaVu", "", 11)
-            self.set_text_color(0, 0, 0)
-            self.multi_cell(0, 8,
-                "Chaque objectif est évalué selon plusieurs critères inspirés du modèle SMART, adaptés au contexte pédagogique. Pour être rigoureux, un objectif doit remplir les critères suivants :", align="J")
-            self.ln(2)
-            criteres = [
-                ("Spécifique", "L’objectif doit être clairement formulé, sans ambiguïté, à l’aide d’un vocabulaire compréhensible. Il précise des comportements observables dans un contexte donné."),
-                ("Mesurable", "Il permet une évaluation fiable grâce à des verbes d’action observables. Un seul verbe est recommandé."),
-                ("Approprié (Cohérent)", "Il est aligné avec le contenu du cours, le niveau d’étude, le public cible, et l’objectif général."),
-                ("Réaliste", "Il est atteignable dans le cadre temporel et matériel prévu."),
-                ("Temporellement défini", "Il précise un délai, une échéance ou des jalons clairs.")
-            ]
-            for titre, texte in criteres:
-                self.set_font("DejaVu", "B", 11)
-                self.cell(0, 7, f"• {titre}", ln=True)
-                self.set_font("DejaVu", "", 11)
-                self.multi_cell(0, 8, texte, align="J")
-                self.ln(1)
-            self.multi_cell(0, 8,
-                "Ces critères sont complétés par des règles de rédaction pédagogiques, et chaque objectif reçoit une note sur 5 pour chaque critère.",
-                align="J")
-            self.ln(6)
-
-            # Étape 3
-            self.set_font("DejaVu", "B", 12)
-            self.set_text_color(25, 25, 112)
-            self.cell(0, 8, "3. Amélioration des objectifs", ln=True)
-            self.set_font("DejaVu", "", 11)
-            self.set_text_color(0, 0, 0)
-            self.multi_cell(0, 8,
-                "En cas de non-conformité, des suggestions d’amélioration personnalisées sont générées pour aider à reformuler les objectifs selon les bonnes pratiques.",
-                align="J")
-            self.ln(6)
-
-            # Étape 4
-            self.set_font("DejaVu", "B", 12)
-            self.set_text_color(25, 25, 112)
-            self.cell(0, 8, "4. Synthèse", ln=True)
-            self.set_font("DejaVu", "", 11)
-            self.set_text_color(0, 0, 0)
-            self.multi_cell(0, 8,
-                "Un rapport structuré est généré avec un aperçu global des résultats, une analyse détaillée et plusieurs tableaux récapitulatifs.",
-                align="J")
-
-            self.is_annexe = False
-
-        def chapter_body(self, text):
-            self.set_font("DejaVu", size=12)
-            self.is_chapter_start = False  
-            self.write_markdown(text)
-            self.ln()
-            self.set_font("DejaVu", "I", 10)
-            #self.cell(0, 5, "(fin du chapitre)", ln=True)
-
-        def print_chapter(self, num, title, text):
-            self.current_chapter_title = title
-            self.is_page_de_garde = False
-            self.is_annexe = False
-            self.is_chapter_start = True  # Active la logique "pas de header"
-            self.add_page()
-            self.chapter_title(num, title)
-            self.chapter_body(text)
-
-    pdf = PDF()
-    pdf.set_title("Analyse automatique des objectifs pédagogiques")
-    pdf.set_left_margin(15)
-    pdf.set_right_margin(15)
-
-    #pdf.set_author("ObjectifsAI")
-    pdf.add_page_de_garde(
-        titre=f"Rapport d’analyse des objectifs pédagogiques du cours de {nom_cours}",
-        sous_titre="Évaluation des objectifs pédagogique selon la taxonomie de Bloom et des critères SMART adaptés au contexte pédagogique",
-        #auteur="ObjectifsAI",
-        date = format_date(datetime.now(), format='d MMMM y', locale='fr')    )
-
-    pdf.add_disclaimer()
-    pdf.rappel_infos_cours(nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut)
-    pdf.print_chapter(2, "Aperçu global de l'analyse", rapport['aperçu'])
-    
-    table_chif, table_axes, table_recom, table_ameliorer, table_conformes = build_tables(recap_dict)
-    pdf.add_recap_tables(table_chif, table_axes, table_recom, table_ameliorer, table_conformes)
-    
-    pdf.print_chapter(4, "Analyse détaillée", rapport['details'])
-    #pdf.add_resume(rapport['details'])
-    pdf.add_methode_analyse()
-
-   
-    # Sauvegarde temporaire
-    temp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    pdf.output(temp.name)
-    return temp.name 
+        Args:
+            donnees (DonneesRapport): Informations du cours, rapport et récapitulatif
+        """
+        self.set_title("Analyse automatique des objectifs pédagogiques")
+        self.set_left_margin(15)
+        self.set_right_margin(15)
+
+        #self.set_author("ObjectifsAI")
+        self.add_page_de_garde_cours(donnees.nom_cours, date=format_date(donnees.date_analyse(), format='d MMMM y', locale='fr'))
+
+        self.add_disclaimer()
+        self.composer_chapitres(donnees)
+        self.add_methode_analyse()
+
+
+def rendre_rapport(donnees: DonneesRapport, chemin: Optional[str] = None) -> Union[bytes, str]:
+    """
+    Rend un rapport PDF.
+
+    Args:
+        donnees (DonneesRapport): Contenu du rapport
+        chemin (str): Fichier où écrire le PDF ; par défaut, le PDF est rendu en mémoire
+
+    Returns:
+        bytes | str: Contenu du PDF, ou chemin du fichier écrit si chemin est fourni
+    """
+    pdf = RapportPDF()
+    pdf.composer(donnees)
+
+    # Document en mémoire, sans passage par le disque
+    if chemin is None:
+        return bytes(pdf.output())
+    pdf.output(chemin)
+    return chemin
     """
     pdf.output("preview.pdf")
     display(FileLink("preview.pdf"))
      """
+
+
+def generer_pdf(nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut, rapport, recap_dict, chemin=None):
+    """
+    Génère le rapport PDF de l'analyse.
+
+    Args:
+        rapport (dict): Sortie du pipeline (clés 'aperçu' et 'details')
+        recap_dict (dict): Récapitulatif au format de PROMPT_RECAPITULATIF
+        chemin (str): Fichier où écrire le PDF ; par défaut, le PDF est rendu en mémoire
+
+    Returns:
+        bytes | str: Contenu du PDF, ou chemin du fichier écrit si chemin est fourni
+    """
+    donnees = DonneesRapport(nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut, rapport, recap_dict)
+    return rendre_rapport(donnees, chemin)
+
+
+
+@contextmanager
+def pdf_temporaire(*args, **kwargs):
+    """
+    Écrit le rapport PDF dans un fichier temporaire, supprimé à la sortie du bloc.
+
+    Pour les usages qui ont besoin d'un chemin ; mêmes arguments que generer_pdf.
+
+    Yields:
+        str: Chemin du fichier PDF
+    """
+    descripteur, chemin = tempfile.mkstemp(suffix=".pdf")
+    os.close(descripteur)
+    try:
+        yield generer_pdf(*args, chemin=chemin, **kwargs)
+    finally:
+        try:
+            os.remove(chemin)
+        except FileNotFoundError:
+            pass
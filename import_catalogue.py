@@ -0,0 +1,252 @@
+"""
+Import en flux de catalogues de programmes (Markdown, texte brut, DOCX).
+
+Un catalogue contient une suite de cours, chacun introduit par un titre
+(« # Nom du cours », style « Titre » Word ou ligne « Cours : … ») et décrit par
+des champs « Niveau : », « Public : », « Objectif général : » et
+« Objectifs spécifiques : ». Le fichier est lu paragraphe par paragraphe : seul
+le cours en cours de lecture est gardé en mémoire, et chaque cours complet est
+produit dès que le suivant commence.
+
+Les champs placés sous un titre sans objectifs (intitulé du programme, par
+exemple) servent de valeurs par défaut aux cours qui suivent.
+"""
+
+import re
+import sys
+import logging
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pretraitement_obj_spe import Objectif, nettoyer_objectifs_specifiques
+
+logger = logging.getLogger(__name__)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_RE_TITRE_MD = re.compile(r"^(?P<diese>#{1,6})\s+(?P<titre>.+?)\s*#*\s*$")
+_RE_STYLE_TITRE = re.compile(r"^(?:heading|titre|title)\s*(?P<niveau>\d*)$", flags=re.IGNORECASE)
+_RE_CHAMP = re.compile(
+    r"^[\s>*_\-•]*(?P<champ>cours|intitul[ée] du cours|niveau|public(?: cible)?|"
+    r"objectif g[ée]n[ée]ral|objectifs sp[ée]cifiques)[\s*_]*:[\s*_]*(?P<valeur>.*?)[\s*_]*$",
+    flags=re.IGNORECASE
+)
+# Titre réduit à l'intitulé d'un champ (« ### Objectifs spécifiques »), deux-points facultatifs
+_RE_TITRE_CHAMP = re.compile(
+    r"^[\s*_]*(?P<champ>cours|intitul[ée] du cours|niveau|public(?: cible)?|"
+    r"objectif g[ée]n[ée]ral|objectifs sp[ée]cifiques)[\s*_]*:?[\s*_]*$",
+    flags=re.IGNORECASE
+)
+
+# Paragraphe lu : (texte, niveau de titre ou None)
+Paragraphe = Tuple[str, Optional[int]]
+
+
+@dataclass
+class CoursCatalogue:
+    nom_cours: str
+    niveau: str = ""
+    public: str = ""
+    objectif_general: str = ""
+    objectifs_specifiques_bruts: str = ""
+    objectifs_specifiques: List[Objectif] = field(default_factory=list)
+
+    def en_parametres(self) -> Dict:
+        """Paramètres attendus par assistant_pedagogique et analyser_en_lot."""
+        return {
+            "nom_cours": self.nom_cours,
+            "niveau": self.niveau,
+            "public": self.public,
+            "objectif_general": self.objectif_general,
+            "objectifs_specifiques": self.objectifs_specifiques,
+        }
+
+
+def _champ(nom: str) -> str:
+    nom = nom.lower()
+    if nom.startswith(("cours", "intitul")):
+        return "nom_cours"
+    if nom.startswith("niveau"):
+        return "niveau"
+    if nom.startswith("public"):
+        return "public"
+    if nom.startswith("objectifs"):
+        return "objectifs_specifiques_bruts"
+    return "objectif_general"
+
+
+def paragraphes_texte(chemin: Path) -> Iterator[Paragraphe]:
+    """Lit un fichier Markdown ou texte ligne par ligne."""
+    with open(chemin, encoding="utf-8-sig", errors="replace") as fichier:
+        for ligne in fichier:
+            ligne = ligne.rstrip("\r\n")
+            match = _RE_TITRE_MD.match(ligne)
+            if match:
+                yield match.group("titre").strip("*_ "), len(match.group("diese"))
+            else:
+                yield ligne, None
+
+
+def paragraphes_docx(chemin: Path) -> Iterator[Paragraphe]:
+    """
+    Lit le corps d'un document Word paragraphe par paragraphe, sans charger tout l'arbre XML.
+
+    Les paragraphes d'une liste numérotée ou à puces Word sont préfixés de « - »
+    afin que decouper_objectifs les sépare.
+    """
+    with zipfile.ZipFile(chemin) as archive, archive.open("word/document.xml") as document:
+        corps = None
+        for evenement, element in ET.iterparse(document, events=("start", "end")):
+            if evenement == "start":
+                if element.tag == f"{_W}body":
+                    corps = element
+                continue
+            if element.tag != f"{_W}p":
+                continue
+
+            morceaux = []
+            for noeud in element.iter():
+                if noeud.tag == f"{_W}t" and noeud.text:
+                    morceaux.append(noeud.text)
+                elif noeud.tag == f"{_W}tab":
+                    morceaux.append("\t")
+                elif noeud.tag in (f"{_W}br", f"{_W}cr"):
+                    morceaux.append("\n")
+            texte = "".join(morceaux)
+
+            niveau_titre = None
+            style = element.find(f"{_W}pPr/{_W}pStyle")
+            if style is not None:
+                match = _RE_STYLE_TITRE.match(style.get(f"{_W}val", ""))
+                if match:
+                    niveau_titre = int(match.group("niveau") or 1)
+            if niveau_titre is None and element.find(f"{_W}pPr/{_W}numPr") is not None and texte.strip():
+                texte = f"- {texte}"
+
+            # Libère le paragraphe lu pour garder une mémoire bornée
+            element.clear()
+            if corps is not None:
+                corps.clear()
+            yield texte, niveau_titre
+
+
+def _terminer(courant: Dict[str, str]) -> Optional[CoursCatalogue]:
+    bruts = courant.get("objectifs_specifiques_bruts", "").strip()
+    if not bruts:
+        return None
+    cours = CoursCatalogue(
+        nom_cours=courant.get("nom_cours", "").strip() or "Cours sans titre",
+        niveau=courant.get("niveau", "").strip(),
+        public=courant.get("public", "").strip(),
+        objectif_general=" ".join(courant.get("objectif_general", "").split()),
+        objectifs_specifiques_bruts=bruts,
+    )
+    cours.objectifs_specifiques = nettoyer_objectifs_specifiques(cours.objectif_general, bruts, structures=True)
+    return cours
+
+
+def _signaler_sans_objectifs(courant: Dict[str, str]):
+    # Un titre de section ou de programme n'a pas de corps ; un cours décrit sans objectifs spécifiques est signalé
+    if courant.get("objectif_general", "").strip() or "objectifs_specifiques_bruts" in courant:
+        logger.warning(f"Cours ignoré, aucun objectif spécifique trouvé : {courant.get('nom_cours', '').strip() or 'sans titre'}")
+
+
+def extraire_cours(paragraphes: Iterator[Paragraphe]) -> Iterator[CoursCatalogue]:
+    """
+    Regroupe un flux de paragraphes en cours prêts à être analysés.
+
+    Args:
+        paragraphes: Couples (texte, niveau de titre ou None)
+
+    Yields:
+        CoursCatalogue: Chaque cours possédant au moins un objectif spécifique
+    """
+    defauts: Dict[str, str] = {}
+    courant: Dict[str, str] = {}
+    champ_en_cours = None
+
+    def nouveau_cours(nom: str) -> Optional[CoursCatalogue]:
+        nonlocal courant, champ_en_cours
+        cours = _terminer(courant)
+        if cours is None:
+            _signaler_sans_objectifs(courant)
+            # Titre sans objectifs (programme, section) : ses champs valent pour la suite
+            defauts.update({cle: valeur for cle, valeur in courant.items() if cle in ("niveau", "public") and valeur.strip()})
+        courant = {**defauts, "nom_cours": nom}
+        champ_en_cours = None
+        return cours
+
+    for texte, niveau_titre in paragraphes:
+        match = _RE_CHAMP.match(texte)
+        if match is None and niveau_titre is not None:
+            # Titre servant d'intitulé de champ : le contenu suit sous le titre
+            match = _RE_TITRE_CHAMP.match(texte)
+        champ = _champ(match.group("champ")) if match else None
+        valeur = match.groupdict().get("valeur", "") if match else ""
+        if champ == "nom_cours" and not valeur.strip():
+            # « ## Cours » sans nom : titre de cours ordinaire
+            match = champ = None
+
+        if (niveau_titre is not None and champ is None) or champ == "nom_cours":
+            cours = nouveau_cours((texte if champ is None else valeur).strip())
+            if cours:
+                yield cours
+            continue
+
+        if match:
+            champ_en_cours = champ
+            courant[champ] = valeur
+            continue
+
+        if champ_en_cours in ("objectif_general", "objectifs_specifiques_bruts"):
+            # Suite d'un champ sur plusieurs lignes ; les lignes vides servent de séparateurs
+            courant[champ_en_cours] = f"{courant.get(champ_en_cours, '')}\n{texte}"
+        elif champ_en_cours in ("niveau", "public") and not courant.get(champ_en_cours, "").strip():
+            # Valeur placée sous un titre « ### Niveau » : première ligne non vide
+            courant[champ_en_cours] = texte
+
+    cours = _terminer(courant)
+    if cours:
+        yield cours
+    else:
+        _signaler_sans_objectifs(courant)
+
+
+def importer_catalogue(chemin) -> Iterator[CoursCatalogue]:
+    """
+    Parcourt un catalogue de programme et produit ses cours au fil de la lecture.
+
+    Args:
+        chemin (str | Path): Fichier .md, .markdown, .txt ou .docx
+
+    Yields:
+        CoursCatalogue: Cours prêts pour assistant_pedagogique ou features3.analyser_en_lot
+
+    Raises:
+        ValueError: Si l'extension du fichier n'est pas prise en charge
+    """
+    chemin = Path(chemin)
+    extension = chemin.suffix.lower()
+    if extension in (".md", ".markdown", ".txt"):
+        paragraphes = paragraphes_texte(chemin)
+    elif extension == ".docx":
+        paragraphes = paragraphes_docx(chemin)
+    else:
+        raise ValueError(f"Format de catalogue non pris en charge : {extension}")
+
+    logger.info(f"Import du catalogue {chemin}")
+    nombre = 0
+    for cours in extraire_cours(paragraphes):
+        nombre += 1
+        logger.debug(f"Cours importé : {cours.nom_cours} ({len(cours.objectifs_specifiques)} objectif(s) spécifique(s))")
+        yield cours
+    logger.info(f"Import terminé : {nombre} cours lus dans {chemin}")
+
+
+if __name__ == "__main__":
+    # Vérification rapide d'un catalogue : python import_catalogue.py catalogue.docx
+    for cours in importer_catalogue(sys.argv[1]):
+        print(f"{cours.nom_cours} | {cours.niveau} | {cours.public} | {len(cours.objectifs_specifiques)} objectif(s)")
@@ -0,0 +1,189 @@
+"""
+Lecture tolérante d'un dictionnaire Python ou JSON produit par un LLM.
+
+Dernier recours de generation_pdf.llm_output_to_dict : le texte est parcouru
+caractère par caractère et les défauts courants des sorties de modèles sont
+réparés au passage :
+- guillemets simples et doubles mélangés, apostrophes françaises dans les
+  chaînes (« d'amélioration ») : un guillemet ne ferme la chaîne que s'il est
+  suivi d'un séparateur (« , », « : », « } », « ] ») ou de la fin du texte ;
+- virgules finales ou manquantes, texte avant ou après le dictionnaire ;
+- littéraux Python (True, None) comme JSON (true, null) ;
+- sortie tronquée : les conteneurs ouverts sont refermés et seuls les champs
+  complets sont conservés.
+"""
+
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+_GUILLEMETS = {'"': '"', "'": "'", "“": "”"}
+_SEPARATEURS = ",:}]"
+_FIN_SCALAIRE = ",:}]\n"
+_ECHAPPEMENTS = {"n": "\n", "t": "\t", "r": "", '"': '"', "'": "'", "\\": "\\", "/": "/"}
+_LITTERAUX = {"true": True, "false": False, "null": None, "none": None}
+
+
+class _Incomplet:
+    """Valeur coupée par la fin du texte."""
+
+
+_INCOMPLET = _Incomplet()
+
+
+class _Lecteur:
+    def __init__(self, texte: str):
+        self.texte = texte
+        self.pos = 0
+        self.tronque = False
+
+    def _courant(self) -> str:
+        return self.texte[self.pos] if self.pos < len(self.texte) else ""
+
+    def _espaces(self):
+        while self.pos < len(self.texte) and self.texte[self.pos].isspace():
+            self.pos += 1
+
+    def _fin(self) -> bool:
+        self._espaces()
+        if self.pos >= len(self.texte):
+            self.tronque = True
+            return True
+        return False
+
+    def valeur(self) -> Any:
+        if self._fin():
+            return _INCOMPLET
+        caractere = self._courant()
+        if caractere == "{":
+            return self.objet()
+        if caractere == "[":
+            return self.liste()
+        if caractere in _GUILLEMETS:
+            return self.chaine()
+        return self.scalaire()
+
+    def objet(self) -> Dict:
+        self.pos += 1
+        resultat = {}
+        while not self._fin():
+            caractere = self._courant()
+            if caractere == "}":
+                self.pos += 1
+                return resultat
+            if caractere == ",":
+                self.pos += 1
+                continue
+            cle = self.chaine() if caractere in _GUILLEMETS else self.scalaire()
+            if cle is _INCOMPLET or self._fin():
+                break
+            if self._courant() != ":":
+                # Élément sans clé exploitable : on reprend au séparateur suivant
+                self._sauter_element()
+                continue
+            self.pos += 1
+            valeur = self.valeur()
+            if valeur is _INCOMPLET:
+                break
+            resultat[str(cle)] = valeur
+            if self.tronque:
+                break
+        return resultat
+
+    def liste(self) -> list:
+        self.pos += 1
+        resultat = []
+        while not self._fin():
+            caractere = self._courant()
+            if caractere == "]":
+                self.pos += 1
+                return resultat
+            if caractere in ",:":
+                self.pos += 1
+                continue
+            valeur = self.valeur()
+            if valeur is _INCOMPLET:
+                break
+            resultat.append(valeur)
+            if self.tronque:
+                break
+        return resultat
+
+    def chaine(self):
+        fermant = _GUILLEMETS[self._courant()]
+        self.pos += 1
+        morceaux = []
+        while self.pos < len(self.texte):
+            caractere = self.texte[self.pos]
+            self.pos += 1
+            if caractere == "\\" and self.pos < len(self.texte):
+                suivant = self.texte[self.pos]
+                self.pos += 1
+                if suivant == "u" and self.pos + 4 <= len(self.texte):
+                    try:
+                        morceaux.append(chr(int(self.texte[self.pos:self.pos + 4], 16)))
+                        self.pos += 4
+                        continue
+                    except ValueError:
+                        pass
+                morceaux.append(_ECHAPPEMENTS.get(suivant, "\\" + suivant))
+            elif caractere == fermant and self._ferme_chaine():
+                return "".join(morceaux)
+            else:
+                morceaux.append(caractere)
+        self.tronque = True
+        return _INCOMPLET
+
+    def _ferme_chaine(self) -> bool:
+        # Apostrophe suivie d'une lettre (« l'objectif ») : elle fait partie de la chaîne
+        position = self.pos
+        while position < len(self.texte) and self.texte[position] in " \t\r\n":
+            position += 1
+        return position >= len(self.texte) or self.texte[position] in _SEPARATEURS
+
+    def scalaire(self):
+        debut = self.pos
+        while self.pos < len(self.texte) and self.texte[self.pos] not in _FIN_SCALAIRE:
+            self.pos += 1
+        brut = self.texte[debut:self.pos].strip()
+        if self.pos >= len(self.texte):
+            self.tronque = True
+            return _INCOMPLET
+        if brut.lower() in _LITTERAUX:
+            return _LITTERAUX[brut.lower()]
+        for conversion in (int, float):
+            try:
+                return conversion(brut)
+            except ValueError:
+                pass
+        return brut
+
+    def _sauter_element(self):
+        while self.pos < len(self.texte) and self.texte[self.pos] not in ",}":
+            self.pos += 1
+
+
+def lire_dict_tolerant(texte: str) -> Dict:
+    """
+    Reconstruit le dictionnaire contenu dans une sortie de LLM mal formée.
+
+    Args:
+        texte (str): Sortie du LLM, éventuellement entourée de texte ou tronquée
+
+    Returns:
+        dict: Champs complets retrouvés
+
+    Raises:
+        ValueError: Si aucun dictionnaire ni aucun champ n'a pu être retrouvé
+    """
+    debut = texte.find("{")
+    if debut < 0:
+        raise ValueError("Aucun dictionnaire dans la sortie du LLM")
+    lecteur = _Lecteur(texte[debut:])
+    resultat = lecteur.objet()
+    if not resultat:
+        raise ValueError("Aucun champ exploitable dans la sortie du LLM")
+    if lecteur.tronque:
+        logger.warning(f"Sortie du LLM tronquée : {len(resultat)} champ(s) complet(s) retrouvé(s) ({', '.join(resultat)})")
+    return resultat
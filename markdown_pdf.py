@@ -0,0 +1,229 @@
+"""
+Mise en page PDF du Markdown produit par le pipeline (rapport détaillé, aperçu).
+
+Le texte est d'abord découpé en blocs (titres, puces, paragraphes, lignes
+vides), chacun formé de segments normaux ou gras fusionnés par style ; les
+lignes consécutives d'un même paragraphe sont réunies. La mise en page ne
+passe ensuite plus par multi_cell ni write, dont la coupure des lignes
+recalcule la largeur de toute la ligne à chaque caractère : les mots sont
+mesurés une fois avec les largeurs de la police, répartis en lignes, et chaque
+ligne est émise d'un seul tenant, justifiée ou non, avec un changement de
+police par segment.
+
+La coupure en lignes ne dépend que du texte, de la taille et de la largeur :
+elle est mise en cache pour le processus. Les sections fixes du rapport
+(annexe de méthode, sous-titre de la page de garde) ne sont ainsi mises en page
+qu'une fois, puis seulement réémises dans chaque document.
+
+L'émission repose sur les classes de mise en ligne de fpdf2 (Fragment,
+TextLine, _render_styled_text_line), celles qu'utilise FPDF.cell : version
+fixée à 2.8.3 dans requirements.txt.
+"""
+
+import re
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from fpdf import FPDF
+from fpdf.enums import Align, XPos, YPos
+from fpdf.line_break import Fragment, TextLine
+
+from polices_pdf import FAMILLE, police
+
+logger = logging.getLogger(__name__)
+
+TITRE, PUCE, PARAGRAPHE, VIDE = "titre", "puce", "paragraphe", "vide"
+
+COULEUR_ACCENT = (25, 25, 112)
+TAILLE_TEXTE = 10
+TAILLES_TITRES = {1: 15, 2: 14, 3: 13, 4: 12}
+RETRAIT_PUCE = 3
+# Hauteur de ligne : texte simple (justifié) et texte avec passages en gras
+HAUTEUR_LIGNE = 7
+HAUTEUR_LIGNE_RICHE = 8
+
+_RE_TITRE = re.compile(r"^(#{1,4}) (.*)$")
+_RE_GRAS = re.compile(r"(\*\*.*?\*\*)")
+# Lignes qui restent seules même à la suite d'un paragraphe (listes non Markdown)
+_RE_DEBUT_LISTE = re.compile(r"^(?:•|\d+[.)]\s)")
+
+# (gras, texte)
+Segment = Tuple[bool, str]
+
+
+@dataclass(slots=True)
+class Bloc:
+    nature: str
+    segments: Tuple[Segment, ...] = ()
+    niveau: int = 0
+    # Ligne entièrement en gras, affichée dans la couleur d'accent
+    accent: bool = False
+
+
+def _fusionner(segments) -> Tuple[Segment, ...]:
+    fusion: List[Segment] = []
+    for gras, texte in segments:
+        if not texte:
+            continue
+        if fusion and fusion[-1][0] == gras:
+            fusion[-1] = (gras, fusion[-1][1] + texte)
+        else:
+            fusion.append((gras, texte))
+    return tuple(fusion)
+
+
+def _segments(texte: str) -> Tuple[Segment, ...]:
+    return _fusionner(
+        (True, morceau[2:-2]) if len(morceau) >= 4 and morceau.startswith("**") and morceau.endswith("**") else (False, morceau)
+        for morceau in _RE_GRAS.split(texte)
+    )
+
+
+def decouper_blocs(texte: str) -> List[Bloc]:
+    """
+    Découpe un texte Markdown en blocs à mettre en page.
+
+    Args:
+        texte (str): Markdown du pipeline (titres #, puces - ou *, passages **gras**)
+
+    Returns:
+        list[Bloc]: Blocs dans l'ordre du texte
+    """
+    blocs: List[Bloc] = []
+    for ligne in texte.split("\n"):
+        ligne = ligne.strip()
+        if not ligne:
+            blocs.append(Bloc(VIDE))
+            continue
+        if ligne.startswith(("- ", "* ")):
+            blocs.append(Bloc(PUCE, _segments(ligne[2:].strip())))
+            continue
+        titre = _RE_TITRE.match(ligne)
+        if titre:
+            texte_titre = "".join(texte for _, texte in _segments(titre.group(2)))
+            blocs.append(Bloc(TITRE, ((True, texte_titre),), niveau=len(titre.group(1))))
+            continue
+        accent = len(ligne) >= 4 and ligne.startswith("**") and ligne.endswith("**")
+        precedent = blocs[-1] if blocs else None
+        if (precedent is not None and precedent.nature == PARAGRAPHE and not precedent.accent and not accent
+                and not precedent.segments[-1][1].rstrip().endswith(":") and not _RE_DEBUT_LISTE.match(ligne)):
+            # Ligne de continuation : réunie au paragraphe avant la mise en page
+            precedent.segments = _fusionner((*precedent.segments, (False, " "), *_segments(ligne)))
+            continue
+        blocs.append(Bloc(PARAGRAPHE, _segments(ligne), accent=accent))
+    return blocs
+
+
+@lru_cache(maxsize=4096)
+def _couper_lignes(segments: Tuple[Segment, ...], taille: float, largeur: float, k: float) -> Optional[Tuple[Tuple[Segment, ...], ...]]:
+    # Mots mesurés une fois avec les polices partagées du processus ; None si un mot ne tient pas seul
+    # sur une ligne. Résultat mis en cache : les textes fixes (annexe, page de garde) ne sont coupés qu'une fois.
+    polices = {False: police(""), True: police("B")}
+    espaces = {gras: police_mot.get_text_width(" ", taille, None)[1] / k for gras, police_mot in polices.items()}
+    lignes: List[Tuple[Segment, ...]] = []
+    courante: List[Segment] = []
+    largeur_courante = 0.0
+    for gras, texte in segments:
+        for mot in texte.split(" "):
+            if not mot:
+                continue
+            largeur_mot = polices[gras].get_text_width(mot, taille, None)[1] / k
+            if largeur_mot > largeur:
+                return None
+            espace = espaces[gras] if courante else 0.0
+            if courante and largeur_courante + espace + largeur_mot > largeur:
+                lignes.append(tuple(courante))
+                courante, largeur_courante, espace = [], 0.0, 0.0
+            courante.append((gras, mot))
+            largeur_courante += espace + largeur_mot
+    if courante:
+        lignes.append(tuple(courante))
+    return tuple(lignes)
+
+
+def _emettre_ligne(pdf: FPDF, mots: Tuple[Segment, ...], etats: dict, largeur: float, hauteur: float, alignement: Align):
+    # Mots consécutifs de même style réunis en un fragment ; l'espace suit le style du mot qui le suit
+    morceaux = _fusionner((gras, mot if i == 0 else " " + mot) for i, (gras, mot) in enumerate(mots))
+    fragments = tuple(Fragment(texte, etats[gras], pdf.k) for gras, texte in morceaux)
+    ligne = TextLine(
+        fragments,
+        text_width=0,
+        number_of_spaces=len(mots) - 1,
+        align=alignement,
+        height=hauteur,
+        max_width=largeur,
+    )
+    pdf._render_styled_text_line(ligne, hauteur, new_x=XPos.LEFT, new_y=YPos.NEXT, prevent_font_change=True)
+
+
+def _ecrire_segments(pdf: FPDF, segments: Tuple[Segment, ...], taille: float, hauteur: float, alignement: Align, retrait: float = 0):
+    pdf.set_font(FAMILLE, "", taille)
+    pdf.set_x(pdf.l_margin + retrait)
+    largeur = pdf.w - pdf.r_margin - pdf.x
+
+    lignes = _couper_lignes(segments, taille, largeur - 2 * pdf.c_margin, pdf.k)
+    if lignes is None:
+        # Mot plus large que la ligne (URL, suite de caractères) : coupure de fpdf2
+        pdf.multi_cell(0, hauteur, "".join(f"**{texte}**" if gras else texte for gras, texte in segments),
+                       align=alignement, markdown=True, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        return
+
+    regulier = pdf._get_current_graphics_state()
+    etats = {False: regulier, True: {**regulier, "font_style": "B", "current_font": pdf.fonts[f"{FAMILLE.lower()}B"]}}
+    for i, mots in enumerate(lignes):
+        # Comme multi_cell : la dernière ligne d'un paragraphe justifié reste alignée à gauche
+        dernier_alignement = Align.L if alignement == Align.J else alignement
+        _emettre_ligne(pdf, mots, etats, largeur, hauteur, alignement if i < len(lignes) - 1 else dernier_alignement)
+    pdf.set_x(pdf.l_margin)
+
+
+def _ecrire_bloc(pdf: FPDF, bloc: Bloc):
+    if bloc.nature == VIDE:
+        pdf.ln(HAUTEUR_LIGNE)
+        return
+    segments = bloc.segments
+    if bloc.nature == PUCE:
+        segments = _fusionner(((False, "• "), *segments))
+    riche = bloc.nature != TITRE and any(gras for gras, _ in segments)
+    pdf.set_text_color(*(COULEUR_ACCENT if bloc.nature == TITRE or bloc.accent else (0, 0, 0)))
+    _ecrire_segments(
+        pdf,
+        segments,
+        taille=TAILLES_TITRES[bloc.niveau] if bloc.nature == TITRE else TAILLE_TEXTE,
+        hauteur=HAUTEUR_LIGNE_RICHE if riche else HAUTEUR_LIGNE,
+        alignement=Align.L if riche else Align.J,
+        retrait=RETRAIT_PUCE if bloc.nature == PUCE else 0,
+    )
+
+
+def ecrire_paragraphe(pdf: FPDF, texte: str, taille: float = TAILLE_TEXTE, hauteur: float = HAUTEUR_LIGNE,
+                      alignement: Align = Align.J, gras: bool = False):
+    """
+    Paragraphe sans balisage dans la couleur courante, à la place de multi_cell(0, hauteur, texte).
+
+    Les coupures de lignes d'un texte fixe sont calculées une seule fois par processus.
+
+    Args:
+        pdf (FPDF): Document dont les polices DejaVu sont enregistrées
+        texte (str): Texte du paragraphe
+        taille (float): Taille de police en points
+        hauteur (float): Hauteur de ligne
+        alignement (Align): Alignement, justifié par défaut
+        gras (bool): Paragraphe entièrement en gras
+    """
+    _ecrire_segments(pdf, ((gras, texte),), taille, hauteur, Align.coerce(alignement))
+
+
+def ecrire_markdown(pdf: FPDF, texte: str):
+    """
+    Met en page un texte Markdown à la position courante du document.
+
+    Args:
+        pdf (FPDF): Document dont les polices DejaVu sont enregistrées (voir polices_pdf.py)
+        texte (str): Markdown du pipeline
+    """
+    for bloc in decouper_blocs(texte):
+        _ecrire_bloc(pdf, bloc)
+    pdf.set_text_color(0, 0, 0)
@@ -0,0 +1,94 @@
+"""
+Polices DejaVu chargées une seule fois par processus pour la génération des PDF.
+
+FPDF.add_font relit et analyse le fichier TTF à chaque document (table cmap,
+largeurs de tous les caractères, descripteur). Ici, chaque police est analysée
+une fois ; les documents reçoivent une copie légère qui partage ces données en
+lecture seule et garde son propre état : numéro de police, glyphes utilisés
+(sous-ensemble) et objet TTFont.
+
+L'objet TTFont ne peut pas être partagé : fpdf2 le réduit en place au sous-
+ensemble des glyphes utilisés lors de pdf.output(). Chaque document en ouvre
+donc un nouveau, en mode paresseux, sur les octets du fichier gardés en
+mémoire ; seules les tables nécessaires au sous-ensemble sont alors lues.
+"""
+
+import copy
+import logging
+import os
+import threading
+from io import BytesIO
+from typing import Dict, Tuple
+
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import SubsetMap, TTFFont
+
+logger = logging.getLogger(__name__)
+
+FAMILLE = "DejaVu"
+DOSSIER_POLICES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "fonts", "DejaVu")
+
+# Style fpdf -> fichier TTF
+FICHIERS_POLICES = {
+    "": "DejaVuSans.ttf",
+    "B": "DejaVuSans-Bold.ttf",
+    "I": "DejaVuSans-Oblique.ttf",
+    "BI": "DejaVuSans-BoldOblique.ttf",
+}
+
+# Style -> (police analysée servant de modèle, octets du fichier)
+_POLICES: Dict[str, Tuple[TTFFont, bytes]] = {}
+_verrou = threading.Lock()
+
+
+def _charger(style: str) -> Tuple[TTFFont, bytes]:
+    chemin = os.path.join(DOSSIER_POLICES, FICHIERS_POLICES[style])
+    with open(chemin, "rb") as fichier:
+        octets = fichier.read()
+    modele = TTFFont(FPDF(), chemin, f"{FAMILLE.lower()}{style}", style)
+    modele.ttfont.close()
+    modele.ttfont = None
+    return modele, octets
+
+
+def precharger_polices():
+    """Analyse les quatre polices DejaVu si ce n'est pas déjà fait (appel au démarrage possible)."""
+    with _verrou:
+        for style in FICHIERS_POLICES:
+            if style not in _POLICES:
+                _POLICES[style] = _charger(style)
+                logger.debug(f"Police {FAMILLE} '{style}' analysée et mise en cache")
+
+
+def ajouter_polices(pdf: FPDF):
+    """
+    Enregistre les polices DejaVu dans un document, comme add_font mais sans relire les fichiers.
+
+    Args:
+        pdf (FPDF): Document sans police DejaVu enregistrée
+    """
+    if len(_POLICES) < len(FICHIERS_POLICES):
+        precharger_polices()
+    for style in FICHIERS_POLICES:
+        modele, octets = _POLICES[style]
+        police = copy.copy(modele)
+        police.i = len(pdf.fonts) + 1
+        # Les largeurs sont un defaultdict, complété à la lecture : une copie par document
+        police.cw = modele.cw.copy()
+        police.ttfont = ttLib.TTFont(BytesIO(octets), recalcTimestamp=False, fontNumber=0, lazy=True)
+        police.missing_glyphs = []
+        police.subset = SubsetMap(police)
+        pdf.fonts[police.fontkey] = police
+
+
+def police(style: str = "") -> TTFFont:
+    """
+    Police DejaVu analysée, partagée par le processus, pour mesurer du texte hors de tout document.
+
+    Args:
+        style (str): "", "B", "I" ou "BI"
+    """
+    if style not in _POLICES:
+        precharger_polices()
+    return _POLICES[style][0]
@@ -0,0 +1,53 @@
+"""
+Préchauffage du processus Streamlit, une fois le formulaire affiché.
+
+app.py n'importe avant le formulaire que Streamlit et des modules légers. Un
+thread d'arrière-plan importe ensuite le pipeline et la génération des
+documents, crée le client Langfuse, analyse les polices et démarre le pool de
+rendu PDF, pendant que l'utilisateur remplit le formulaire. Le préchauffage
+n'a lieu qu'une fois par processus ; une analyse soumise avant sa fin attend
+simplement les imports en cours (verrou d'import de Python).
+
+Temps d'import suivi par benchmarks/bench_import.py.
+"""
+
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Modules importés dans l'ordre : d'abord ceux dont la première analyse a besoin
+MODULES = ("features3", "archive_analyses", "generation_pdf", "export_rapport", "rendu_pdf")
+
+_lance = False
+_verrou = threading.Lock()
+
+
+def _prechauffer():
+    debut = time.perf_counter()
+    try:
+        for nom in MODULES:
+            importlib.import_module(nom)
+        from features3 import obtenir_langfuse
+        from polices_pdf import precharger_polices
+        from rendu_pdf import demarrer_rendu
+        obtenir_langfuse()
+        precharger_polices()
+        demarrer_rendu()
+    except Exception as e:
+        # Rien de perdu : chaque module est importé de nouveau au premier usage
+        logger.warning(f"Préchauffage interrompu : {e}")
+        return
+    logger.info(f"Préchauffage terminé en {time.perf_counter() - debut:.2f} s")
+
+
+def lancer_prechauffage():
+    """Lance le préchauffage dans un thread d'arrière-plan, au premier appel du processus seulement."""
+    global _lance
+    with _verrou:
+        if _lance:
+            return
+        _lance = True
+    threading.Thread(target=_prechauffer, name="prechauffage", daemon=True).start()
@@ -1,75 +1,262 @@
 import re
 import logging
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from detection_verbes import detecter_verbes
 
 logger = logging.getLogger(__name__)
 
+ID_OBJECTIF_GENERAL = "OG"
+
+MOTIFS_TEMPS = [
+    r"(à|a) la fin (du|de la|de l’|de|d’)[^,:\n]+",
+    r"au terme (du|de la|de l’|de|d’)[^,:\n]+",
+    r"(à|a) l’issue (du|de la|de l’|de|d’)[^,:\n]+",
+    r"au bout (du|de la|de l’|de|d’)[^,:\n]+"
+]
+
+SUJETS = [
+    r"(?:les|l)[’']?(?:apprenant|étudiant)(?:e|\(e\)|\.e|·e)?(?:s|\(s\)|\.s|·s)?", 
+    r"il(?:s|\(s\)|\.s|·s)?", 
+    r"elle(?:s|\(s\)|\.s|·s)?", 
+    r"on"
+]
+VERBES_CAPACITE = [
+    r"(?:sera|seront) capable(?:s|\(s\)|\.s|·s)? (?:de|d[’'])",
+    r"(?:pourra|pourront)",
+    r"(?:sera|seront) en mesure (?:de|d[’'])"
+]
+MOTIFS_CAPACITE = [f"{sujet} {verbe}" for sujet in SUJETS for verbe in VERBES_CAPACITE]
+
+# Compilés une seule fois : ces motifs sont appliqués à chaque objectif
+_RE_TEMPS = [re.compile(motif, flags=re.IGNORECASE) for motif in MOTIFS_TEMPS]
+_RE_CAPACITE = [re.compile(motif, flags=re.IGNORECASE) for motif in MOTIFS_CAPACITE]
+
+
+def _premiere_correspondance(motifs, texte):
+    for motif in motifs:
+        match = motif.search(texte)
+        if match:
+            return match
+    return None
+
+
+def localiser_preambules(texte):
+    """
+    Localise les préambules temporel et de capacité dans un texte.
+
+    Args:
+        texte (str): Texte de l'objectif
+
+    Returns:
+        tuple: (span_temps, span_capacite), chaque span étant un couple
+        (début, fin) dans le texte, ou None si le préambule est absent.
+    """
+    match_temps = _premiere_correspondance(_RE_TEMPS, texte)
+    match_capacite = _premiere_correspondance(_RE_CAPACITE, texte)
+    return (
+        match_temps.span() if match_temps else None,
+        match_capacite.span() if match_capacite else None,
+    )
+
+
 def extraire_preambules(texte):
     logger.debug("Début extraction des préambules.")
-    
-    motifs_temps = [
-        r"(à|a) la fin (du|de la|de l’|de|d’)[^,:\n]+",
-        r"au terme (du|de la|de l’|de|d’)[^,:\n]+",
-        r"(à|a) l’issue (du|de la|de l’|de|d’)[^,:\n]+",
-        r"au bout (du|de la|de l’|de|d’)[^,:\n]+"
-    ]
-
-    sujets = [
-        r"(?:les|l)[’']?(?:apprenant|étudiant)(?:e|\(e\)|\.e|·e)?(?:s|\(s\)|\.s|·s)?", 
-        r"il(?:s|\(s\)|\.s|·s)?", 
-        r"elle(?:s|\(s\)|\.s|·s)?", 
-        r"on"
-    ]
-    verbes = [
-        r"(?:sera|seront) capable(?:s|\(s\)|\.s|·s)? (?:de|d[’'])",
-        r"(?:pourra|pourront)",
-        r"(?:sera|seront) en mesure (?:de|d[’'])"
-    ]
-    motifs_capacite = [f"{sujet} {verbe}" for sujet in sujets for verbe in verbes]
 
     temps = None
     capacite = None
 
-    for motif in motifs_temps:
-        match = re.search(motif, texte, flags=re.IGNORECASE)
-        if match:
-            temps = match.group(0).strip().capitalize()
-            logger.info(f"Préambule temporel détecté : {temps}")
-            break
+    match = _premiere_correspondance(_RE_TEMPS, texte)
+    if match:
+        temps = match.group(0).strip().capitalize()
+        logger.info(f"Préambule temporel détecté : {temps}")
 
-    for motif in motifs_capacite:
-        match = re.search(motif, texte, flags=re.IGNORECASE)
-        if match:
-            capacite = match.group(0).strip().capitalize()
-            logger.info(f"Préambule de capacité détecté : {capacite}")
-            break
+    match = _premiere_correspondance(_RE_CAPACITE, texte)
+    if match:
+        capacite = match.group(0).strip().capitalize()
+        logger.info(f"Préambule de capacité détecté : {capacite}")
 
     return temps, capacite
 
 
-def decouper_objectifs(texte):
+@dataclass(slots=True)
+class Objectif:
+    """
+    Objectif pédagogique tel qu'il circule dans le pipeline.
+
+    Les prompts désignent l'objectif par son identifiant (« OG », « OS1 », …) ;
+    le texte d'origine est réinséré localement lors du rendu. Les objectifs
+    quasi identiques regroupés avec celui-ci sont conservés dans doublons.
+    """
+    id: str
+    texte: str
+    span_temps: Optional[Tuple[int, int]] = None
+    span_capacite: Optional[Tuple[int, int]] = None
+    verbes: Tuple[str, ...] = ()
+    doublons: Tuple["Objectif", ...] = ()
+
+    def __post_init__(self):
+        # Le checkpointer restitue les tuples sous forme de listes
+        self.span_temps = tuple(self.span_temps) if self.span_temps else None
+        self.span_capacite = tuple(self.span_capacite) if self.span_capacite else None
+        self.verbes = tuple(self.verbes)
+        self.doublons = tuple(self.doublons)
+
+    @property
+    def num(self) -> Optional[int]:
+        """Numéro de l'objectif spécifique (None pour l'objectif général)."""
+        return None if self.id == ID_OBJECTIF_GENERAL else int(self.id[2:])
+
+    @property
+    def libelle(self) -> str:
+        return "Objectif général" if self.num is None else f"Objectif {self.num}"
+
+    def __str__(self):
+        return self.texte
+
+
+def creer_objectif(identifiant, texte):
+    """
+    Construit un Objectif en relevant ses préambules et ses verbes d'action.
+
+    Args:
+        identifiant (str): « OG » pour l'objectif général, « OS<n> » pour le n-ième objectif spécifique
+        texte (str): Texte de l'objectif
+
+    Returns:
+        Objectif: L'objectif structuré
+    """
+    span_temps, span_capacite = localiser_preambules(texte)
+    verbes = tuple(detection.verbe for detection in detecter_verbes(texte) if detection.infinitif)
+    return Objectif(identifiant, texte, span_temps, span_capacite, verbes)
+
+
+# Séparateurs de listes d'objectifs, par ordre de priorité : le premier style
+# qui découpe le texte en plus d'une partie l'emporte.
+MOTIFS_DECOUPAGE = [
+    ("numerote", r"(?:^|\n)\s*(?:\d+[.)])\s+"),
+    ("puce", r"(?:^|\n)\s*[-•]\s+"),
+    ("romain", r"(?:^|\n)\s*(?:[ivxlcdmIVXLCDM]+[.)])\s+"),
+    ("lettre", r"(?:^|\n)\s*[a-zA-Z][.)]\s+"),
+    ("point_virgule", r";\s*(?=\n|$)"),
+    ("virgule", r",\s*(?=\n|$)"),
+    ("ligne_vide", r"\n{2,}"),
+]
+_RE_DECOUPAGE = {style: re.compile(motif) for style, motif in MOTIFS_DECOUPAGE}
+
+# Marqueurs de début de ligne, repérés ligne par ligne en un seul parcours.
+# Une lettre seule qui est aussi un chiffre romain (« c. », « i) ») signale les deux styles.
+_RE_MARQUEUR = re.compile(
+    r"(?P<numerote>\d+[.)])|(?P<puce>[-•])|(?P<lettre_romain>[ivxlcdmIVXLCDM][.)])"
+    r"|(?P<romain>[ivxlcdmIVXLCDM]+[.)])|(?P<lettre>[a-zA-Z][.)])"
+)
+
+
+def detecter_styles_liste(texte, complet=True):
+    """
+    Repère en un seul parcours des lignes les styles de liste susceptibles de découper le texte.
+
+    Le repérage est permissif : un style absent de l'ensemble renvoyé ne peut pas
+    découper le texte, un style présent doit encore être confirmé par le découpage.
+
+    Args:
+        texte (str): Objectifs bruts
+        complet (bool): Si False, s'arrête à la première ligne numérotée, aucun
+            autre style n'étant prioritaire sur la numérotation.
+
+    Returns:
+        set[str]: Styles présents, parmi ceux de MOTIFS_DECOUPAGE
+    """
+    styles = set()
+    lignes = texte.split("\n")
+    derniere = len(lignes) - 1
+    marqueur = _RE_MARQUEUR.match
+    for position, ligne in enumerate(lignes):
+        if not ligne:
+            # Une ligne vide qui n'est ni la première ni la dernière correspond à « \n\n »
+            if 0 < position < derniere:
+                styles.add("ligne_vide")
+            continue
+        match = marqueur(ligne.lstrip())
+        if match:
+            if match.lastgroup == "numerote" and not complet:
+                return {"numerote"}
+            styles.add(match.lastgroup)
+        fin = ligne.rstrip()[-1:]
+        if fin == ";":
+            styles.add("point_virgule")
+        elif fin == ",":
+            styles.add("virgule")
+    if "lettre_romain" in styles:
+        styles.discard("lettre_romain")
+        styles.update(("romain", "lettre"))
+    return styles
+
+
+def _parties(texte, separateur):
+    # re.split reste en C ; seul le nettoyage des parties est fait au fil de l'eau
+    for partie in separateur.split(texte):
+        if partie and not partie.isspace():
+            yield partie.strip(" \n\t\r:.-")
+
+
+def iterer_objectifs(texte):
+    """
+    Découpe une liste d'objectifs et produit les objectifs au fil de l'eau.
+
+    Le texte est parcouru une fois pour repérer les styles de liste présents
+    (numérotée, à puces, romaine, par lettres, terminée par « ; » ou « , »,
+    séparée par des lignes vides), puis une fois pour découper selon le style
+    prioritaire. Le résultat est identique à l'essai successif des séparateurs
+    de MOTIFS_DECOUPAGE.
+
+    Args:
+        texte (str): Objectifs bruts (formulaire ou document complet)
+
+    Yields:
+        str: Objectifs nettoyés, dans l'ordre du texte
+    """
     logger.debug("Tentative de découpage des objectifs.")
-    split_patterns = [
-        r"(?:^|\n)\s*(?:\d+[.)])\s+",
-        r"(?:^|\n)\s*[-•]\s+",
-        r"(?:^|\n)\s*(?:[ivxlcdmIVXLCDM]+[.)])\s+",
-        r"(?:^|\n)\s*[a-zA-Z][.)]\s+",
-        r";\s*(?=\n|$)",
-        r",\s*(?=\n|$)",
-        r"\n{2,}",
-    ]
-
-    for pattern in split_patterns:
-        parts = re.split(pattern, texte)
-        parts = [p.strip(" \n\t\r:.-") for p in parts if p.strip()]
-        if len(parts) > 1:
-            logger.info(f"Découpage réussi avec le motif : {pattern}")
-            return parts
+    styles = detecter_styles_liste(texte, complet=False)
+
+    for style, motif in MOTIFS_DECOUPAGE:
+        if style not in styles:
+            continue
+        parties = _parties(texte, _RE_DECOUPAGE[style])
+        premiere = next(parties, None)
+        deuxieme = next(parties, None)
+        if deuxieme is None:
+            if style == "numerote":
+                # Repérage interrompu à la première ligne numérotée : on le complète
+                styles = detecter_styles_liste(texte)
+            continue
+        logger.info(f"Découpage réussi avec le motif : {motif}")
+        yield premiere
+        yield deuxieme
+        yield from parties
+        return
 
     logger.warning("Aucun découpage réussi. Retour du texte brut.")
-    return [texte.strip()]
+    yield texte.strip()
+
+
+def decouper_objectifs(texte):
+    return list(iterer_objectifs(texte))
+
+
+def nettoyer_objectifs_specifiques(objectif_general, objectifs_specifiques, structures=False):
+    """
+    Découpe les objectifs spécifiques saisis et complète leur préambule.
 
+    Args:
+        objectif_general (str): Objectif général du cours
+        objectifs_specifiques (str | list): Objectifs spécifiques bruts
+        structures (bool): Si True, renvoie des Objectif identifiés « OS1 », « OS2 », …
 
-def nettoyer_objectifs_specifiques(objectif_general, objectifs_specifiques):
+    Returns:
+        list: Objectifs spécifiques nettoyés (str, ou Objectif si structures=True)
+    """
     logger.info("\n\nNettoyage des objectifs spécifiques lancé.")
     
     # Étape 1: Déterminer le préambule global à partir de l'objectif général et des objectifs spécifiques bruts.
@@ -129,4 +316,6 @@ def nettoyer_objectifs_specifiques(objectif_general, objectifs_specifiques):
         objectifs_specifiques_nettoyes.append(obj)
 
     logger.info("Nettoyage terminé. Objectifs spécifiques traités : %d", len(objectifs_specifiques_nettoyes))
+    if structures:
+        return [creer_objectif(f"OS{num}", obj) for num, obj in enumerate(objectifs_specifiques_nettoyes, 1)]
     return objectifs_specifiques_nettoyes
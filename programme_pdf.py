@@ -0,0 +1,346 @@
+"""
+Rapport PDF consolidé d'un programme : tous les cours dans un seul document.
+
+Un document fpdf2 garde toutes ses pages en mémoire jusqu'à output(). Pour un
+programme de 50 à 150 cours, chaque cours est donc rendu seul (page de garde
+du cours et chapitres 1 à 4) puis ses objets PDF sont recopiés, renumérotés,
+dans le fichier de sortie avant de passer au suivant : seuls le cours en cours
+de rendu et quelques numéros d'objets par page restent en mémoire.
+
+Les pages liminaires (page de garde du programme, avertissement, sommaire) et
+l'annexe de méthode, partagée par tous les cours, sont rendues en dernier,
+lorsque la pagination des cours est connue. L'arbre des pages, les signets
+(un par cours, un par chapitre) et la numérotation des pages (romaine pour les
+pages liminaires) sont écrits à la fin du fichier.
+
+Les polices ne sont embarquées qu'une fois : tous les documents partagent le
+même sous-ensemble de glyphes (codes identiques d'un cours à l'autre), les
+documents des cours sont produits sans polices et seules celles du dernier
+document rendu, qui couvrent tous les caractères, sont écrites. La sortie des
+cours passe par OutputProducer, interne à fpdf2 (version fixée dans
+requirements.txt).
+"""
+
+import gc
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+from babel.dates import format_date
+from fpdf.enums import XPos, YPos
+from fpdf.fonts import SubsetMap
+from fpdf.output import OutputProducer, PDFFont
+
+from generation_pdf import DonneesRapport, RapportPDF
+
+logger = logging.getLogger(__name__)
+
+_RE_REFERENCE = re.compile(rb"(\d+) 0 R")
+_RE_TRAILER = re.compile(rb"/(Root|Info) (\d+) 0 R")
+_RE_NOM_POLICE = re.compile(rb"/BaseFont /(\S+)")
+
+
+def _chaine_pdf(texte: str) -> bytes:
+    # Chaîne de texte PDF en UTF-16BE, pour les titres des signets et les métadonnées
+    return b"<FEFF" + texte.encode("utf-16-be").hex().upper().encode("ascii") + b">"
+
+
+class _SortiePolicesPartagees(OutputProducer):
+    # Sortie fpdf2 d'un document intermédiaire : polices TrueType réduites à un objet portant
+    # leur nom, remplacé à la copie par la police embarquée avec le dernier document
+    def _add_fonts(self):
+        polices = self.fpdf.fonts
+        truetype = sorted((police for police in polices.values() if police.type == "TTF"), key=lambda police: police.i)
+        self.fpdf.fonts = {cle: police for cle, police in polices.items() if police.type != "TTF"}
+        try:
+            objets = super()._add_fonts()
+        finally:
+            self.fpdf.fonts = polices
+        for police in truetype:
+            objet = PDFFont(subtype="Type0", base_font=f"MPDFAA+{police.name}")
+            self._add_pdf_obj(objet, "fonts")
+            objets[police.i] = objet
+            # Comme fpdf2 après l'incorporation d'une police : ces caches, communs à tous les
+            # SubsetMap, retiendraient sinon chaque document et ses polices
+            police.subset.pick.cache_clear()
+            police.subset.get_glyph.cache_clear()
+        return objets
+
+
+class RapportProgrammePDF(RapportPDF):
+    """
+    Partie d'un rapport de programme : un cours, ou les pages liminaires et l'annexe.
+
+    Les pages sont numérotées à partir de premiere_page, après les pages_liminaires
+    qui ne portent pas de numéro ; chaque début de chapitre est relevé pour les signets.
+    Les documents d'un même programme partagent les sous-ensembles des polices
+    DejaVu : un caractère a le même code dans tous, et le dernier document rendu
+    embarque des polices valables pour tous les autres.
+    """
+
+    def __init__(self, premiere_page: int = 1, pages_liminaires: float = 0, sous_ensembles: Optional[Dict[str, SubsetMap]] = None):
+        super().__init__()
+        if sous_ensembles is not None:
+            for cle, police in self.fonts.items():
+                police.subset = sous_ensembles.setdefault(cle, police.subset)
+        self.premiere_page = premiere_page
+        self.pages_liminaires = pages_liminaires
+        # (page du document, titre du chapitre)
+        self.chapitres: List[Tuple[int, str]] = []
+        self.set_left_margin(15)
+        self.set_right_margin(15)
+
+    def chapter_title(self, num, label):
+        self.chapitres.append((self.page_no(), label))
+        super().chapter_title(num, label)
+
+    def footer(self):
+        if self.page_no() <= self.pages_liminaires:
+            return
+        self.set_y(-15)
+        self.set_font("helvetica", style="I", size=8)
+        self.set_text_color(128)
+        self.cell(0, 10, f"Page {self.page_no() - self.pages_liminaires + self.premiere_page - 1}", align="C")
+
+    def add_sommaire(self, entrees: List[Tuple[str, int]]):
+        """
+        Sommaire du programme : un cours par ligne avec sa première page.
+
+        Args:
+            entrees (list): (nom du cours, numéro de page)
+        """
+        self.is_page_de_garde = True
+        self.add_page()
+        self.set_font("DejaVu", "B", 16)
+        self.set_text_color(25, 25, 112)
+        self.cell(0, 12, "Sommaire", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.ln(6)
+
+        self.set_font("DejaVu", "", 10)
+        self.set_text_color(0, 0, 0)
+        largeur_nom = self.epw - 20
+        for nom, page in entrees:
+            if self.get_string_width(nom) > largeur_nom - 2 * self.c_margin:
+                while nom and self.get_string_width(nom + "…") > largeur_nom - 2 * self.c_margin:
+                    nom = nom[:-1]
+                nom += "…"
+            self.cell(largeur_nom, 7, nom, border="B")
+            self.cell(20, 7, str(page), border="B", align="R", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+
+
+class _EcrivainPDF:
+    """Écrit un fichier PDF objet par objet et garde seulement la position de chacun."""
+
+    def __init__(self, fichier: BinaryIO):
+        self.fichier = fichier
+        self.positions: Dict[int, int] = {}
+        self.prochain = 1
+        # Nom de police TrueType -> numéro de son objet dans le fichier de sortie
+        self.polices: Dict[bytes, int] = {}
+        self._ecrire(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _ecrire(self, octets: bytes):
+        self.fichier.write(octets)
+
+    def reserver(self) -> int:
+        numero = self.prochain
+        self.prochain += 1
+        return numero
+
+    def ecrire_objet(self, numero: int, corps: bytes):
+        self.positions[numero] = self.fichier.tell()
+        self._ecrire(b"%d 0 obj\n" % numero + corps + b"\nendobj\n")
+
+    def copier_document(self, octets: bytes, parent: int, polices_provisoires: bool) -> List[int]:
+        """
+        Recopie les objets d'un PDF produit par fpdf2, sauf son catalogue, sa racine
+        de pages et ses métadonnées.
+
+        Les polices TrueType sont partagées entre les documents (même sous-ensemble,
+        voir RapportProgrammePDF) : leurs références pointent toutes vers un même
+        objet par police, écrit avec le dernier document.
+
+        Args:
+            octets (bytes): PDF à table de références classique (sortie de FPDF.output)
+            parent (int): Racine des pages du fichier de sortie
+            polices_provisoires (bool): Polices du document non recopiées (document intermédiaire,
+                voir _SortiePolicesPartagees), un document suivant embarquant le sous-ensemble complet
+
+        Returns:
+            list[int]: Numéros des pages recopiées, dans l'ordre du document
+        """
+        debut_xref = int(octets[octets.rindex(b"startxref") + 9:].split()[0])
+        lignes = octets[debut_xref:].split(b"\n", 3)
+        premier, nombre = (int(n) for n in lignes[1].split())
+        table = lignes[2] + b"\n" + lignes[3]
+        positions = {
+            premier + i: int(table[i * 20:i * 20 + 10])
+            for i in range(nombre)
+            if table[i * 20 + 17:i * 20 + 18] == b"n"
+        }
+        references = dict(_RE_TRAILER.findall(octets[debut_xref + 20 * nombre:]))
+        racine, info = int(references[b"Root"]), int(references.get(b"Info", 0))
+
+        ordre = sorted(positions, key=positions.get)
+        fins = {numero: positions[suivant] for numero, suivant in zip(ordre, ordre[1:])}
+        fins[ordre[-1]] = debut_xref
+
+        def corps(numero: int) -> bytes:
+            objet = octets[positions[numero]:fins[numero]]
+            return objet[objet.index(b"obj\n") + 4:objet.rindex(b"endobj")].rstrip(b"\n")
+
+        def dictionnaire(numero: int) -> bytes:
+            objet = corps(numero)
+            separation = objet.find(b"stream\n")
+            return objet if separation < 0 else objet[:separation]
+
+        pages_source = int(re.search(rb"/Pages (\d+) 0 R", corps(racine)).group(1))
+        correspondance = {pages_source: parent}
+        ignores = {racine, info, pages_source}
+        for numero in ordre:
+            # Police TrueType de premier niveau, référencée par les ressources des pages
+            entete = dictionnaire(numero)
+            if b"/Subtype /Type0" not in entete:
+                continue
+            nom = _RE_NOM_POLICE.search(entete).group(1)
+            if nom not in self.polices:
+                self.polices[nom] = self.reserver()
+            correspondance[numero] = self.polices[nom]
+            if polices_provisoires:
+                ignores.add(numero)
+        for numero in ordre:
+            if numero not in ignores and numero not in correspondance:
+                correspondance[numero] = self.reserver()
+
+        def renumeroter(dictionnaire: bytes) -> bytes:
+            return _RE_REFERENCE.sub(lambda m: b"%d 0 R" % correspondance[int(m.group(1))], dictionnaire)
+
+        for numero in ordre:
+            if numero in ignores:
+                continue
+            objet = corps(numero)
+            # Flux recopiés tels quels : seul le dictionnaire qui les précède est renuméroté
+            separation = objet.find(b"stream\n")
+            if separation < 0:
+                objet = renumeroter(objet)
+            else:
+                objet = renumeroter(objet[:separation]) + objet[separation:]
+            self.ecrire_objet(correspondance[numero], objet)
+
+        kids = re.search(rb"/Kids \[(.*?)\]", corps(pages_source), re.S).group(1)
+        return [correspondance[int(n)] for n in _RE_REFERENCE.findall(kids)]
+
+    def terminer(self, racine: int, info: int):
+        debut_xref = self.fichier.tell()
+        self._ecrire(b"xref\n0 %d\n0000000000 65535 f \n" % self.prochain)
+        for numero in range(1, self.prochain):
+            self._ecrire(b"%010d 00000 n \n" % self.positions[numero])
+        self._ecrire(b"trailer\n<<\n/Size %d\n/Root %d 0 R\n/Info %d 0 R\n>>\n" % (self.prochain, racine, info))
+        self._ecrire(b"startxref\n%d\n%%%%EOF\n" % debut_xref)
+
+
+def _ecrire_signets(ecrivain: _EcrivainPDF, signets: List[Tuple[str, int, List[Tuple[str, int]]]]) -> int:
+    # Signets de premier niveau (pages liminaires, cours, annexe), ceux des cours repliés sur leurs chapitres
+    racine = ecrivain.reserver()
+    numeros = [ecrivain.reserver() for _ in signets]
+    for i, (titre, page, enfants) in enumerate(signets):
+        champs = [b"/Title " + _chaine_pdf(titre), b"/Parent %d 0 R" % racine, b"/Dest [%d 0 R /Fit]" % page]
+        if i > 0:
+            champs.append(b"/Prev %d 0 R" % numeros[i - 1])
+        if i < len(signets) - 1:
+            champs.append(b"/Next %d 0 R" % numeros[i + 1])
+        if enfants:
+            numeros_enfants = [ecrivain.reserver() for _ in enfants]
+            champs += [b"/First %d 0 R" % numeros_enfants[0], b"/Last %d 0 R" % numeros_enfants[-1], b"/Count -%d" % len(enfants)]
+            for j, (titre_enfant, page_enfant) in enumerate(enfants):
+                champs_enfant = [b"/Title " + _chaine_pdf(titre_enfant), b"/Parent %d 0 R" % numeros[i], b"/Dest [%d 0 R /Fit]" % page_enfant]
+                if j > 0:
+                    champs_enfant.append(b"/Prev %d 0 R" % numeros_enfants[j - 1])
+                if j < len(enfants) - 1:
+                    champs_enfant.append(b"/Next %d 0 R" % numeros_enfants[j + 1])
+                ecrivain.ecrire_objet(numeros_enfants[j], b"<<\n" + b"\n".join(champs_enfant) + b"\n>>")
+        ecrivain.ecrire_objet(numeros[i], b"<<\n" + b"\n".join(champs) + b"\n>>")
+    ecrivain.ecrire_objet(racine, b"<<\n/Type /Outlines\n/First %d 0 R\n/Last %d 0 R\n/Count %d\n>>" % (numeros[0], numeros[-1], len(signets)))
+    return racine
+
+
+def generer_pdf_programme(programme: str, cours: Iterable[DonneesRapport], chemin: str, date: Optional[str] = None) -> str:
+    """
+    Génère le rapport PDF consolidé d'un programme, cours par cours.
+
+    Args:
+        programme (str): Intitulé du programme, repris en page de garde
+        cours (Iterable[DonneesRapport]): Contenu du rapport de chaque cours, consommé au fur et à mesure
+        chemin (str): Fichier PDF à écrire
+        date (str): Date du programme imprimée en page de garde (ISO 8601) ; la date du jour si elle est omise
+
+    Returns:
+        str: Chemin du fichier écrit
+
+    Raises:
+        ValueError: Si aucun cours n'est fourni
+    """
+    debut = time.perf_counter()
+    with open(chemin, "wb") as fichier:
+        ecrivain = _EcrivainPDF(fichier)
+        catalogue, racine_pages = ecrivain.reserver(), ecrivain.reserver()
+
+        # Cours : rendus un par un, pages numérotées à la suite
+        sous_ensembles: Dict[str, SubsetMap] = {}
+        pages_cours: List[int] = []
+        sommaire: List[Tuple[str, int]] = []
+        signets_cours: List[Tuple[str, int, List[Tuple[str, int]]]] = []
+        for donnees in cours:
+            pdf = RapportProgrammePDF(premiere_page=len(pages_cours) + 1, sous_ensembles=sous_ensembles)
+            pdf.add_page_de_garde_cours(donnees.nom_cours, date=format_date(donnees.date_analyse(), format='d MMMM y', locale='fr'))
+            pdf.composer_chapitres(donnees)
+            pages = ecrivain.copier_document(bytes(pdf.output(output_producer_class=_SortiePolicesPartagees)), racine_pages, polices_provisoires=True)
+            sommaire.append((donnees.nom_cours, len(pages_cours) + 1))
+            signets_cours.append((donnees.nom_cours, pages[0], [(titre, pages[page - 1]) for page, titre in pdf.chapitres]))
+            pages_cours += pages
+            # Document du cours pris dans des cycles de références : libéré avant le suivant
+            del pdf
+            gc.collect()
+            logger.debug(f"Cours « {donnees.nom_cours} » ajouté au rapport du programme ({len(pages)} pages)")
+        if not sommaire:
+            raise ValueError("Aucun cours à inclure dans le rapport du programme")
+
+        # Pages liminaires et annexe partagée, une fois la pagination des cours connue ; ce dernier
+        # document embarque les polices, sous-ensemble de tous les caractères utilisés
+        cadre = RapportProgrammePDF(premiere_page=len(pages_cours) + 1, pages_liminaires=float("inf"), sous_ensembles=sous_ensembles)
+        cadre.set_title(f"Analyse des objectifs pédagogiques du programme {programme}")
+        cadre.add_page_de_garde(
+            titre=f"Rapport d’analyse des objectifs pédagogiques du programme {programme}",
+            sous_titre=f"{len(sommaire)} cours évalués selon la taxonomie de Bloom et des critères SMART adaptés au contexte pédagogique",
+            date=format_date(datetime.fromisoformat(date) if date else datetime.now(), format='d MMMM y', locale='fr'))
+        cadre.add_disclaimer()
+        page_sommaire = cadre.page_no() + 1
+        cadre.add_sommaire(sommaire)
+        cadre.pages_liminaires = cadre.page_no()
+        cadre.add_methode_analyse()
+        pages_cadre = ecrivain.copier_document(bytes(cadre.output()), racine_pages, polices_provisoires=False)
+        liminaires, annexe = pages_cadre[:cadre.pages_liminaires], pages_cadre[cadre.pages_liminaires:]
+
+        signets = [
+            ("Avertissement", liminaires[1], []),
+            ("Sommaire", liminaires[page_sommaire - 1], []),
+            *signets_cours,
+            ("Annexe : Méthode d'analyse", annexe[0], []),
+        ]
+        racine_signets = _ecrire_signets(ecrivain, signets)
+
+        pages = liminaires + pages_cours + annexe
+        ecrivain.ecrire_objet(racine_pages, b"<<\n/Type /Pages\n/Count %d\n/Kids [%s]\n/MediaBox [0 0 595.28 841.89]\n>>" % (
+            len(pages), b" ".join(b"%d 0 R" % page for page in pages)))
+        ecrivain.ecrire_objet(catalogue, (
+            b"<<\n/Type /Catalog\n/Pages %d 0 R\n/Outlines %d 0 R\n/PageMode /UseOutlines\n/PageLayout /OneColumn\n"
+            b"/PageLabels << /Nums [0 << /S /r >> %d << /S /D >>] >>\n>>" % (racine_pages, racine_signets, len(liminaires))))
+        info = ecrivain.reserver()
+        ecrivain.ecrire_objet(info, b"<<\n/Title %s\n/CreationDate (D:%sZ)\n>>" % (
+            _chaine_pdf(cadre.title), datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S").encode("ascii")))
+        ecrivain.terminer(catalogue, info)
+
+    logger.info(f"Rapport du programme {programme} écrit dans {chemin} : {len(sommaire)} cours, {len(pages)} pages en {time.perf_counter() - debut:.1f} s")
+    return chemin
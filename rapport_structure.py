@@ -0,0 +1,217 @@
+"""
+Sorties structurées (JSON) des étapes d'évaluation et de suggestions.
+
+Avec les versions de prompts « json » du registre, le modèle répond dans un
+JSON contraint par les schémas ci-dessous (mode JSON du fournisseur). Le
+rapport Markdown est ensuite mis en forme localement à partir de ces réponses,
+dans le format des prompts texte ; le récapitulatif en est tiré par
+recapitulatif_local.py, sans appel au LLM.
+"""
+
+import logging
+from typing import Dict, List
+
+from bloom_lexique import NIVEAUX_BLOOM
+from pretraitement_obj_spe import ID_OBJECTIF_GENERAL, Objectif
+
+logger = logging.getLogger(__name__)
+
+# Clé dans les réponses JSON et libellé dans le rapport, dans l'ordre d'évaluation
+CRITERES = (
+    ("specifique", "Spécifique"),
+    ("mesurable", "Mesurable"),
+    ("approprie", "Approprié (Cohérent)"),
+    ("realiste", "Réaliste"),
+    ("temporel", "Temporellement défini"),
+)
+
+_SCHEMA_CRITERE = {
+    "type": "object",
+    "properties": {
+        "commentaire": {"type": "string"},
+        "note": {"type": "integer", "minimum": 1, "maximum": 5},
+    },
+    "required": ["commentaire", "note"],
+}
+
+SCHEMA_EVALUATION = {
+    "type": "object",
+    "properties": {
+        "objectifs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "description": "Identifiant de l'objectif (OG, OS1, ...)"},
+                    "niveau": {"type": "string", "enum": list(NIVEAUX_BLOOM)},
+                    "criteres": {
+                        "type": "object",
+                        "properties": {cle: _SCHEMA_CRITERE for cle, _ in CRITERES},
+                        "required": [cle for cle, _ in CRITERES],
+                    },
+                },
+                "required": ["id", "niveau", "criteres"],
+            },
+        },
+        "completude": _SCHEMA_CRITERE,
+        "resume": {"type": "string"},
+    },
+    "required": ["objectifs", "completude", "resume"],
+}
+
+SCHEMA_SUGGESTIONS = {
+    "type": "object",
+    "properties": {
+        "objectifs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "description": "Identifiant de l'objectif (OG, OS1, ...)"},
+                    "probleme_resume": {"type": "string", "description": "Vide si l'objectif est déjà optimal"},
+                    "recommandations": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "criteres": {"type": "string"},
+                                "texte": {"type": "string"},
+                            },
+                            "required": ["criteres", "texte"],
+                        },
+                    },
+                    "reformulation": {"type": "string", "description": "Objectif reformulé en entier, ou vide"},
+                },
+                "required": ["id", "probleme_resume", "recommandations", "reformulation"],
+            },
+        },
+        "points_forts": {"type": "array", "items": {"type": "string"}},
+        "axes_amelioration": {"type": "array", "items": {"type": "string"}},
+        "recommandations": {"type": "array", "items": {"type": "string"}},
+        "resume": {"type": "string"},
+    },
+    "required": ["objectifs", "points_forts", "axes_amelioration", "recommandations", "resume"],
+}
+
+# Champs rédigés du récapitulatif, demandés seuls lorsque les suggestions sont en texte
+SCHEMA_CHAMPS_LIBRES = {
+    "type": "object",
+    "properties": {
+        "points_forts": {"type": "array", "items": {"type": "string"}},
+        "axes_amelioration": {"type": "array", "items": {"type": "string"}},
+        "recommandations": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["points_forts", "axes_amelioration", "recommandations"],
+}
+
+
+def par_identifiant(reponse: Dict, objectifs: List[Objectif], complet: bool = True) -> Dict[str, Dict]:
+    """
+    Entrées de la réponse indexées par identifiant, limitées aux objectifs connus.
+
+    Avec complet=True, les objectifs absents de la réponse sont signalés.
+    """
+    connus = {objectif.id for objectif in objectifs}
+    entrees = {}
+    for entree in reponse.get("objectifs", []):
+        identifiant = str(entree.get("id", "")).strip("[] ").upper()
+        if identifiant in connus:
+            entrees.setdefault(identifiant, entree)
+        else:
+            logger.warning(f"Identifiant d'objectif inconnu dans la réponse JSON : {identifiant}")
+    manquants = connus - entrees.keys()
+    if complet and manquants:
+        logger.warning(f"Objectif(s) absent(s) de la réponse JSON : {', '.join(sorted(manquants))}")
+    return entrees
+
+
+def notes_objectif(entree: Dict) -> Dict[str, int]:
+    criteres = entree.get("criteres", {})
+    return {cle: int(criteres[cle]["note"]) for cle, _ in CRITERES if cle in criteres}
+
+
+def _ligne_notes(identifiant: str, notes: Dict[str, int]) -> str:
+    return "- Objectif {} : {}.".format(
+        identifiant,
+        ", ".join(f"{libelle} ({notes[cle]}/5)" for cle, libelle in CRITERES if cle in notes)
+    )
+
+
+def _analyse_objectif(entree: Dict, gras: bool = False) -> List[str]:
+    lignes = [f"- Niveau : {entree.get('niveau', '')}"]
+    criteres = entree.get("criteres", {})
+    for cle, libelle in CRITERES:
+        if cle in criteres:
+            note = f"{criteres[cle]['note']}/5"
+            lignes.append(f"- {libelle} : {criteres[cle]['commentaire'].rstrip('.')}. Note : {f'**{note}**' if gras else note}")
+    return lignes
+
+
+def _resume(evaluation: Dict, objectifs: List[Objectif], entrees: Dict[str, Dict]) -> List[str]:
+    lignes = [evaluation.get("resume", "").strip(), ""]
+    lignes += [_ligne_notes(objectif.id, notes_objectif(entrees[objectif.id])) for objectif in objectifs if objectif.id in entrees]
+    completude = evaluation.get("completude")
+    if completude:
+        lignes += ["", f"Complétude ({completude['note']}/5)"]
+    return lignes
+
+
+def rendre_evaluation(evaluation: Dict, objectifs: List[Objectif]) -> str:
+    """
+    Met en forme une évaluation JSON au format texte de PROMPT_EVALUATION_OBJECTIFS.
+
+    Args:
+        evaluation (dict): Réponse conforme à SCHEMA_EVALUATION
+        objectifs (list[Objectif]): Objectif général puis objectifs spécifiques
+
+    Returns:
+        str: Évaluation désignant les objectifs par leur identifiant
+    """
+    entrees = par_identifiant(evaluation, objectifs)
+    lignes = []
+    for objectif in objectifs:
+        if objectif.id in entrees:
+            lignes += [f"Objectif {objectif.id} :", *_analyse_objectif(entrees[objectif.id]), ""]
+    completude = evaluation.get("completude")
+    if completude:
+        lignes += [f"Complétude : {completude['commentaire'].rstrip('.')}. Note : {completude['note']}/5", ""]
+    lignes += ["Résumé :", *_resume(evaluation, objectifs, entrees)]
+    return "\n".join(lignes).strip()
+
+
+def rendre_suggestions(evaluation: Dict, suggestions: Dict, objectifs: List[Objectif]) -> str:
+    """
+    Assemble l'évaluation et les suggestions JSON au format texte de PROMPT_AMELIORER_OBJECTIFS.
+
+    Les notes et commentaires viennent de l'évaluation révisée : le modèle de
+    suggestions n'a pas à les recopier.
+    """
+    evaluations = par_identifiant(evaluation, objectifs)
+    propositions = par_identifiant(suggestions, objectifs, complet=False)
+    lignes = []
+    section_specifiques = False
+    for objectif in objectifs:
+        if objectif.id not in evaluations:
+            continue
+        if objectif.id == ID_OBJECTIF_GENERAL:
+            lignes.append(f"#### Objectif {objectif.id} :")
+        else:
+            if not section_specifiques:
+                lignes += ["#### Objectifs spécifiques", ""]
+                section_specifiques = True
+            lignes.append(f"**Objectif {objectif.id} :**")
+        lignes += _analyse_objectif(evaluations[objectif.id], gras=True)
+
+        proposition = propositions.get(objectif.id, {})
+        recommandations = [f"- {reco['criteres']} : {reco['texte']}" for reco in proposition.get("recommandations", [])]
+        if proposition.get("reformulation"):
+            recommandations.append(f"- Reformulation proposée : {proposition['reformulation']}")
+        if recommandations:
+            lignes += ["", "Recommandation(s) :", *recommandations]
+        lignes.append("")
+
+    completude = evaluation.get("completude")
+    if completude:
+        lignes += ["#### Complétude", f"{completude['commentaire'].rstrip('.')}. Note : **{completude['note']}/5**", ""]
+    lignes += ["#### Résumé", suggestions.get("resume", "").strip(), *_resume(evaluation, objectifs, evaluations)[1:]]
+    return "\n".join(lignes).strip()
@@ -0,0 +1,203 @@
+"""
+Construction locale du dictionnaire de récapitulatif (format de PROMPT_RECAPITULATIF).
+
+Les comptes et listes du récapitulatif se déduisent des résultats déjà
+produits par le pipeline : un objectif est conforme s'il obtient 5/5 sur tous
+les critères, les niveaux de Bloom viennent de la classification. Seuls les
+champs rédigés (points forts, axes d'amélioration, recommandations) demandent
+un modèle : ils proviennent de la réponse JSON des suggestions, ou d'un court
+appel dédié avec les versions texte des prompts.
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from bloom_lexique import NIVEAUX_BLOOM
+from doublons import developper_doublons
+from pretraitement_obj_spe import Objectif
+from rapport_structure import CRITERES, par_identifiant, notes_objectif
+from references_objectifs import reattacher_textes
+from score_smart_local import extraire_niveaux_classification, extraire_notes
+
+logger = logging.getLogger(__name__)
+
+# Champs rédigés du récapitulatif, les seuls à demander au modèle
+CHAMPS_LIBRES = ("points_forts", "axes_amelioration", "recommandations")
+
+_RE_ENTETE = re.compile(r"^[ \t>#*\-•]*Objectif\s+\[?(?P<id>OG|OS\d+)\]?[ \t*]*:?[ \t*]*$")
+_RE_PUCE = re.compile(r"^\s*[-*•]\s+(?P<texte>.+)$")
+
+# Par identifiant : (résumé du problème, suggestion)
+Propositions = Dict[str, Tuple[str, str]]
+
+
+def resumer_probleme(notes: Dict[str, int]) -> str:
+    """Résumé local du défaut d'un objectif : les critères qui n'ont pas obtenu 5/5."""
+    faibles = [f"{libelle} ({notes[cle]}/5)" for cle, libelle in CRITERES if cle in notes and notes[cle] < 5]
+    return f"Critère(s) à renforcer : {', '.join(faibles)}" if faibles else ""
+
+
+def assembler_recapitulatif(objectifs: List[Objectif], notes: Dict[str, Dict[str, int]], niveaux: Dict[str, str],
+                            propositions: Optional[Propositions] = None, champs_libres: Optional[Dict[str, List[str]]] = None) -> Dict:
+    """
+    Assemble le récapitulatif à partir des résultats de chaque objectif.
+
+    Les doublons regroupés reçoivent le résultat de leur représentant. Un
+    objectif sans notes n'apparaît ni parmi les conformes ni parmi ceux à
+    améliorer, mais reste compté dans objectifs_total.
+
+    Args:
+        objectifs (list[Objectif]): Objectif général puis représentants des objectifs spécifiques
+        notes (dict): {identifiant: {critère: note}}
+        niveaux (dict): {identifiant: niveau de Bloom}
+        propositions (dict): {identifiant: (résumé du problème, suggestion)}, textes avec identifiants
+        champs_libres (dict): Listes de CHAMPS_LIBRES, textes avec identifiants
+
+    Returns:
+        dict: Même structure que la sortie de recapitulatif, prête pour build_tables
+    """
+    propositions = propositions or {}
+    champs_libres = champs_libres or {}
+
+    def texte_libre(texte: str) -> str:
+        return reattacher_textes(str(texte).strip(), objectifs)
+
+    representants = {membre.id: objectif.id for objectif in objectifs for membre in (objectif, *objectif.doublons)}
+    tous = developper_doublons(objectifs)
+    conformes, a_ameliorer = [], []
+    sans_notes = set()
+    for membre in tous:
+        identifiant = representants[membre.id]
+        notes_membre = notes.get(identifiant)
+        if not notes_membre:
+            sans_notes.add(identifiant)
+            continue
+        num = "Général" if membre.num is None else membre.num
+        if len(notes_membre) == len(CRITERES) and all(note == 5 for note in notes_membre.values()):
+            conformes.append({"num": num, "objectif": membre.texte, "niveau_bloom": niveaux.get(identifiant, "")})
+            continue
+        probleme, suggestion = propositions.get(identifiant, ("", ""))
+        a_ameliorer.append({
+            "num": num,
+            "objectif": membre.texte,
+            "probleme_resume": texte_libre(probleme or resumer_probleme(notes_membre)),
+            "suggestion": texte_libre(suggestion),
+        })
+    if sans_notes:
+        logger.warning(f"Notes introuvables pour {', '.join(sorted(sans_notes))}, objectif(s) absent(s) des tableaux")
+
+    niveaux_utilises = {niveaux[representants[membre.id]] for membre in tous if representants[membre.id] in niveaux}
+    return {
+        "points_forts": [texte_libre(point) for point in champs_libres.get("points_forts", [])],
+        "axes_amelioration": [texte_libre(axe) for axe in champs_libres.get("axes_amelioration", [])],
+        "objectifs_total": len(tous),
+        "objectifs_conformes": {"nbre_total": len(conformes), "liste": conformes},
+        "objectifs_a_ameliorer": {"nbre_total": len(a_ameliorer), "liste": a_ameliorer},
+        "recommandations": [texte_libre(reco) for reco in champs_libres.get("recommandations", [])],
+        "niveaux_bloom_utilises": [niveau for niveau in NIVEAUX_BLOOM if niveau in niveaux_utilises],
+    }
+
+
+def recapitulatif_depuis_json(evaluation: Dict, suggestions: Dict, objectifs: List[Objectif],
+                              champs_libres: Optional[Dict[str, List[str]]] = None) -> Dict:
+    """
+    Récapitulatif complet à partir des réponses JSON (voir rapport_structure.py), sans appel au LLM.
+
+    Args:
+        evaluation (dict): Évaluation révisée, conforme à SCHEMA_EVALUATION
+        suggestions (dict): Suggestions, conformes à SCHEMA_SUGGESTIONS
+        objectifs (list[Objectif]): Objectif général puis représentants des objectifs spécifiques
+        champs_libres (dict): Champs rédigés déjà validés ; par défaut, ceux des suggestions
+    """
+    evaluations = par_identifiant(evaluation, objectifs)
+    propositions = {}
+    for identifiant, proposition in par_identifiant(suggestions, objectifs, complet=False).items():
+        suggestion = proposition.get("reformulation") or "; ".join(
+            reco["texte"] for reco in proposition.get("recommandations", [])
+        )
+        propositions[identifiant] = (proposition.get("probleme_resume", ""), suggestion)
+    return assembler_recapitulatif(
+        objectifs,
+        notes={identifiant: notes_objectif(entree) for identifiant, entree in evaluations.items()},
+        niveaux={identifiant: entree.get("niveau", "") for identifiant, entree in evaluations.items()},
+        propositions=propositions,
+        champs_libres=champs_libres if champs_libres is not None else {champ: suggestions.get(champ, []) for champ in CHAMPS_LIBRES},
+    )
+
+
+def extraire_recommandations(suggestions: str) -> Dict[str, List[str]]:
+    """
+    Relève les recommandations de chaque objectif dans la sortie texte de l'étape de suggestions.
+
+    Returns:
+        dict: {identifiant: [recommandation, ...]}, dans l'ordre du texte
+    """
+    recommandations: Dict[str, List[str]] = {}
+    courant, dans_recommandations = None, False
+    for ligne in suggestions.replace("**", "").splitlines():
+        match = _RE_ENTETE.match(ligne)
+        if match:
+            courant, dans_recommandations = match.group("id"), False
+        elif courant and "recommandation" in ligne.lower() and not _RE_PUCE.match(ligne):
+            dans_recommandations = True
+        elif ligne.startswith("#"):
+            courant, dans_recommandations = None, False
+        elif dans_recommandations:
+            puce = _RE_PUCE.match(ligne)
+            if puce:
+                recommandations.setdefault(courant, []).append(puce.group("texte").strip())
+            elif ligne.strip() and not recommandations.get(courant):
+                # Recommandation rédigée sur la ligne, sans puce
+                recommandations.setdefault(courant, []).append(ligne.strip())
+    return recommandations
+
+
+def recapitulatif_depuis_texte(bloom_classification: str, evaluation: str, suggestions: str, objectifs: List[Objectif],
+                               champs_libres: Optional[Dict[str, List[str]]] = None) -> Dict:
+    """
+    Récapitulatif à partir des sorties texte du pipeline (versions de prompts non JSON).
+
+    Les notes sont lues dans le récapitulatif de l'évaluation révisée, les
+    niveaux dans la classification ; le problème de chaque objectif à améliorer
+    est résumé localement et sa suggestion reprend la première recommandation
+    formulée pour lui.
+
+    Args:
+        bloom_classification (str): Sortie de l'étape classify_bloom
+        evaluation (str): Évaluation révisée
+        suggestions (str): Sortie de l'étape de suggestions, avec identifiants
+        objectifs (list[Objectif]): Objectif général puis représentants des objectifs spécifiques
+        champs_libres (dict): Listes de CHAMPS_LIBRES produites par le modèle, si disponibles
+    """
+    notes = extraire_notes(evaluation)
+    # Les notes recopiées dans les suggestions complètent celles de l'évaluation
+    for identifiant, notes_suggestions in extraire_notes(suggestions).items():
+        notes.setdefault(identifiant, notes_suggestions)
+    recommandations = extraire_recommandations(suggestions)
+    return assembler_recapitulatif(
+        objectifs,
+        notes=notes,
+        niveaux=extraire_niveaux_classification(bloom_classification),
+        propositions={identifiant: ("", lignes[0]) for identifiant, lignes in recommandations.items()},
+        champs_libres=champs_libres,
+    )
+
+
+def recapitulatif_depuis_rapport(details: str, objectifs: List[Objectif]) -> Dict:
+    """
+    Récapitulatif calculé à partir du seul rapport détaillé final (textes des objectifs réinsérés).
+
+    Sert de source locale pour compléter un récapitulatif produit par le LLM
+    lorsque les sorties intermédiaires du pipeline ne sont plus disponibles.
+    """
+    return recapitulatif_depuis_texte(details, details, details, objectifs)
+
+
+def lister_recommandations(suggestions: str) -> str:
+    """Recommandations par objectif, une ligne chacune, pour le prompt des champs rédigés."""
+    return "\n".join(
+        f"- [{identifiant}] {recommandation}"
+        for identifiant, lignes in extraire_recommandations(suggestions).items()
+        for recommandation in lignes
+    )
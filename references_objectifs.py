@@ -0,0 +1,96 @@
+"""
+Références aux objectifs par identifiant dans les prompts et réinsertion de leur texte.
+
+Les prompts transmettent chaque objectif une seule fois, précédé de son
+identifiant (« [OG] », « [OS1] », …), et demandent au modèle de ne plus le
+recopier. Le texte complet est réinséré localement dans les sorties du LLM
+avant affichage ou génération du rapport.
+"""
+
+import re
+import logging
+from typing import Dict, List
+
+from pretraitement_obj_spe import ID_OBJECTIF_GENERAL, Objectif
+
+logger = logging.getLogger(__name__)
+
+_ID = r"(?P<id>OG|OS\d+)"
+_RE_ENTETE = re.compile(
+    rf"^(?P<avant>[ \t>#*\-•]*)Objectif\s+\[?{_ID}\]?(?P<apres>[ \t*]*:?[ \t*]*)$",
+    flags=re.MULTILINE
+)
+_RE_LIBELLE = re.compile(rf"\bObjectif\s+\[?{_ID}\]?")
+_RE_ID_SEUL = re.compile(rf"\[{_ID}\]|\b(?P<id_nu>OG|OS\d+)\b")
+# Ligne du récapitulatif des notes (« Objectif OS2 : Spécifique (4/5), … »)
+_RE_LIGNE_NOTES = re.compile(
+    rf"^(?P<avant>.*?\bObjectif\s+\[?){_ID}(?P<apres>\]?[ \t*]*:?[ \t*]*Spécifique\s*\(.*)$",
+    flags=re.MULTILINE
+)
+
+
+def lister_pour_prompt(objectifs: List[Objectif]) -> str:
+    """Liste les objectifs, une ligne par objectif, précédés de leur identifiant."""
+    return "\n".join(f"[{objectif.id}] {objectif.texte}" for objectif in objectifs)
+
+
+def _libelle(identifiant: str, majuscule: bool = True) -> str:
+    if identifiant == ID_OBJECTIF_GENERAL:
+        libelle = "Objectif général"
+    else:
+        libelle = f"Objectif {identifiant[2:]}"
+    return libelle if majuscule else libelle.lower()
+
+
+def reattacher_textes(texte_llm: str, objectifs: List[Objectif]) -> str:
+    """
+    Remplace les identifiants d'objectifs d'une sortie du LLM par leur libellé et leur texte.
+
+    - Une ligne d'en-tête (« Objectif OS2 : ») devient « Objectif 2 : <texte de l'objectif> » ;
+    - toute autre mention (« Objectif OS2 : Spécifique (4/5)… ») devient « Objectif 2 » ;
+    - un identifiant isolé (« [OS2] ») devient « objectif 2 ».
+
+    Les résultats d'un objectif représentant des doublons sont répercutés sur
+    chacun d'eux : leur texte est cité sous l'en-tête et leur ligne de notes est
+    recopiée dans le récapitulatif.
+    """
+    if not texte_llm:
+        return texte_llm
+    textes: Dict[str, str] = {
+        membre.id: membre.texte
+        for objectif in objectifs
+        for membre in (objectif, *objectif.doublons)
+    }
+    doublons: Dict[str, List[Objectif]] = {objectif.id: list(objectif.doublons) for objectif in objectifs if objectif.doublons}
+
+    def ligne_notes(match):
+        identifiant = match.group("id")
+        lignes = [match.group(0)]
+        for membre in doublons.get(identifiant, ()):
+            lignes.append(f"{match.group('avant')}{membre.id}{match.group('apres')}")
+        return "\n".join(lignes)
+
+    texte_llm = _RE_LIGNE_NOTES.sub(ligne_notes, texte_llm)
+
+    def entete(match):
+        identifiant = match.group("id")
+        if identifiant not in textes:
+            return match.group(0)
+        avant, apres = match.group("avant"), match.group("apres")
+        gras = "**" if "**" in avant and "**" in apres else ""
+        entete = f"{avant}{_libelle(identifiant)} :{gras} {textes[identifiant]}"
+        for membre in doublons.get(identifiant, ()):
+            entete += f"\nÉgalement formulé comme {_libelle(membre.id, majuscule=False)} : {membre.texte}"
+        return entete
+
+    texte = _RE_ENTETE.sub(entete, texte_llm)
+    texte = _RE_LIBELLE.sub(
+        lambda match: _libelle(match.group("id")) if match.group("id") in textes else match.group(0),
+        texte
+    )
+
+    def identifiant_seul(match):
+        identifiant = match.group("id") or match.group("id_nu")
+        return _libelle(identifiant, majuscule=False) if identifiant in textes else match.group(0)
+
+    return _RE_ID_SEUL.sub(identifiant_seul, texte)
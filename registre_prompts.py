@@ -0,0 +1,212 @@
+"""
+Registre versionné des prompts de chaque étape du pipeline.
+
+Chaque version associe un gabarit de prompts.py, son message système et la
+variante de base de connaissances qu'il embarque. Le nombre de tokens de la
+partie fixe est estimé au chargement, ce qui permet de comparer le coût des
+versions. Les variantes « compactes » remplacent la base de connaissances par
+une version condensée (listes de verbes de Bloom réduites aux verbes propres à
+un seul niveau, critères SMART+ résumés).
+
+La version utilisée par étape se choisit par variable d'environnement :
+PROMPT_VERSION_<ETAPE> (par exemple PROMPT_VERSION_EVALUATION=v1-compacte), ou
+PROMPT_VERSION pour toutes les étapes qui proposent cette version.
+
+Les versions « json » des étapes d'évaluation et de suggestions portent un
+schéma de réponse (voir rapport_structure.py) : le modèle est alors appelé en
+mode JSON et le rapport est mis en forme localement.
+"""
+
+import os
+import json
+import math
+import string
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from bloom_lexique import INDEX_VERBES, NIVEAUX_BLOOM
+from prompts import (
+    BASE_CONNAISSANCES_BLOOM,
+    BASE_CONNAISSANCES_PEDAGOGIQUES,
+    BASE_CONNAISSANCES_PEDAGOGIQUES_COMPACTE,
+    BASE_CONNAISSANCES_PEDAGOGIQUES_GEMINI_AUTO_EVAL,
+    BASE_CONNAISSANCES_PEDAGOGIQUES_MISTRAL,
+    BASE_CONNAISSANCES_PEDAGOGIQUES_MISTRAL_V3,
+    PROMPT_CLASSIFICATION_BLOOM,
+    PROMPT_EVALUATION_OBJECTIFS,
+    PROMPT_AUTO_EVAL_EVALUATION,
+    PROMPT_AMELIORER_OBJECTIFS,
+    PROMPT_AUTO_EVAL_SUGGESTIONS,
+    PROMPT_SYNTHESE,
+    PROMPT_RECAPITULATIF,
+    PROMPT_RECAPITULATIF_CHAMPS_LIBRES,
+    PROMPT_EVALUATION_OBJECTIFS_JSON,
+    PROMPT_AUTO_EVAL_EVALUATION_JSON,
+    PROMPT_AMELIORER_OBJECTIFS_JSON
+)
+from rapport_structure import SCHEMA_EVALUATION, SCHEMA_SUGGESTIONS, SCHEMA_CHAMPS_LIBRES
+
+logger = logging.getLogger(__name__)
+
+VERSION_PAR_DEFAUT = "v1"
+# Étapes dont la version par défaut n'est pas VERSION_PAR_DEFAUT
+VERSIONS_PAR_DEFAUT = {
+    "evaluation": "v2-json",
+    "auto_eval_evaluation": "v2-json",
+    "suggestions": "v2-json",
+}
+
+# Ordre de grandeur pour le français avec les tokenizers de type SentencePiece
+CARACTERES_PAR_TOKEN = 4
+
+SYSTEME_PEDAGOGIE = "Tu es un expert en pédagogie universitaire."
+SYSTEME_BLOOM = "Tu es un expert en taxonomie de Bloom révisée."
+
+
+def estimer_tokens(texte: str) -> int:
+    """Estimation du nombre de tokens d'un texte, sans dépendre du tokenizer du modèle."""
+    return math.ceil(len(texte) / CARACTERES_PAR_TOKEN) if texte else 0
+
+
+def _base_bloom_compacte() -> str:
+    lignes = [
+        "Tu es un expert en pédagogie universitaire.",
+        "Niveaux de la taxonomie de Bloom, du plus simple au plus complexe, avec les verbes propres à chaque niveau :",
+    ]
+    for niveau, infos in NIVEAUX_BLOOM.items():
+        explication = ". ".join(infos["explication"].split(". ")[:2]).rstrip(".")
+        propres = [verbe for verbe in infos["verbes"] if len(INDEX_VERBES[verbe]) == 1]
+        lignes.append(f"- {niveau} : {explication}. Verbes : {', '.join(propres)}.")
+    lignes.append(
+        "Un verbe absent de ces listes ou commun à plusieurs niveaux (décrire, identifier, classer, etc.) "
+        "se classe d'après l'ensemble de l'objectif."
+    )
+    return "\n" + "\n".join(lignes) + "\n"
+
+
+BASES_CONNAISSANCES: Dict[str, str] = {
+    "bloom": BASE_CONNAISSANCES_BLOOM,
+    "bloom-compacte": _base_bloom_compacte(),
+    "pedagogique": BASE_CONNAISSANCES_PEDAGOGIQUES,
+    "pedagogique-compacte": BASE_CONNAISSANCES_PEDAGOGIQUES_COMPACTE,
+    # Variantes des anciens modules features_api*.py, conservées pour comparaison
+    "pedagogique-gemini-auto-eval": BASE_CONNAISSANCES_PEDAGOGIQUES_GEMINI_AUTO_EVAL,
+    "pedagogique-mistral": BASE_CONNAISSANCES_PEDAGOGIQUES_MISTRAL,
+    "pedagogique-mistral-v3": BASE_CONNAISSANCES_PEDAGOGIQUES_MISTRAL_V3,
+}
+
+
+@dataclass(frozen=True)
+class VersionPrompt:
+    etape: str
+    version: str
+    systeme: str
+    gabarit: str
+    base: Optional[str] = None
+    description: str = ""
+    # Schéma JSON imposé à la réponse (mode JSON du fournisseur), None pour une réponse texte
+    schema: Optional[Dict] = None
+    nb_tokens: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        # Partie fixe : message système, gabarit sans ses variables, base de connaissances et schéma
+        fixe = "".join(litteral for litteral, *_ in string.Formatter().parse(self.gabarit))
+        schema = json.dumps(self.schema, ensure_ascii=False) if self.schema else ""
+        object.__setattr__(self, "nb_tokens", estimer_tokens(self.systeme + fixe + self.base_connaissances + schema))
+
+    @property
+    def base_connaissances(self) -> str:
+        return BASES_CONNAISSANCES[self.base] if self.base else ""
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """Variables du gabarit, hors base de connaissances fournie par le registre."""
+        noms = (nom for _, nom, _, _ in string.Formatter().parse(self.gabarit) if nom)
+        return tuple(dict.fromkeys(nom for nom in noms if nom != "base_connaissances"))
+
+    @property
+    def valeurs_fixes(self) -> Dict[str, str]:
+        """Valeurs apportées par la version elle-même, à fusionner avec celles de l'appel."""
+        return {"base_connaissances": self.base_connaissances} if self.base else {}
+
+    def formater(self, **valeurs) -> str:
+        """Produit le texte du prompt (pour les appels sans ChatPromptTemplate)."""
+        return self.gabarit.format(**self.valeurs_fixes, **valeurs)
+
+
+REGISTRE: Dict[str, Dict[str, VersionPrompt]] = {}
+
+
+def enregistrer(version: VersionPrompt) -> VersionPrompt:
+    REGISTRE.setdefault(version.etape, {})[version.version] = version
+    return version
+
+
+for _etape, _gabarit, _systeme, _base in (
+    ("classification", PROMPT_CLASSIFICATION_BLOOM, SYSTEME_BLOOM, "bloom"),
+    ("evaluation", PROMPT_EVALUATION_OBJECTIFS, SYSTEME_PEDAGOGIE, "pedagogique"),
+    ("auto_eval_evaluation", PROMPT_AUTO_EVAL_EVALUATION, SYSTEME_PEDAGOGIE, "pedagogique"),
+    ("suggestions", PROMPT_AMELIORER_OBJECTIFS, SYSTEME_PEDAGOGIE, "pedagogique"),
+    ("auto_eval_suggestions", PROMPT_AUTO_EVAL_SUGGESTIONS, SYSTEME_PEDAGOGIE, "pedagogique"),
+):
+    enregistrer(VersionPrompt(_etape, "v1", _systeme, _gabarit, _base, "Base de connaissances complète"))
+    enregistrer(VersionPrompt(_etape, "v1-compacte", _systeme, _gabarit, f"{_base}-compacte", "Base de connaissances condensée"))
+
+for _etape, _gabarit, _schema in (
+    ("evaluation", PROMPT_EVALUATION_OBJECTIFS_JSON, SCHEMA_EVALUATION),
+    ("auto_eval_evaluation", PROMPT_AUTO_EVAL_EVALUATION_JSON, SCHEMA_EVALUATION),
+    ("suggestions", PROMPT_AMELIORER_OBJECTIFS_JSON, SCHEMA_SUGGESTIONS),
+):
+    enregistrer(VersionPrompt(_etape, "v2-json", SYSTEME_PEDAGOGIE, _gabarit, "pedagogique", "Réponse JSON, rapport mis en forme localement", _schema))
+    enregistrer(VersionPrompt(_etape, "v2-json-compacte", SYSTEME_PEDAGOGIE, _gabarit, "pedagogique-compacte", "Réponse JSON, base de connaissances condensée", _schema))
+
+enregistrer(VersionPrompt("synthese", "v1", SYSTEME_PEDAGOGIE, PROMPT_SYNTHESE))
+# Historiquement appelé sans message système
+enregistrer(VersionPrompt("recapitulatif", "v1", "", PROMPT_RECAPITULATIF))
+enregistrer(VersionPrompt(
+    "recapitulatif_champs_libres", "v1", SYSTEME_PEDAGOGIE, PROMPT_RECAPITULATIF_CHAMPS_LIBRES,
+    description="Champs rédigés seulement, comptes calculés localement", schema=SCHEMA_CHAMPS_LIBRES
+))
+
+
+def version_active(etape: str) -> str:
+    """Version configurée pour une étape (variables d'environnement), ou la version par défaut."""
+    versions = REGISTRE[etape]
+    defaut = VERSIONS_PAR_DEFAUT.get(etape, VERSION_PAR_DEFAUT)
+    demandee = os.getenv(f"PROMPT_VERSION_{etape.upper()}")
+    if demandee:
+        if demandee in versions:
+            return demandee
+        logger.warning(f"Version de prompt inconnue pour {etape} : {demandee}, utilisation de {defaut}")
+        return defaut
+    globale = os.getenv("PROMPT_VERSION")
+    return globale if globale in versions else defaut
+
+
+def obtenir_prompt(etape: str, version: Optional[str] = None) -> VersionPrompt:
+    """
+    Renvoie une version de prompt du registre.
+
+    Args:
+        etape (str): Étape du pipeline (classification, evaluation, suggestions, ...)
+        version (str): Version souhaitée ; par défaut, celle configurée pour l'étape
+
+    Raises:
+        ValueError: Si l'étape ou la version n'existe pas
+    """
+    if etape not in REGISTRE:
+        raise ValueError(f"Étape de prompt inconnue : {etape}")
+    version = version or version_active(etape)
+    if version not in REGISTRE[etape]:
+        raise ValueError(f"Version {version} inconnue pour {etape} (disponibles : {', '.join(REGISTRE[etape])})")
+    return REGISTRE[etape][version]
+
+
+def comparer_versions(etape: Optional[str] = None) -> List[Dict]:
+    """Tableau des versions enregistrées et du nombre de tokens de leur partie fixe."""
+    return [
+        {"etape": v.etape, "version": v.version, "nb_tokens": v.nb_tokens, "description": v.description}
+        for nom, versions in REGISTRE.items() if etape in (None, nom)
+        for v in versions.values()
+    ]
@@ -0,0 +1,288 @@
+"""
+Rendu des rapports PDF à la demande, mis en cache par contenu.
+
+Un rapport est identifié par l'empreinte SHA-256 de ses données (informations
+du cours, rapport, récapitulatif) et de la date imprimée en page de garde : un
+même rapport n'est rendu qu'une fois par processus, quelle que soit la
+session qui le demande. Le rendu peut être lancé par anticipation en arrière-
+plan dès la fin de l'analyse ; une demande arrivant pendant ce rendu attend
+son résultat au lieu d'en lancer un second.
+
+Le rendu fpdf2, en Python pur, est confié à un petit pool de processus
+(ServiceRenduPDF) : il ne retient plus le GIL du processus Streamlit et se
+répartit sur plusieurs cœurs. Les processus chargent les polices à leur
+démarrage ; la file d'attente est bornée.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from generation_pdf import DonneesRapport, rendre_rapport
+from polices_pdf import precharger_polices
+
+logger = logging.getLogger(__name__)
+
+# Rapports conservés (environ 50 à 150 ko chacun)
+MAX_RAPPORTS = 64
+
+# Processus de rendu et rendus en attente au-delà de ceux en cours
+NB_PROCESSUS = int(os.getenv("PDF_PROCESSUS", min(2, os.cpu_count() or 1)))
+TAILLE_FILE = int(os.getenv("PDF_FILE_MAX", 8))
+
+# Attente maximale d'une place dans la file pour un téléchargement (secondes)
+DELAI_FILE = 60
+
+
+class FileRenduPleine(RuntimeError):
+    """La file de rendu est pleine."""
+
+
+def _initialiser_processus():
+    # Processus de rendu : polices chargées une fois, journalisation laissée au processus principal
+    logging.getLogger("fontTools").setLevel(logging.WARNING)
+    precharger_polices()
+
+
+def _rendre_dans_processus(donnees: Dict) -> Tuple[bytes, float]:
+    debut = time.perf_counter()
+    octets = rendre_rapport(DonneesRapport(**donnees))
+    return octets, time.perf_counter() - debut
+
+
+class ServiceRenduPDF:
+    """
+    Pool de processus de rendu PDF.
+
+    Les travaux sont les arguments nommés de generer_pdf (données sérialisables) ;
+    le futur renvoyé donne le contenu PDF en bytes.
+    """
+
+    def __init__(self, nb_processus: int = NB_PROCESSUS, taille_file: int = TAILLE_FILE):
+        self.nb_processus = nb_processus
+        self._places = threading.BoundedSemaphore(nb_processus + taille_file)
+        self._verrou = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._en_cours = 0
+        self._rendus = 0
+        self._echecs = 0
+        self._duree_totale = 0.0
+        self._duree_max = 0.0
+        self._attente_totale = 0.0
+
+    def _executeur(self) -> ProcessPoolExecutor:
+        with self._verrou:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.nb_processus,
+                    # spawn : pas de fork d'un processus Streamlit et de ses threads
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialiser_processus,
+                )
+                logger.info(f"Pool de rendu PDF démarré ({self.nb_processus} processus)")
+            return self._pool
+
+    def _relancer(self, pool: ProcessPoolExecutor):
+        with self._verrou:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Pool de rendu PDF interrompu, il sera relancé à la prochaine demande")
+
+    def soumettre(self, donnees: Dict, attente: Optional[float] = None) -> Future:
+        """
+        Soumet un rendu au pool.
+
+        Args:
+            donnees (dict): Arguments nommés de generer_pdf
+            attente (float): Attente maximale d'une place dans la file (None : sans limite, 0 : aucune)
+
+        Returns:
+            Future: Futur du contenu PDF (bytes)
+
+        Raises:
+            FileRenduPleine: Si aucune place ne s'est libérée à temps
+        """
+        if not self._places.acquire(timeout=attente):
+            raise FileRenduPleine(f"File de rendu PDF pleine ({self.metriques()['file']} rendu(s) en attente)")
+        resultat = Future()
+        soumission = time.perf_counter()
+        pool = self._executeur()
+        try:
+            futur = pool.submit(_rendre_dans_processus, donnees)
+        except BrokenProcessPool:
+            self._places.release()
+            self._relancer(pool)
+            raise
+        with self._verrou:
+            self._en_cours += 1
+
+        def terminer(futur: Future):
+            self._places.release()
+            try:
+                octets, duree = futur.result()
+            except Exception as e:
+                with self._verrou:
+                    self._en_cours -= 1
+                    self._echecs += 1
+                if isinstance(e, BrokenProcessPool):
+                    self._relancer(pool)
+                resultat.set_exception(e)
+                return
+            with self._verrou:
+                self._en_cours -= 1
+                self._rendus += 1
+                self._duree_totale += duree
+                self._duree_max = max(self._duree_max, duree)
+                self._attente_totale += time.perf_counter() - soumission - duree
+            resultat.set_result(octets)
+
+        futur.add_done_callback(terminer)
+        return resultat
+
+    def demarrer(self):
+        """Démarre les processus de rendu sans attendre un premier rapport (polices chargées à leur démarrage)."""
+        pool = self._executeur()
+        # Le pool ne crée ses processus qu'à la soumission des travaux
+        for _ in range(self.nb_processus):
+            pool.submit(os.getpid)
+
+    def metriques(self) -> Dict:
+        """
+        Returns:
+            dict: Rendus en cours et en file, nombre de rendus et d'échecs, durées moyennes et maximale (secondes)
+        """
+        with self._verrou:
+            return {
+                "en_cours": min(self._en_cours, self.nb_processus),
+                "file": max(0, self._en_cours - self.nb_processus),
+                "rendus": self._rendus,
+                "echecs": self._echecs,
+                "duree_moyenne": self._duree_totale / self._rendus if self._rendus else 0.0,
+                "duree_max": self._duree_max,
+                "attente_moyenne": self._attente_totale / self._rendus if self._rendus else 0.0,
+            }
+
+    def arreter(self):
+        with self._verrou:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+_service = ServiceRenduPDF()
+
+_rendus: "OrderedDict[str, Future]" = OrderedDict()
+_verrou = threading.Lock()
+
+
+def cle_rapport(donnees: Dict) -> str:
+    """
+    Empreinte du contenu d'un rapport.
+
+    Args:
+        donnees (dict): Arguments nommés de generer_pdf
+
+    Returns:
+        str: Empreinte hexadécimale, la date du jour incluse
+    """
+    contenu = json.dumps([date.today().isoformat(), donnees], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(contenu.encode("utf-8")).hexdigest()
+
+
+def _terminer(cle: str, futur: Future):
+    # Un rendu en échec n'est pas conservé : la demande suivante le relance
+    if futur.exception() is not None:
+        logger.warning(f"Échec du rendu du rapport PDF {cle[:12]} : {futur.exception()}")
+        with _verrou:
+            if _rendus.get(cle) is futur:
+                del _rendus[cle]
+        return
+    metriques = _service.metriques()
+    logger.info(
+        f"Rapport PDF {cle[:12]} rendu ({len(futur.result()) // 1000} ko) ; "
+        f"durée moyenne {metriques['duree_moyenne']:.2f} s, file {metriques['file']}"
+    )
+
+
+def lancer_rendu(donnees: Dict, attente: Optional[float] = 0) -> Optional[Future]:
+    """
+    Lance le rendu d'un rapport en arrière-plan, sauf s'il est déjà rendu ou en cours.
+
+    Args:
+        donnees (dict): Arguments nommés de generer_pdf
+        attente (float): Attente maximale d'une place dans la file ; par défaut, aucune
+
+    Returns:
+        Future | None: Futur du contenu PDF (bytes), None si la file est pleine
+    """
+    cle = cle_rapport(donnees)
+    with _verrou:
+        futur = _rendus.get(cle)
+        if futur is not None:
+            _rendus.move_to_end(cle)
+            return futur
+        # Clé réservée avant la soumission : une demande concurrente attend ce rendu au lieu d'en soumettre un second
+        futur = Future()
+        _rendus[cle] = futur
+        while len(_rendus) > MAX_RAPPORTS:
+            _rendus.popitem(last=False)
+    try:
+        rendu = _service.soumettre(donnees, attente=attente)
+    except Exception as e:
+        with _verrou:
+            if _rendus.get(cle) is futur:
+                del _rendus[cle]
+        futur.set_exception(e)
+        if isinstance(e, FileRenduPleine):
+            logger.info(f"Rendu du rapport PDF {cle[:12]} différé : {e}")
+            return None
+        raise
+    rendu.add_done_callback(lambda f: _transmettre(f, futur))
+    futur.add_done_callback(lambda f: _terminer(cle, f))
+    return futur
+
+
+def _transmettre(source: Future, cible: Future):
+    if source.exception() is not None:
+        cible.set_exception(source.exception())
+    else:
+        cible.set_result(source.result())
+
+
+def obtenir_pdf(donnees: Dict) -> bytes:
+    """
+    Contenu PDF d'un rapport, rendu si nécessaire.
+
+    Args:
+        donnees (dict): Arguments nommés de generer_pdf
+
+    Returns:
+        bytes: Contenu du PDF
+
+    Raises:
+        FileRenduPleine: Si la file est restée pleine pendant DELAI_FILE secondes
+    """
+    futur = lancer_rendu(donnees, attente=DELAI_FILE)
+    if futur is None:
+        raise FileRenduPleine("File de rendu PDF pleine, réessayez dans quelques instants")
+    return futur.result()
+
+
+def demarrer_rendu():
+    """Démarre le pool de rendu du processus (voir ServiceRenduPDF.demarrer)."""
+    _service.demarrer()
+
+
+def metriques_rendu() -> Dict:
+    """Métriques du service de rendu (voir ServiceRenduPDF.metriques)."""
+    return _service.metriques()
@@ -0,0 +1,216 @@
+"""
+Schéma typé du récapitulatif et validation champ par champ.
+
+Le récapitulatif produit par un LLM n'est plus accepté ou rejeté en bloc :
+chaque champ est validé et converti séparément. Les champs valides sont
+conservés ; les autres sont complétés par des données calculées localement
+(voir recapitulatif_local.py) ou redemandés au modèle, seuls.
+"""
+
+import logging
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from bloom_lexique import NIVEAUX_BLOOM, normaliser, sans_accents
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ObjectifConforme:
+    num: Union[int, str]
+    objectif: str
+    niveau_bloom: str = ""
+
+
+@dataclass(slots=True)
+class ObjectifAAmeliorer:
+    num: Union[int, str]
+    objectif: str
+    probleme_resume: str = ""
+    suggestion: str = ""
+
+
+@dataclass(slots=True)
+class Recapitulatif:
+    points_forts: List[str] = field(default_factory=list)
+    axes_amelioration: List[str] = field(default_factory=list)
+    objectifs_total: int = 0
+    objectifs_conformes: List[ObjectifConforme] = field(default_factory=list)
+    objectifs_a_ameliorer: List[ObjectifAAmeliorer] = field(default_factory=list)
+    recommandations: List[str] = field(default_factory=list)
+    niveaux_bloom_utilises: List[str] = field(default_factory=list)
+
+    def en_dict(self) -> Dict:
+        """Structure de PROMPT_RECAPITULATIF, attendue par app.py et build_tables."""
+        return {
+            "points_forts": list(self.points_forts),
+            "axes_amelioration": list(self.axes_amelioration),
+            "objectifs_total": self.objectifs_total,
+            "objectifs_conformes": {
+                "nbre_total": len(self.objectifs_conformes),
+                "liste": [
+                    {"num": objectif.num, "objectif": objectif.objectif, "niveau_bloom": objectif.niveau_bloom}
+                    for objectif in self.objectifs_conformes
+                ],
+            },
+            "objectifs_a_ameliorer": {
+                "nbre_total": len(self.objectifs_a_ameliorer),
+                "liste": [
+                    {
+                        "num": objectif.num,
+                        "objectif": objectif.objectif,
+                        "probleme_resume": objectif.probleme_resume,
+                        "suggestion": objectif.suggestion,
+                    }
+                    for objectif in self.objectifs_a_ameliorer
+                ],
+            },
+            "recommandations": list(self.recommandations),
+            "niveaux_bloom_utilises": list(self.niveaux_bloom_utilises),
+        }
+
+
+CHAMPS_RECAPITULATIF = tuple(champ.name for champ in fields(Recapitulatif))
+
+
+class _Invalide(Exception):
+    pass
+
+
+def _textes(valeur: Any) -> List[str]:
+    if isinstance(valeur, str):
+        valeur = [valeur]
+    if not isinstance(valeur, (list, tuple)):
+        raise _Invalide(f"liste attendue, {type(valeur).__name__} reçu")
+    return [str(element).strip() for element in valeur if isinstance(element, (str, int, float)) and str(element).strip()]
+
+
+def _entier(valeur: Any) -> int:
+    if isinstance(valeur, bool):
+        raise _Invalide("entier attendu, booléen reçu")
+    try:
+        return int(valeur)
+    except (TypeError, ValueError):
+        raise _Invalide(f"entier attendu, {valeur!r} reçu")
+
+
+def _num(valeur: Any) -> Union[int, str]:
+    texte = str(valeur).strip()
+    return int(texte) if texte.isdigit() else texte
+
+
+def _liste_objectifs(valeur: Any) -> List[Dict]:
+    # {"nbre_total": n, "liste": [...]} ou directement la liste ; nbre_total est recalculé
+    if isinstance(valeur, dict):
+        valeur = valeur.get("liste")
+    if not isinstance(valeur, (list, tuple)):
+        raise _Invalide("liste d'objectifs attendue")
+    entrees = [entree for entree in valeur if isinstance(entree, dict) and str(entree.get("objectif", "")).strip()]
+    if len(entrees) < len(valeur):
+        logger.warning(f"{len(valeur) - len(entrees)} entrée(s) d'objectif invalide(s) ignorée(s)")
+    return entrees
+
+
+def _conformes(valeur: Any) -> List[ObjectifConforme]:
+    return [
+        ObjectifConforme(_num(entree.get("num", "")), str(entree["objectif"]).strip(), _niveau(entree.get("niveau_bloom")) or "")
+        for entree in _liste_objectifs(valeur)
+    ]
+
+
+def _a_ameliorer(valeur: Any) -> List[ObjectifAAmeliorer]:
+    return [
+        ObjectifAAmeliorer(
+            _num(entree.get("num", "")),
+            str(entree["objectif"]).strip(),
+            str(entree.get("probleme_resume") or "").strip(),
+            str(entree.get("suggestion") or "").strip(),
+        )
+        for entree in _liste_objectifs(valeur)
+    ]
+
+
+def _niveau(valeur: Any) -> Optional[str]:
+    if not isinstance(valeur, str):
+        return None
+    cle = sans_accents(normaliser(valeur)).strip(" .*")
+    for niveau in NIVEAUX_BLOOM:
+        if cle.startswith(sans_accents(normaliser(niveau))):
+            return niveau
+    return None
+
+
+def _niveaux(valeur: Any) -> List[str]:
+    reconnus = {_niveau(element) for element in _textes(valeur)} - {None}
+    return [niveau for niveau in NIVEAUX_BLOOM if niveau in reconnus]
+
+
+_CONVERSIONS = {
+    "points_forts": _textes,
+    "axes_amelioration": _textes,
+    "objectifs_total": _entier,
+    "objectifs_conformes": _conformes,
+    "objectifs_a_ameliorer": _a_ameliorer,
+    "recommandations": _textes,
+    "niveaux_bloom_utilises": _niveaux,
+}
+
+
+def valider_recapitulatif(donnees: Any, champs: Iterable[str] = CHAMPS_RECAPITULATIF) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Valide et convertit chaque champ d'un récapitulatif produit par le LLM.
+
+    Args:
+        donnees: Récapitulatif brut (dict attendu, toute autre valeur est traitée comme vide)
+        champs: Champs à valider
+
+    Returns:
+        tuple: (champs valides convertis, noms des champs absents ou invalides)
+    """
+    donnees = donnees if isinstance(donnees, dict) else {}
+    valides, manquants = {}, []
+    for champ in champs:
+        if champ not in donnees or donnees[champ] is None:
+            manquants.append(champ)
+            continue
+        try:
+            valides[champ] = _CONVERSIONS[champ](donnees[champ])
+        except _Invalide as e:
+            logger.warning(f"Champ {champ} du récapitulatif invalide : {e}")
+            manquants.append(champ)
+    return valides, manquants
+
+
+def completer_recapitulatif(donnees: Any, local: Optional[Dict] = None) -> Dict:
+    """
+    Garde les champs valides d'un récapitulatif et complète les autres.
+
+    Args:
+        donnees: Récapitulatif brut produit par le LLM
+        local (dict): Récapitulatif calculé localement, source des champs manquants
+
+    Returns:
+        dict: Récapitulatif complet au format de PROMPT_RECAPITULATIF
+    """
+    valides, manquants = valider_recapitulatif(donnees)
+    if manquants and local:
+        complements, _ = valider_recapitulatif(local, manquants)
+        valides.update(complements)
+        manquants = [champ for champ in manquants if champ not in complements]
+    if "objectifs_total" in manquants:
+        valides["objectifs_total"] = len(valides.get("objectifs_conformes", [])) + len(valides.get("objectifs_a_ameliorer", []))
+        manquants.remove("objectifs_total")
+    if manquants:
+        logger.warning(f"Champ(s) du récapitulatif laissé(s) vide(s) : {', '.join(manquants)}")
+    return Recapitulatif(**valides).en_dict()
+
+
+def schema_partiel(schema: Dict, champs: Iterable[str]) -> Dict:
+    """Restreint un schéma JSON d'objet aux champs demandés (relance ciblée)."""
+    champs = list(champs)
+    return {
+        **schema,
+        "properties": {champ: schema["properties"][champ] for champ in champs},
+        "required": [champ for champ in schema.get("required", []) if champ in champs],
+    }
@@ -0,0 +1,186 @@
+"""
+Pré-évaluation locale et déterministe des critères SMART mécaniques.
+
+Trois critères de PROMPT_EVALUATION_OBJECTIFS peuvent être vérifiés sans LLM :
+- Temporellement défini : présence d'un préambule temporel ;
+- Mesurable : nombre de verbes d'action de l'objectif ;
+- Approprié : un objectif spécifique ne dépasse pas le niveau de Bloom de l'objectif général.
+
+Ces signaux sont transmis au modèle comme des faits, puis confrontés aux notes
+qu'il attribue afin de signaler les contradictions.
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+from bloom_lexique import INDEX_VERBES, NIVEAUX_BLOOM, ORDRE_NIVEAUX
+from pretraitement_obj_spe import ID_OBJECTIF_GENERAL, Objectif
+
+logger = logging.getLogger(__name__)
+
+_RE_BLOC_CLASSIFICATION = re.compile(
+    r"Objectif\s+\[?(?:(?P<general>général|OG)|(?:spécifique\s+|OS)?(?P<num>\d+))\]?"
+    r"[^\n]*\n(?:[^\n]*\n){0,3}?[^\n]*Niveau(?: de Bloom)?\s*:?\s*(?P<niveau>[^\n]+)",
+    flags=re.IGNORECASE
+)
+_RE_NOTES = re.compile(
+    r"Objectif\s+\[?(?:(?P<general>général|OG)|(?:spécifique\s+|OS)?(?P<num>\d+))\]?\s*:?\s*"
+    r"Spécifique\s*\((?P<specifique>\d)/5\),\s*"
+    r"Mesurable\s*\((?P<mesurable>\d)/5\),\s*"
+    r"Approprié(?:\s*\(Cohérent\))?\s*\((?P<approprie>\d)/5\),\s*"
+    r"Réaliste\s*\((?P<realiste>\d)/5\),\s*"
+    r"Temporellement défini\s*\((?P<temporel>\d)/5\)",
+    flags=re.IGNORECASE
+)
+
+
+@dataclass
+class SignauxSmart:
+    id: str
+    objectif: str
+    temporel: bool
+    verbes: List[str] = field(default_factory=list)
+    niveau: Optional[str] = None
+    depasse_general: bool = False
+
+    @property
+    def libelle(self) -> str:
+        return f"Objectif {self.id}"
+
+
+def _niveau_reconnu(texte: str) -> Optional[str]:
+    texte = texte.replace("*", "").strip().lower()
+    for niveau in NIVEAUX_BLOOM:
+        if texte.startswith(niveau.lower()):
+            return niveau
+    return None
+
+
+def _identifiant(match) -> str:
+    return ID_OBJECTIF_GENERAL if match.group("general") else f"OS{int(match.group('num'))}"
+
+
+def extraire_niveaux_classification(bloom_classification: str) -> Dict[str, str]:
+    """
+    Extrait le niveau de Bloom retenu pour chaque objectif dans la sortie de classify_bloom.
+
+    Returns:
+        dict: {identifiant de l'objectif (« OG », « OS1 », …): niveau}
+    """
+    niveaux = {}
+    for match in _RE_BLOC_CLASSIFICATION.finditer(bloom_classification.replace("*", "")):
+        niveau = _niveau_reconnu(match.group("niveau"))
+        if niveau:
+            niveaux.setdefault(_identifiant(match), niveau)
+    return niveaux
+
+
+def extraire_notes(evaluation: str) -> Dict[str, Dict[str, int]]:
+    """
+    Extrait le récapitulatif des notes SMART de chaque objectif d'une évaluation.
+
+    Returns:
+        dict: {identifiant (« OG », « OS1 », …): {"specifique": n, "mesurable": n, ...}}
+    """
+    notes = {}
+    for match in _RE_NOTES.finditer(evaluation.replace("*", "")):
+        notes[_identifiant(match)] = {
+            critere: int(match.group(critere))
+            for critere in ("specifique", "mesurable", "approprie", "realiste", "temporel")
+        }
+    return notes
+
+
+def _signaux_objectif(objectif: Objectif, niveau: Optional[str]) -> SignauxSmart:
+    # Les préambules et verbes ont déjà été relevés lors de la construction de l'objectif
+    verbes = list(objectif.verbes)
+    if niveau is None and len(verbes) == 1 and len(INDEX_VERBES[verbes[0]]) == 1:
+        niveau = INDEX_VERBES[verbes[0]][0]
+    return SignauxSmart(
+        id=objectif.id,
+        objectif=objectif.texte,
+        temporel=objectif.span_temps is not None,
+        verbes=verbes,
+        niveau=niveau
+    )
+
+
+def calculer_signaux(objectif_general: Objectif, objectifs_specifiques: List[Objectif], bloom_classification: str = "") -> List[SignauxSmart]:
+    """
+    Calcule les signaux SMART mécaniques de chaque objectif.
+
+    Args:
+        objectif_general (Objectif): Objectif général du cours
+        objectifs_specifiques (list[Objectif]): Objectifs spécifiques nettoyés
+        bloom_classification (str): Sortie de l'étape de classification, utilisée pour les niveaux
+
+    Returns:
+        list[SignauxSmart]: L'objectif général en premier, puis les objectifs spécifiques
+    """
+    niveaux = extraire_niveaux_classification(bloom_classification) if bloom_classification else {}
+    general = _signaux_objectif(objectif_general, niveaux.get(objectif_general.id))
+    signaux = [general]
+    for objectif in objectifs_specifiques:
+        signal = _signaux_objectif(objectif, niveaux.get(objectif.id))
+        if signal.niveau and general.niveau:
+            signal.depasse_general = ORDRE_NIVEAUX[signal.niveau] > ORDRE_NIVEAUX[general.niveau]
+        signaux.append(signal)
+    return signaux
+
+
+def formater_faits(signaux: List[SignauxSmart]) -> str:
+    """Met en forme les signaux comme faits à fournir au modèle d'évaluation."""
+    lignes = []
+    for signal in signaux:
+        faits = ["préambule temporel présent" if signal.temporel else "aucun préambule temporel"]
+        if signal.verbes:
+            faits.append(f"{len(signal.verbes)} verbe(s) d'action du lexique de Bloom ({', '.join(signal.verbes)})")
+        else:
+            faits.append("aucun verbe d'action du lexique de Bloom")
+        if signal.niveau:
+            faits.append(f"niveau de Bloom {signal.niveau}")
+        if signal.depasse_general:
+            faits.append("niveau supérieur à celui de l'objectif général")
+        lignes.append(f"- {signal.libelle} : {' ; '.join(faits)}.")
+    return "\n".join(lignes)
+
+
+def verifier_notes(evaluation: str, signaux: List[SignauxSmart]) -> List[str]:
+    """
+    Confronte les notes attribuées par le LLM aux signaux locaux.
+
+    Returns:
+        list[str]: Description de chaque contradiction détectée
+    """
+    notes = extraire_notes(evaluation)
+    incoherences = []
+    for signal in signaux:
+        notes_objectif = notes.get(signal.id)
+        if not notes_objectif:
+            continue
+        if not signal.temporel and notes_objectif["temporel"] >= 4:
+            incoherences.append(
+                f"{signal.libelle} : Temporellement défini noté {notes_objectif['temporel']}/5 alors qu'aucun préambule temporel n'est présent."
+            )
+        if signal.id != ID_OBJECTIF_GENERAL and len(signal.verbes) > 1 and notes_objectif["mesurable"] == 5:
+            incoherences.append(
+                f"{signal.libelle} : Mesurable noté 5/5 alors que l'objectif contient {len(signal.verbes)} verbes d'action ({', '.join(signal.verbes)})."
+            )
+        if signal.depasse_general and notes_objectif["approprie"] == 5:
+            incoherences.append(
+                f"{signal.libelle} : Approprié noté 5/5 alors que son niveau ({signal.niveau}) dépasse celui de l'objectif général."
+            )
+    if incoherences:
+        logger.warning(f"{len(incoherences)} incohérence(s) entre les notes du LLM et les signaux locaux")
+    return incoherences
+
+
+def signaux_en_dict(signaux: List[SignauxSmart]) -> List[Dict]:
+    """Convertit les signaux en dictionnaires (sérialisables dans l'état du graphe)."""
+    return [asdict(signal) for signal in signaux]
+
+
+def signaux_depuis_dict(donnees: List[Dict]) -> List[SignauxSmart]:
+    return [SignauxSmart(**signal) for signal in donnees]
@@ -0,0 +1,247 @@
+"""
+Analyses exécutées en arrière-plan, hors du script Streamlit.
+
+Le formulaire soumet l'analyse au gestionnaire et ne garde que l'identifiant
+de la tâche dans st.session_state. Un fragment de la page interroge ensuite la
+tâche pour afficher les étapes terminées, puis récupère son résultat : les
+réexécutions du script (clic sur un bouton de téléchargement, changement
+d'onglet) ne relancent jamais le pipeline.
+
+La tâche enchaîne tout ce qui demande le LLM : pipeline, récapitulatif de
+secours si le pipeline n'en fournit pas, puis archivage de l'analyse (voir
+archive_analyses.py).
+
+Le module est importé par app.py avant l'affichage du formulaire : le pipeline
+(LangGraph, LangChain, fpdf2) n'est importé qu'à la première analyse, ou par
+le préchauffage (voir prechauffage.py).
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from admission import ControleurAdmission
+
+logger = logging.getLogger(__name__)
+
+# Analyses exécutées simultanément ; les suivantes attendent leur tour (voir admission.py)
+NB_ANALYSES = int(os.getenv("ANALYSES_SIMULTANEES", 4))
+
+# Tâches terminées conservées (leur résultat reste aussi dans la session qui l'a récupéré)
+MAX_TACHES = 256
+
+EN_ATTENTE, EN_COURS, TERMINEE, ECHEC = "en attente", "en cours", "terminée", "échec"
+
+
+@dataclass
+class ResultatAnalyse:
+    """Résultat d'une analyse : saisie du formulaire, sortie du pipeline et récapitulatif."""
+    saisie: Dict[str, str]
+    rapport: Dict
+    recap_dict: Dict
+
+    def donnees_rapport(self) -> Dict:
+        """Arguments nommés de generer_pdf (et de DonneesRapport)."""
+        return dict(**self.saisie, rapport=self.rapport, recap_dict=self.recap_dict)
+
+
+@dataclass
+class TacheAnalyse:
+    id: str
+    saisie: Dict[str, str]
+    statut: str = EN_ATTENTE
+    etapes: List[str] = field(default_factory=list)
+    resultat: Optional[ResultatAnalyse] = None
+    erreur: Optional[str] = None
+    soumission: float = field(default_factory=time.time)
+    fin: Optional[float] = None
+
+    @property
+    def terminee(self) -> bool:
+        return self.statut in (TERMINEE, ECHEC)
+
+
+def _construire_recapitulatif(rapport: Dict, objectif_general: str, objectifs_specifiques) -> Dict:
+    from features3 import recapitulatif, recapitulatif_champs
+    from generation_pdf import llm_output_to_dict
+    from pretraitement_obj_spe import ID_OBJECTIF_GENERAL, creer_objectif
+    from recapitulatif_local import CHAMPS_LIBRES, recapitulatif_depuis_rapport
+    from schema_recapitulatif import valider_recapitulatif, completer_recapitulatif
+
+    # Récapitulatif : déjà construit localement par le pipeline dans le cas général
+    recap_dict = rapport.get("recapitulatif")
+    if recap_dict is not None:
+        logger.info("Récapitulatif construit par le pipeline.")
+        return completer_recapitulatif(recap_dict)
+
+    recap_brut = {}
+    try:
+        recap_brut = llm_output_to_dict(recapitulatif(rapport['details']))
+        logger.info("Récapitulatif fait et converti !")
+    except Exception as e:
+        logger.warning(f"Le récapitulatif a échoué : {str(e)}")
+
+    # Champs valides conservés ; champs rédigés manquants redemandés seuls, le reste calculé à partir du rapport
+    _, manquants = valider_recapitulatif(recap_brut, CHAMPS_LIBRES)
+    if manquants:
+        try:
+            recap_brut = {**(recap_brut if isinstance(recap_brut, dict) else {}), **recapitulatif_champs(rapport['aperçu'], manquants)}
+        except Exception as e:
+            logger.warning(f"La relance des champs {', '.join(manquants)} a échoué : {str(e)}")
+    objectifs = [creer_objectif(ID_OBJECTIF_GENERAL, objectif_general)] + objectifs_specifiques
+    return completer_recapitulatif(recap_brut, recapitulatif_depuis_rapport(rapport['details'], objectifs))
+
+
+def executer_analyse(saisie: Dict[str, str], progression=None) -> ResultatAnalyse:
+    """
+    Analyse complète d'une saisie du formulaire : pipeline, récapitulatif et archivage.
+
+    Args:
+        saisie (dict): nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut
+        progression: Appelée avec le libellé de chaque étape du pipeline terminée
+
+    Returns:
+        ResultatAnalyse: Rapport et récapitulatif
+
+    Raises:
+        RuntimeError: Si le pipeline n'a pas produit de rapport
+    """
+    # Imports lourds différés (voir l'en-tête du module)
+    from archive_analyses import archiver_analyse
+    from features3 import assistant_pedagogique
+    from pretraitement_obj_spe import nettoyer_objectifs_specifiques
+
+    # Nettoyage et transformation des objectifs spécifiques en liste
+    objectifs_specifiques = nettoyer_objectifs_specifiques(
+        saisie["objectif_general"], saisie["objectifs_specifiques_brut"], structures=True
+    )
+    rapport = assistant_pedagogique(saisie["nom_cours"], saisie["niveau"], saisie["public"], saisie["objectif_general"],
+                                    objectifs_specifiques, progression=progression)
+    if rapport is None:
+        raise RuntimeError("L’analyse a été interrompue avant son terme.")
+    if rapport.get("error"):
+        raise RuntimeError(rapport.get("message", "Aucun résultat produit"))
+
+    # Trace de l'analyse (sorties des étapes, mesures des appels) : archivée, pas affichée ni rendue
+    trace = rapport.pop("trace", None)
+    recap_dict = _construire_recapitulatif(rapport, saisie["objectif_general"], objectifs_specifiques)
+
+    # Archive de l'analyse : le rapport pourra être rendu de nouveau sans nouvel appel au LLM
+    try:
+        archiver_analyse(saisie, rapport, recap_dict, trace)
+    except Exception as e:
+        logger.warning(f"L'analyse n'a pas pu être archivée : {str(e)}")
+    return ResultatAnalyse(saisie, rapport, recap_dict)
+
+
+class GestionnaireAnalyses:
+    """
+    Tâches d'analyse du processus, exécutées par un pool de threads.
+
+    Le pool a autant de threads que d'analyses simultanées admises ; chaque
+    soumission y ajoute un travail qui exécute l'analyse admise par le
+    contrôleur (file équitable par utilisateur), pas forcément celle soumise.
+    Les tâches sont identifiées par une chaîne aléatoire ; seules les
+    MAX_TACHES plus récentes sont conservées une fois terminées.
+    """
+
+    def __init__(self, nb_analyses: int = NB_ANALYSES, max_taches: int = MAX_TACHES,
+                 analyse: Callable[..., ResultatAnalyse] = executer_analyse):
+        self.max_taches = max_taches
+        self.controleur = ControleurAdmission(nb_analyses)
+        self._analyse = analyse
+        self._executeur = ThreadPoolExecutor(max_workers=nb_analyses, thread_name_prefix="analyse")
+        self._taches: "OrderedDict[str, TacheAnalyse]" = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def soumettre(self, saisie: Dict[str, str], utilisateur: str = "") -> str:
+        """
+        Soumet une analyse.
+
+        Args:
+            saisie (dict): nom_cours, niveau, public, objectif_general, objectifs_specifiques_brut
+            utilisateur (str): Identifiant de l'utilisateur, pour la file d'attente équitable
+
+        Returns:
+            str: Identifiant de la tâche
+        """
+        tache = TacheAnalyse(uuid.uuid4().hex, dict(saisie))
+        with self._verrou:
+            self._taches[tache.id] = tache
+            self._oublier_anciennes()
+        self.controleur.ajouter(utilisateur, tache.id)
+        self._executeur.submit(self._executer_suivante)
+        logger.info(f"Analyse {tache.id[:8]} soumise : {saisie.get('nom_cours', '')} ({self.controleur.metriques()['en_attente']} en attente)")
+        return tache.id
+
+    def _oublier_anciennes(self):
+        # Tâches terminées les plus anciennes retirées au-delà de max_taches ; les tâches en cours restent
+        excedent = len(self._taches) - self.max_taches
+        for identifiant in [identifiant for identifiant, tache in self._taches.items() if tache.terminee][:max(0, excedent)]:
+            del self._taches[identifiant]
+
+    def _executer_suivante(self):
+        identifiant = self.controleur.suivante()
+        with self._verrou:
+            tache = self._taches[identifiant]
+        tache.statut = EN_COURS
+        debut = time.perf_counter()
+        duree = None
+        try:
+            tache.resultat = self._analyse(tache.saisie, progression=tache.etapes.append)
+            tache.statut = TERMINEE
+            duree = time.perf_counter() - debut
+            logger.info(f"Analyse {tache.id[:8]} terminée en {duree:.1f} s")
+        except Exception as e:
+            tache.erreur = str(e)
+            tache.statut = ECHEC
+            logger.warning(f"Une erreur est survenue pendant l'analyse {tache.id[:8]} : {str(e)}")
+        finally:
+            tache.fin = time.time()
+            self.controleur.terminer(duree)
+
+    def obtenir(self, identifiant: str) -> Optional[TacheAnalyse]:
+        """
+        Args:
+            identifiant (str): Identifiant renvoyé par soumettre
+
+        Returns:
+            TacheAnalyse | None: Tâche, None si elle est inconnue ou déjà oubliée
+        """
+        with self._verrou:
+            return self._taches.get(identifiant)
+
+
+    def file_attente(self, identifiant: str) -> Optional[Tuple[int, float]]:
+        """
+        Args:
+            identifiant (str): Identifiant renvoyé par soumettre
+
+        Returns:
+            tuple | None: (position, attente estimée en secondes), None si l'analyse n'est plus en attente
+        """
+        return self.controleur.etat(identifiant)
+
+
+_gestionnaire = GestionnaireAnalyses()
+
+
+def soumettre_analyse(saisie: Dict[str, str], utilisateur: str = "") -> str:
+    """Soumet une analyse au gestionnaire du processus (voir GestionnaireAnalyses.soumettre)."""
+    return _gestionnaire.soumettre(saisie, utilisateur)
+
+
+def file_attente(identifiant: str) -> Optional[Tuple[int, float]]:
+    """Position et attente estimée d'une analyse du processus (voir GestionnaireAnalyses.file_attente)."""
+    return _gestionnaire.file_attente(identifiant)
+
+
+def obtenir_tache(identifiant: str) -> Optional[TacheAnalyse]:
+    """Tâche d'analyse du processus (voir GestionnaireAnalyses.obtenir)."""
+    return _gestionnaire.obtenir(identifiant)